@@ -18,7 +18,7 @@ from utils.cache_helper import (
     SafeCache,
     invalidate_on_user_action
 )
-from services.email_service import send_email
+from services.email_service import send_emails_bulk
 
 # Helper functions for calculating specific user groups
 def get_users_with_pending_nominations():
@@ -605,25 +605,24 @@ if st.button("Send Notification", type="primary", disabled=recipient_count == 0)
                 "Please update the subject/body placeholders and try again."
             )
         else:
-            successes = 0
-            failures = []
-            initiator_id = st.session_state["user_data"]["user_type_id"]
-
-            for recipient, subject, body_text, html_body in formatted_messages:
-                queued = send_email(
-                    to_email=recipient["email"],
-                    subject=subject,
-                    html_body=html_body,
-                    text_body=body_text,
-                    email_type=notification_type,
-                    recipient_name=recipient["name"],
-                    cycle_id=active_cycle["cycle_id"],
-                    initiated_by=initiator_id,
-                )
-                if queued:
-                    successes += 1
-                else:
-                    failures.append(recipient["email"])
+            queued = send_emails_bulk(
+                [
+                    {
+                        "to_email": recipient["email"],
+                        "subject": subject,
+                        "html_body": html_body,
+                        "text_body": body_text,
+                        "email_type": notification_type,
+                    }
+                    for recipient, subject, body_text, html_body in formatted_messages
+                ]
+            )
+            if queued:
+                successes = len(formatted_messages)
+                failures = []
+            else:
+                successes = 0
+                failures = [recipient["email"] for recipient, _, _, _ in formatted_messages]
 
             if successes:
                 st.success(
@@ -5,8 +5,7 @@ Allows external stakeholders to login using email and token.
 
 import streamlit as st
 from services.db_helper import (
-    validate_external_token,
-    accept_external_stakeholder_request,
+    accept_or_validate,
     get_active_review_cycle,
 )
 from utils.external_session import reset_external_session
@@ -38,15 +37,6 @@ if (
 
     st.success("✅ Authenticated as External Stakeholder")
 
-    # Auto-accept: external stakeholders do not need to approve
-    if token_data["status"] == "pending":
-        if accept_external_stakeholder_request(token_data):
-            st.session_state["external_token_data"]["status"] = "accepted"
-        else:
-            st.warning(
-                "We couldn't auto-accept your request. You can still proceed to the form."
-            )
-
     # Show only the feedback deadline info
     active_cycle = get_active_review_cycle()
     if active_cycle and active_cycle.get("feedback_deadline"):
@@ -90,7 +80,7 @@ if (
                 if not email or not token:
                     st.error("Please enter both email address and token.")
                 else:
-                    token_data = validate_external_token(email.strip(), token.strip())
+                    token_data = accept_or_validate(email.strip(), token.strip())
 
                     if token_data:
                         st.session_state["external_authenticated"] = True
@@ -1,5 +1,5 @@
 import streamlit as st
-from services.db_helper import get_connection, update_user_details
+from services.db_helper import get_connection, update_user_details, invalidate_user_cache
 from utils.cache_helper import invalidate_on_user_action, get_cached_user_roles
 
 st.title("Manage Employees")
@@ -32,32 +32,34 @@ with st.form("add_user_form"):
                 if result.fetchone()[0] > 0:
                     st.error("Email already exists in the system")
                 else:
-                    # Insert new user
+                    # Insert new user and assign the default employee role in one transaction
                     insert_query = """
                         INSERT INTO users (first_name, last_name, email, vertical, designation, reporting_manager_email)
                         VALUES (?, ?, ?, ?, ?, ?)
+                        RETURNING user_type_id
                     """
-                    cursor = conn.cursor()
-                    cursor.execute(
-                        insert_query,
-                        (
-                            first_name,
-                            last_name,
-                            email,
-                            vertical,
-                            designation,
-                            reporting_manager_email,
-                        ),
+                    role_query = (
+                        "INSERT INTO user_roles (user_type_id, role_id) VALUES (last_insert_rowid(), 3)"
+                    )
+                    insert_result, _ = conn.execute_batch(
+                        [
+                            (
+                                insert_query,
+                                (
+                                    first_name,
+                                    last_name,
+                                    email,
+                                    vertical,
+                                    designation,
+                                    reporting_manager_email,
+                                ),
+                            ),
+                            (role_query, None),
+                        ]
                     )
 
                     # Get the new user ID
-                    user_id = cursor.lastrowid
-
-                    # Assign default employee role
-                    role_query = (
-                        "INSERT INTO user_roles (user_type_id, role_id) VALUES (?, 3)"
-                    )
-                    conn.execute(role_query, (user_id,))
+                    user_id = insert_result.fetchone()[0]
 
                     conn.commit()
                     st.success(f"Employee added successfully!")
@@ -65,6 +67,7 @@ with st.form("add_user_form"):
                     
                     # Invalidate user-related caches after adding new user
                     invalidate_on_user_action('user_added', user_id)
+                    invalidate_user_cache()
                     
                     st.rerun()  # Refresh to show new employee in list
             except Exception as e:
@@ -119,6 +122,7 @@ def assign_role_to_user(user_id, role_id):
     try:
         conn.execute(query, (user_id, role_id))
         conn.commit()
+        invalidate_user_cache()
         return True
     except Exception as e:
         print(f"Error assigning role: {e}")
@@ -132,6 +136,7 @@ def remove_role_from_user(user_id, role_id):
     try:
         conn.execute(query, (user_id, role_id))
         conn.commit()
+        invalidate_user_cache()
         return True
     except Exception as e:
         print(f"Error removing role: {e}")
@@ -148,6 +153,7 @@ def update_user_status(user_id, is_active):
         
         # Invalidate user-related caches after status change
         invalidate_on_user_action('user_modified', user_id)
+        invalidate_user_cache()
         
         return True
     except Exception as e:
@@ -144,7 +144,9 @@ if can_request_external and remaining_slots > 0:
 
 # Get available reviewers with nomination limit information
 users = get_users_for_selection_with_limits(
-    exclude_user_id=current_user_id, requester_user_id=current_user_id
+    exclude_user_id=current_user_id,
+    requester_user_id=current_user_id,
+    cycle_id=active_cycle["cycle_id"],
 )
 
 # Filter and mark already nominated users, direct manager, and at-limit reviewers
@@ -275,10 +277,10 @@ if can_request_external and remaining_slots > 0:
     
     if external_reviewer:
         external_reviewer_clean = external_reviewer.strip().lower()
-        already_nominated_lower = [
+        already_nominated_lower = {
             str(email).lower() if isinstance(email, str) else str(email)
             for email in already_nominated
-        ]
+        }
 
         # Check if they're trying to enter their manager's email
         manager_email = (
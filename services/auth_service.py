@@ -1,7 +1,7 @@
 import bcrypt
 import secrets
 from datetime import datetime, timedelta
-from services.db_helper import fetch_user_by_email, fetch_user_roles, set_user_password, get_connection
+from services.db_helper import fetch_user_by_email, fetch_user_roles, set_user_password, get_connection, invalidate_user_cache
 
 def authenticate_user(email, password):
     """Authenticate user by email and password."""
@@ -123,6 +123,7 @@ def reset_password_with_token(token, new_password):
         """
         conn.execute(update_query, (password_hash, email))
         conn.commit()
+        invalidate_user_cache(email)
         
         return True, "Password reset successfully!"
         
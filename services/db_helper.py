@@ -7,9 +7,14 @@ import streamlit as st
 import pandas as pd
 import hashlib
 import secrets
+import json
+import copy
 from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict, Any, Union, Tuple
+from collections import namedtuple
+from functools import lru_cache
 import logging
+import threading
 from .turso_connection import get_connection as turso_get_connection
 
 # Configure logging
@@ -19,6 +24,14 @@ logger = logging.getLogger(__name__)
 # Cache for frequently accessed data
 _cache = {}
 _cache_timestamps = {}
+# Session threads, the mail pool and the log writer all touch the cache
+_cache_lock = threading.Lock()
+
+# DDL is idempotent but still a round-trip; run it at most once per process
+_SCHEMA_ENSURED = False
+_SCHEMA_INDEXES_ENSURED = False
+_NAME_CACHE_COLUMNS_PRESENT = False
+_DEADLINE_EXTENSION_TABLE_ENSURED = False
 
 def get_connection():
     """Backward compatible accessor that returns a Turso-backed connection."""
@@ -26,36 +39,90 @@ def get_connection():
 
 def get_cached_value(cache_key, cache_duration_seconds=60):
     """Get a cached value if it hasn't expired"""
-    if cache_key in _cache and cache_key in _cache_timestamps:
-        cache_time = _cache_timestamps[cache_key]
-        if (datetime.now() - cache_time).seconds < cache_duration_seconds:
-            return _cache[cache_key]
+    with _cache_lock:
+        if cache_key in _cache and cache_key in _cache_timestamps:
+            cache_time = _cache_timestamps[cache_key]
+            if (datetime.now() - cache_time).total_seconds() < cache_duration_seconds:
+                return _cache[cache_key]
     return None
 
 def set_cached_value(cache_key, data, cache_duration_seconds=60):
     """Set a cached value with timestamp"""
-    _cache[cache_key] = data
-    _cache_timestamps[cache_key] = datetime.now()
+    with _cache_lock:
+        _cache[cache_key] = data
+        _cache_timestamps[cache_key] = datetime.now()
+
+def clear_cached_values(prefix):
+    """Drop every cached value whose key starts with prefix"""
+    with _cache_lock:
+        for cache_key in [k for k in _cache if k.startswith(prefix)]:
+            _cache.pop(cache_key, None)
+            _cache_timestamps.pop(cache_key, None)
+
+# User lookups change at most per login / profile edit
+USER_CACHE_SECONDS = 120
+
+def invalidate_user_cache(email=None):
+    """Invalidate cached user lookups (one user by email, or all users when email is None)."""
+    if email:
+        clear_cached_values(f"user:{email}")
+    else:
+        clear_cached_values("user:")
+    # Roles and eligibility are keyed by user id; they are cheap to refetch
+    clear_cached_values("user_roles:")
+    clear_cached_values("can_request:")
+    clear_cached_values("users_for_selection:")
+    # Relationships depend on both users' vertical / reporting manager
+    clear_cached_values("relationship:")
 
 # =====================================================
 # EMAIL QUEUE FUNCTIONS
 # =====================================================
+_Q_QUEUE_EMAIL = """
+    INSERT INTO email_queue (to_email, subject, html_body, text_body, email_type)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
 def queue_email(to_email: str, subject: str, html_body: str, text_body: str = None, email_type: str = "general"):
     """Add email to the queue"""
+    return queue_emails_bulk([(to_email, subject, html_body, text_body, email_type)])
+
+# Emails per queue INSERT; bodies are inlined, so this bounds each request payload
+QUEUE_EMAIL_CHUNK_SIZE = 20
+
+def queue_emails_bulk(rows):
+    """
+    Add several emails to the queue, one multi-row INSERT per QUEUE_EMAIL_CHUNK_SIZE rows.
+    rows are (to_email, subject, html_body, text_body, email_type) tuples.
+    A chunk that fails is retried row by row, so one bad email does not drop the others.
+    Returns True only if every email was queued.
+    """
+    rows = list(rows)
     conn = get_connection()
-    try:
-        conn.execute(
-            """
-            INSERT INTO email_queue (to_email, subject, html_body, text_body, email_type)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (to_email, subject, html_body, text_body, email_type),
-        )
-        conn.commit()
-        return True
-    except Exception as e:
-        logger.error(f"Error queuing email: {e}")
-        return False
+    failed = 0
+    for start in range(0, len(rows), QUEUE_EMAIL_CHUNK_SIZE):
+        chunk = rows[start:start + QUEUE_EMAIL_CHUNK_SIZE]
+        try:
+            # execute_batch raises on any error, unlike execute
+            with conn.transaction() as tx:
+                tx.executemany(_Q_QUEUE_EMAIL, chunk)
+            continue
+        except Exception as e:
+            logger.warning(f"Queuing {len(chunk)} email(s) in one INSERT failed, retrying individually: {e}")
+        
+        for row in chunk:
+            try:
+                result = conn.execute(_Q_QUEUE_EMAIL, row)
+                error = result.error
+            except Exception as e:
+                error = e
+            if error:
+                failed += 1
+                logger.error(f"Error queuing email to {row[0]}: {error}")
+    
+    if failed:
+        logger.error(f"{failed} of {len(rows)} email(s) could not be queued")
+    return failed == 0
 
 def get_pending_emails():
     """Get pending emails from the queue"""
@@ -105,6 +172,11 @@ def mark_email_failed(email_id: int, error_message: str):
 
 def fetch_user_by_email(email):
     """Fetch user details by email"""
+    cache_key = f"user:{email}"
+    cached = get_cached_value(cache_key, USER_CACHE_SECONDS)
+    if cached is not None:
+        return dict(cached)
+    
     conn = get_connection()
     try:
         result = conn.execute("""
@@ -112,11 +184,12 @@ def fetch_user_by_email(email):
                    vertical, designation, reporting_manager_email, date_of_joining
             FROM users 
             WHERE email = ? AND is_active = 1
+            LIMIT 1
         """, (email,))
         
         row = result.fetchone()
         if row:
-            return {
+            user = {
                 'user_type_id': row[0],
                 'first_name': row[1],
                 'last_name': row[2],
@@ -128,6 +201,8 @@ def fetch_user_by_email(email):
                 'reporting_manager_email': row[8],
                 'date_of_joining': row[9]
             }
+            set_cached_value(cache_key, user, USER_CACHE_SECONDS)
+            return dict(user)
         return None
     except Exception as e:
         logger.error(f"Error fetching user by email {email}: {e}")
@@ -135,6 +210,11 @@ def fetch_user_by_email(email):
 
 def fetch_user_roles(user_type_id):
     """Fetch roles for a specific user."""
+    cache_key = f"user_roles:{user_type_id}"
+    cached = get_cached_value(cache_key, USER_CACHE_SECONDS)
+    if cached is not None:
+        return list(cached)
+    
     with get_connection() as conn:
         query = """
             SELECT r.role_id, r.role_name, r.description 
@@ -145,7 +225,9 @@ def fetch_user_roles(user_type_id):
         try:
             result = conn.execute(query, (user_type_id,))
             roles = result.fetchall()
-            return [{"role_id": row[0], "role_name": row[1], "description": row[2]} for row in roles]
+            roles = [{"role_id": row[0], "role_name": row[1], "description": row[2]} for row in roles]
+            set_cached_value(cache_key, roles, USER_CACHE_SECONDS)
+            return list(roles)
         except Exception as e:
             logger.error(f"Error fetching user roles: {e}")
             return []
@@ -160,51 +242,70 @@ def set_user_password(email, password_hash):
             WHERE email = ?
         """, (password_hash, email))
         conn.commit()
+        invalidate_user_cache(email)
         return True
     except Exception as e:
         logger.error(f"Error setting password for {email}: {e}")
         return False
 
+# Compact, immutable row for the reviewer selector (safe to share from the process cache)
+UserRow = namedtuple("UserRow", "user_type_id name first_name last_name vertical designation email")
+
+# Reviewer list changes only when employees are added/edited (those paths invalidate it)
+USERS_FOR_SELECTION_CACHE_SECONDS = 300
+
+def _iter_user_rows(rows):
+    """Yield UserRow tuples from raw users query rows."""
+    for row in rows:
+        yield UserRow(row[0], f"{row[1]} {row[2]}", row[1], row[2], row[3] or "Unknown", row[4] or "Unknown", row[5])
+
+# Eligibility to give feedback, shared by every reviewer-selection query (users aliased as u;
+# binds one parameter, _reviewer_tenure_cutoff()): joined before cutoff OR at least 90 days tenure.
+# If date_of_joining is NULL, include user (cannot validate; do not block)
+# Compare the raw ISO text (no DATE() around the column) so idx_users_active_doj
+# can be used; "< next day" keeps values stored with a time component eligible.
+_REVIEWER_ELIGIBILITY_WHERE = """
+    u.is_active = 1
+      AND (
+        u.date_of_joining IS NULL
+        OR u.date_of_joining < '2025-10-01'
+        OR u.date_of_joining < ?
+      )
+"""
+
+def _reviewer_tenure_cutoff():
+    """Latest date_of_joining (exclusive) that meets the 90-day tenure rule."""
+    return (date.today() - timedelta(days=89)).isoformat()
+
+_Q_USERS_FOR_SELECTION = f"""
+    SELECT u.user_type_id, u.first_name, u.last_name, u.vertical, u.designation, u.email
+    FROM users u
+    WHERE {_REVIEWER_ELIGIBILITY_WHERE}
+    ORDER BY u.first_name, u.last_name
+"""
+
 def get_users_for_selection(exclude_user_id=None, requester_user_id=None):
     """Get list of all active users eligible to give feedback (reviewers)."""
-    with get_connection() as conn:
-        try:
-            # Eligibility to give feedback: joined before cutoff OR at least 90 days tenure
-            # If date_of_joining is NULL, include user (cannot validate; do not block)
-            query = """
-                SELECT user_type_id, first_name, last_name, vertical, designation, email
-                FROM users 
-                WHERE is_active = 1
-                  AND (
-                    date_of_joining IS NULL
-                    OR DATE(date_of_joining) <= DATE('2025-09-30')
-                    OR DATE(date_of_joining) <= DATE('now', '-90 days')
-                  )
-            """
-            params = []
-            
-            if exclude_user_id:
-                query += " AND user_type_id != ?"
-                params.append(exclude_user_id)
-            
-            query += " ORDER BY first_name, last_name"
-            
-            result = conn.execute(query, tuple(params) if params else ())
-            users = []
-            for row in result.fetchall():
-                users.append({
-                    "user_type_id": row[0],
-                    "name": f"{row[1]} {row[2]}",
-                    "first_name": row[1],
-                    "last_name": row[2],
-                    "vertical": row[3] or "Unknown",
-                    "designation": row[4] or "Unknown",
-                    "email": row[5]
-                })
-            return users
-        except Exception as e:
-            logger.error(f"Error fetching users: {e}")
-            return []
+    tenure_cutoff = _reviewer_tenure_cutoff()
+    cache_key = f"users_for_selection:{tenure_cutoff}"
+    user_rows = get_cached_value(cache_key, USERS_FOR_SELECTION_CACHE_SECONDS)
+    
+    if user_rows is None:
+        with get_connection() as conn:
+            try:
+                result = conn.execute(_Q_USERS_FOR_SELECTION, (tenure_cutoff,))
+                user_rows = tuple(_iter_user_rows(result.fetchall()))
+                set_cached_value(cache_key, user_rows, USERS_FOR_SELECTION_CACHE_SECONDS)
+            except Exception as e:
+                logger.error(f"Error fetching users: {e}")
+                return []
+    
+    # Callers annotate the dicts (e.g. nomination counts), so hand out fresh ones
+    return [
+        user._asdict()
+        for user in user_rows
+        if not exclude_user_id or user.user_type_id != exclude_user_id
+    ]
 
 def _parse_iso_date(value):
     """Parse ISO date string to date object"""
@@ -219,6 +320,11 @@ def _parse_iso_date(value):
 
 def can_user_request_feedback(user_id):
     """Check if user can request feedback based on date of joining policy"""
+    cache_key = f"can_request:{user_id}"
+    cached = get_cached_value(cache_key, USER_CACHE_SECONDS)
+    if cached is not None:
+        return cached
+    
     conn = get_connection()
     try:
         result = conn.execute("""
@@ -226,17 +332,18 @@ def can_user_request_feedback(user_id):
         """, (user_id,))
         
         row = result.fetchone()
-        if not row or not row[0]:
-            # If no DOJ, allow (configurable policy)
-            return True
+        doj = _parse_iso_date(row[0]) if row and row[0] else None
         
-        doj = _parse_iso_date(row[0])
         if not doj:
-            return True
+            # If no DOJ (or unparseable), allow (configurable policy)
+            allowed = True
+        else:
+            # Policy: Must have joined on or before 2025-09-30 to request feedback
+            cutoff_date = date(2025, 9, 30)
+            allowed = doj <= cutoff_date
         
-        # Policy: Must have joined on or before 2025-09-30 to request feedback
-        cutoff_date = date(2025, 9, 30)
-        return doj <= cutoff_date
+        set_cached_value(cache_key, allowed, USER_CACHE_SECONDS)
+        return allowed
         
     except Exception as e:
         logger.error(f"Error checking user feedback eligibility: {e}")
@@ -279,23 +386,42 @@ def check_external_stakeholder_permission(user_id):
 # REVIEW CYCLE FUNCTIONS  
 # =====================================================
 
-def get_active_review_cycle():
+_Q_ACTIVE_CYCLE = """
+    SELECT cycle_id, cycle_name, cycle_display_name, cycle_description,
+           cycle_year, cycle_quarter, phase_status,
+           nomination_start_date, nomination_deadline, 
+           feedback_deadline, created_at,
+           date(nomination_deadline) AS nomination_deadline_date
+    FROM review_cycles 
+    WHERE is_active = 1
+    LIMIT 1
+"""
+
+# The active cycle changes only through the cycle management helpers below,
+# which call _invalidate_active_cycle(); the TTL bounds staleness across processes.
+ACTIVE_CYCLE_CACHE_SECONDS = 30
+
+CYCLE_CONTEXT_CACHE_SECONDS = 30
+
+def _invalidate_active_cycle():
+    """Drop the cached active review cycle after any review_cycles write."""
+    clear_cached_values("active_cycle")
+    clear_cached_values("cycle_context")
+    clear_cached_values("cycle:")
+
+def get_active_review_cycle(conn=None):
     """Get the currently active review cycle with enhanced metadata"""
-    conn = get_connection()
-    query = """
-        SELECT cycle_id, cycle_name, cycle_display_name, cycle_description,
-               cycle_year, cycle_quarter, phase_status,
-               nomination_start_date, nomination_deadline, 
-               feedback_deadline, created_at
-        FROM review_cycles 
-        WHERE is_active = 1
-        LIMIT 1
-    """
+    # Cached as a 1-tuple so "no active cycle" is cached too
+    cached = get_cached_value("active_cycle", ACTIVE_CYCLE_CACHE_SECONDS)
+    if cached is not None:
+        return dict(cached[0]) if cached[0] else None
+    
+    conn = conn or get_connection()
     try:
-        result = conn.execute(query)
+        result = conn.execute(_Q_ACTIVE_CYCLE)
         cycle = result.fetchone()
         if cycle:
-            return {
+            active_cycle = {
                 'cycle_id': cycle[0],
                 'cycle_name': cycle[1],
                 'cycle_display_name': cycle[2] or cycle[1],
@@ -306,8 +432,13 @@ def get_active_review_cycle():
                 'nomination_start_date': cycle[7],
                 'nomination_deadline': cycle[8],
                 'feedback_deadline': cycle[9],
-                'created_at': cycle[10]
+                'created_at': cycle[10],
+                # Normalized YYYY-MM-DD (NULL if unparseable) for get_current_cycle_phase
+                'nomination_deadline_date': cycle[11]
             }
+            set_cached_value("active_cycle", (active_cycle,), ACTIVE_CYCLE_CACHE_SECONDS)
+            return dict(active_cycle)
+        set_cached_value("active_cycle", (None,), ACTIVE_CYCLE_CACHE_SECONDS)
         return None
     except Exception as e:
         logger.error(f"Error getting active review cycle: {e}")
@@ -324,57 +455,46 @@ def get_all_cycles():
         ORDER BY created_at DESC
     """
     try:
-        result = conn.execute(query)
-        cycles = []
-        for row in result.fetchall():
-            cycles.append({
-                'cycle_id': row[0],
-                'cycle_name': row[1],
-                'cycle_display_name': row[2],
-                'cycle_description': row[3],
-                'cycle_year': row[4],
-                'cycle_quarter': row[5],
-                'phase_status': row[6],
-                'is_active': row[7],
-                'nomination_start_date': row[8],
-                'nomination_deadline': row[9],
-                'feedback_deadline': row[10],
-                'created_at': row[11]
-            })
-        return cycles
+        return conn.execute(query).fetchall_dicts()
     except Exception as e:
         logger.error(f"Error fetching all cycles: {e}")
         return []
 
-def get_cycle_by_id(cycle_id):
+# Immutable cycle row, shared from the process cache without copying
+CycleRow = namedtuple(
+    "CycleRow",
+    "cycle_id cycle_name cycle_display_name cycle_description cycle_year cycle_quarter "
+    "phase_status is_active nomination_start_date nomination_deadline feedback_deadline created_at",
+)
+
+_Q_CYCLE_BY_ID = """
+    SELECT cycle_id, cycle_name, cycle_display_name, cycle_description, 
+           cycle_year, cycle_quarter, phase_status, is_active,
+           nomination_start_date, nomination_deadline, feedback_deadline, created_at
+    FROM review_cycles 
+    WHERE cycle_id = ?
+"""
+
+def _get_cycle_row(cycle_id, conn=None):
+    """Cached CycleRow for a cycle id (None if it does not exist). Raises on DB errors."""
+    cache_key = f"cycle:{cycle_id}"
+    cached = get_cached_value(cache_key, ACTIVE_CYCLE_CACHE_SECONDS)
+    if cached is not None:
+        return cached
+    
+    conn = conn or get_connection()
+    row = conn.execute(_Q_CYCLE_BY_ID, (cycle_id,)).fetchone()
+    if not row:
+        return None
+    cycle = CycleRow(*row)
+    set_cached_value(cache_key, cycle, ACTIVE_CYCLE_CACHE_SECONDS)
+    return cycle
+
+def get_cycle_by_id(cycle_id, conn=None):
     """Get a specific cycle by ID with all metadata."""
-    conn = get_connection()
-    query = """
-        SELECT cycle_id, cycle_name, cycle_display_name, cycle_description, 
-               cycle_year, cycle_quarter, phase_status, is_active,
-               nomination_start_date, nomination_deadline, feedback_deadline, created_at
-        FROM review_cycles 
-        WHERE cycle_id = ?
-    """
     try:
-        result = conn.execute(query, (cycle_id,))
-        row = result.fetchone()
-        if row:
-            return {
-                'cycle_id': row[0],
-                'cycle_name': row[1],
-                'cycle_display_name': row[2],
-                'cycle_description': row[3],
-                'cycle_year': row[4],
-                'cycle_quarter': row[5],
-                'phase_status': row[6],
-                'is_active': row[7],
-                'nomination_start_date': row[8],
-                'nomination_deadline': row[9],
-                'feedback_deadline': row[10],
-                'created_at': row[11]
-            }
-        return None
+        cycle = _get_cycle_row(cycle_id, conn)
+        return cycle._asdict() if cycle else None
     except Exception as e:
         logger.error(f"Error fetching cycle by ID: {e}")
         return None
@@ -383,32 +503,28 @@ def create_named_cycle(display_name, description, year, quarter, cycle_name, nom
     """Create a new named review cycle"""
     conn = get_connection()
     try:
-        # Create new cycle with enhanced fields first
-        conn.execute("""
-            INSERT INTO review_cycles 
-            (cycle_name, cycle_display_name, cycle_description, cycle_year, cycle_quarter,
-             nomination_start_date, nomination_deadline, feedback_deadline, phase_status, is_active, created_by)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'nomination', 1, ?)
-        """, (cycle_name, display_name, description, year, quarter,
-              nomination_start, nomination_deadline, feedback_deadline, created_by))
-        
-        # Get the cycle_id (use a query since lastrowid may not work reliably)
-        result = conn.execute("""
-            SELECT cycle_id FROM review_cycles 
-            WHERE cycle_name = ? AND created_by = ? 
-            ORDER BY created_at DESC LIMIT 1
-        """, (cycle_name, created_by))
-        
-        cycle_row = result.fetchone()
+        # Create the new cycle and deactivate the others in one transaction
+        # (RETURNING gives the id without a re-select)
+        insert_result, _ = conn.execute_batch([
+            ("""
+                INSERT INTO review_cycles 
+                (cycle_name, cycle_display_name, cycle_description, cycle_year, cycle_quarter,
+                 nomination_start_date, nomination_deadline, feedback_deadline, phase_status, is_active, created_by)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'nomination', 1, ?)
+                RETURNING cycle_id
+            """, (cycle_name, display_name, description, year, quarter,
+                  nomination_start, nomination_deadline, feedback_deadline, created_by)),
+            ("UPDATE review_cycles SET is_active = 0 WHERE cycle_id != last_insert_rowid()", None),
+        ])
+        
+        cycle_row = insert_result.fetchone()
         if not cycle_row:
             raise Exception("Failed to retrieve created cycle ID")
         
         cycle_id = cycle_row[0]
         
-        # Deactivate other cycles
-        conn.execute("UPDATE review_cycles SET is_active = 0 WHERE cycle_id != ?", (cycle_id,))
-        
         conn.commit()
+        _invalidate_active_cycle()
         logger.info(f"Successfully created named cycle with ID {cycle_id} and deactivated others")
         return True, cycle_id
         
@@ -419,27 +535,32 @@ def create_named_cycle(display_name, description, year, quarter, cycle_name, nom
 
 def get_current_cycle_context():
     """Get detailed current cycle context for smart messaging."""
+    # Participation numbers move slowly; cycle writes invalidate this via _invalidate_active_cycle()
+    cached = get_cached_value("cycle_context", CYCLE_CONTEXT_CACHE_SECONDS)
+    if cached is not None:
+        return copy.deepcopy(cached)
+    
     conn = get_connection()
     try:
         active_cycle = get_active_review_cycle()
         
+        # Recent cycles and participation counts in one round-trip (counts repeat on each row)
         recent_cycles = conn.execute("""
-            SELECT cycle_id, cycle_display_name, cycle_year, cycle_quarter, created_at
+            SELECT cycle_id, cycle_display_name, cycle_year, cycle_quarter, created_at,
+                   (SELECT COUNT(*) FROM users WHERE is_active = 1),
+                   (SELECT COUNT(DISTINCT requester_id) FROM feedback_requests WHERE cycle_id = ?)
             FROM review_cycles 
             ORDER BY created_at DESC LIMIT 3
-        """).fetchall()
+        """, (active_cycle['cycle_id'] if active_cycle else None,)).fetchall()
         
-        if active_cycle:
-            total_users = conn.execute("SELECT COUNT(*) FROM users WHERE is_active = 1").fetchone()[0]
-            participating_users = conn.execute("""
-                SELECT COUNT(DISTINCT requester_id) FROM feedback_requests 
-                WHERE cycle_id = (SELECT cycle_id FROM review_cycles WHERE is_active = 1)
-            """).fetchone()[0]
+        if active_cycle and recent_cycles:
+            total_users = recent_cycles[0][5]
+            participating_users = recent_cycles[0][6]
         else:
             total_users = 0
             participating_users = 0
         
-        return {
+        context = {
             'active_cycle': active_cycle,
             'recent_cycles': [
                 {
@@ -456,6 +577,8 @@ def get_current_cycle_context():
                 'participation_rate': (participating_users / total_users * 100) if total_users > 0 else 0
             }
         }
+        set_cached_value("cycle_context", context, CYCLE_CONTEXT_CACHE_SECONDS)
+        return copy.deepcopy(context)
     except Exception as e:
         logger.error(f"Error getting cycle context: {e}")
         return {'active_cycle': None, 'recent_cycles': [], 'participation_stats': {}}
@@ -484,6 +607,7 @@ def mark_cycle_complete(cycle_id, completion_notes=""):
             WHERE cycle_id = ? AND is_active = 1
         """, (cycle_id,))
         conn.commit()
+        _invalidate_active_cycle()
         
         # Verify the update succeeded by re-querying
         verify_result = conn.execute("""
@@ -507,25 +631,12 @@ def get_current_cycle_phase():
     active_cycle = get_active_review_cycle()
     if not active_cycle:
         return None
-    
-    today = date.today()
-    nomination_deadline = active_cycle.get('nomination_deadline')
-    
-    if nomination_deadline:
-        try:
-            if isinstance(nomination_deadline, str):
-                deadline_date = datetime.fromisoformat(nomination_deadline).date()
-            else:
-                deadline_date = nomination_deadline
-            
-            if today <= deadline_date:
-                return "nomination"
-            else:
-                return "feedback"
-        except:
-            pass
-    
-    return "nomination"
+    # Compared against the local date, like is_deadline_passed; the deadline is
+    # normalized by SQL in the cached active cycle lookup
+    deadline = active_cycle.get('nomination_deadline_date')
+    if not deadline or date.today().isoformat() <= deadline:
+        return "nomination"
+    return "feedback"
 
 def update_cycle_status(cycle_id, new_status):
     """Update the phase_status of a specific review cycle"""
@@ -534,6 +645,7 @@ def update_cycle_status(cycle_id, new_status):
         conn.execute("UPDATE review_cycles SET phase_status = ? WHERE cycle_id = ?", 
                     (new_status, cycle_id))
         conn.commit()
+        _invalidate_active_cycle()
         logger.info(f"Cycle {cycle_id} phase_status updated to '{new_status}'.")
         return True
     except Exception as e:
@@ -558,6 +670,7 @@ def archive_cycle(cycle_id):
         """, (cycle_id,))
         
         conn.commit()
+        _invalidate_active_cycle()
         return True
     except Exception as e:
         logger.error(f"Error archiving cycle {cycle_id}: {e}")
@@ -568,6 +681,34 @@ def archive_cycle(cycle_id):
 # FEEDBACK REQUEST MANAGEMENT FUNCTIONS
 # =====================================================
 
+@lru_cache(maxsize=64)
+def _insert_feedback_requests_sql(columns, fixed, row_count, with_name_cache):
+    """
+    feedback_requests INSERT for row_count rows of ? parameters (one per column in columns),
+    with the (column, SQL literal) pairs in fixed set on every row. with_name_cache also fills
+    reviewer_name_cached / cycle_display_name_cached in the same statement (INSERT ... SELECT).
+    """
+    column_list = ", ".join(columns + tuple(column for column, _ in fixed))
+    literals = tuple(literal for _, literal in fixed)
+    if not with_name_cache:
+        row = "(" + ", ".join(("?",) * len(columns) + literals) + ")"
+        return f"INSERT INTO feedback_requests ({column_list}) VALUES {', '.join([row] * row_count)}"
+    
+    row = "(" + ", ".join(["?"] * len(columns)) + ")"
+    source = {column: f"v.column{index + 1}" for index, column in enumerate(columns)}
+    reviewer_name = (
+        "(SELECT TRIM(COALESCE(u.first_name, '') || ' ' || COALESCE(u.last_name, '')) "
+        f"FROM users u WHERE u.user_type_id = {source['reviewer_id']})"
+        if 'reviewer_id' in source else "NULL"
+    )
+    cycle_name = f"(SELECT rc.cycle_display_name FROM review_cycles rc WHERE rc.cycle_id = {source['cycle_id']})"
+    select_list = ", ".join(tuple(source.values()) + literals + (reviewer_name, cycle_name))
+    return f"""
+        INSERT INTO feedback_requests ({column_list}, reviewer_name_cached, cycle_display_name_cached)
+        SELECT {select_list}
+        FROM (VALUES {', '.join([row] * row_count)}) AS v
+    """
+
 def create_feedback_requests_with_approval(requester_id, reviewer_data):
     """Create feedback requests that require manager approval with external stakeholder support.
     External stakeholder requests go to manager approval first. Invitations are sent after approval.
@@ -664,15 +805,16 @@ def create_feedback_requests_with_approval(requester_id, reviewer_data):
         
         # Create requests for each reviewer
         external_requests = []  # Track external requests for email sending after approval
+        name_cache = _feedback_request_name_cache_ready(conn)
         
         for reviewer_identifier, relationship_type in reviewer_data:
             if isinstance(reviewer_identifier, int):
                 # Internal reviewer (user ID)
-                request_query = """
-                    INSERT INTO feedback_requests 
-                    (cycle_id, requester_id, reviewer_id, relationship_type, status, approval_status) 
-                    VALUES (?, ?, ?, ?, 'pending_approval', 'pending')
-                """
+                request_query = _insert_feedback_requests_sql(
+                    ('cycle_id', 'requester_id', 'reviewer_id', 'relationship_type'),
+                    (('status', "'pending_approval'"), ('approval_status', "'pending'")),
+                    1, name_cache,
+                )
                 conn.execute(request_query, (cycle_id, requester_id, reviewer_identifier, relationship_type))
                 
                 # Update nomination count for internal reviewers only
@@ -686,11 +828,11 @@ def create_feedback_requests_with_approval(requester_id, reviewer_data):
                 conn.execute(nomination_query, (reviewer_identifier,))
             else:
                 # External reviewer (email address) — goes through manager approval
-                request_query = """
-                    INSERT INTO feedback_requests 
-                    (cycle_id, requester_id, external_reviewer_email, relationship_type, status, approval_status, external_status) 
-                    VALUES (?, ?, ?, ?, 'pending_approval', 'pending', 'pending')
-                """
+                request_query = _insert_feedback_requests_sql(
+                    ('cycle_id', 'requester_id', 'external_reviewer_email', 'relationship_type'),
+                    (('status', "'pending_approval'"), ('approval_status', "'pending'"), ('external_status', "'pending'")),
+                    1, name_cache,
+                )
                 result = conn.execute(request_query, (cycle_id, requester_id, reviewer_identifier, relationship_type))
                 # Note: turso-python doesn't support lastrowid directly, so we'll need to get the ID differently
                 # For now, we'll proceed without storing the request_id
@@ -702,6 +844,7 @@ def create_feedback_requests_with_approval(requester_id, reviewer_data):
                 })
         
         conn.commit()
+        invalidate_nomination_counts()
 
         # Informational log retained for debugging
         logger.info(
@@ -737,13 +880,14 @@ def create_feedback_requests_with_approval_OLD(requester_id, reviewer_data):
         if not manager:
             return False, "No reporting manager found"
         
+        name_cache = _feedback_request_name_cache_ready(conn)
         for reviewer_identifier, relationship_type in reviewer_data:
             if isinstance(reviewer_identifier, int):
-                conn.execute("""
-                    INSERT INTO feedback_requests 
-                    (cycle_id, requester_id, reviewer_id, relationship_type, status, approval_status) 
-                    VALUES (?, ?, ?, ?, 'pending_approval', 'pending')
-                """, (cycle_id, requester_id, reviewer_identifier, relationship_type))
+                conn.execute(_insert_feedback_requests_sql(
+                    ('cycle_id', 'requester_id', 'reviewer_id', 'relationship_type'),
+                    (('status', "'pending_approval'"), ('approval_status', "'pending'")),
+                    1, name_cache,
+                ), (cycle_id, requester_id, reviewer_identifier, relationship_type))
                 
                 conn.execute("""
                     INSERT INTO reviewer_nominations (reviewer_id, nomination_count) 
@@ -753,13 +897,14 @@ def create_feedback_requests_with_approval_OLD(requester_id, reviewer_data):
                     last_updated = CURRENT_TIMESTAMP
                 """, (reviewer_identifier,))
             else:
-                conn.execute("""
-                    INSERT INTO feedback_requests 
-                    (cycle_id, requester_id, external_reviewer_email, relationship_type, status, approval_status) 
-                    VALUES (?, ?, ?, ?, 'pending_approval', 'pending')
-                """, (cycle_id, requester_id, reviewer_identifier, relationship_type))
+                conn.execute(_insert_feedback_requests_sql(
+                    ('cycle_id', 'requester_id', 'external_reviewer_email', 'relationship_type'),
+                    (('status', "'pending_approval'"), ('approval_status', "'pending'")),
+                    1, name_cache,
+                ), (cycle_id, requester_id, reviewer_identifier, relationship_type))
         
         conn.commit()
+        invalidate_nomination_counts()
         return True, "Requests submitted for manager approval"
     except Exception as e:
         logger.error(f"Error creating feedback requests (legacy): {e}")
@@ -800,33 +945,60 @@ def get_pending_approvals_for_manager(manager_id):
         logger.error(f"Error fetching pending approvals: {e}")
         return []
 
+def approve_feedback_requests(request_ids, manager_id):
+    """Approve several feedback requests in one UPDATE and send their external invitations."""
+    request_ids = list(request_ids)
+    if not request_ids:
+        return True
+    
+    conn = get_connection()
+    try:
+        placeholders = ",".join(["?"] * len(request_ids))
+        conn.execute(
+            f"""
+            UPDATE feedback_requests
+            SET approval_status='approved', workflow_state='pending_reviewer_acceptance',
+                approved_by=?, approval_date=CURRENT_TIMESTAMP, counts_toward_limit=1
+            WHERE request_id IN ({placeholders})
+            """,
+            [manager_id, *request_ids],
+        )
+        # Process external stakeholder invitations immediately (emails are now queued)
+        try:
+            process_external_stakeholder_invitations_bulk(request_ids)
+        except Exception as e:
+            logger.error(f"Error processing external invitations: {e}")
+        
+        conn.commit()
+        invalidate_nomination_counts()
+        return True
+    except Exception as e:
+        logger.error(f"Error approving feedback requests: {e}")
+        conn.rollback()
+        return False
+
 def approve_reject_feedback_request(request_id, manager_id, action, rejection_reason=None):
     """Manager approval/rejection with external invitation processing."""
+    if action == "approve":
+        return approve_feedback_requests([request_id], manager_id)
+    
     conn = get_connection()
     try:
-        if action == "approve":
-            conn.execute(
-                """
-                UPDATE feedback_requests
-                SET approval_status='approved', workflow_state='pending_reviewer_acceptance',
-                    approved_by=?, approval_date=CURRENT_TIMESTAMP, counts_toward_limit=1
-                WHERE request_id = ?
-                """,
-                (manager_id, request_id),
-            )
-            # Process external stakeholder invitations immediately (emails are now queued)
-            try:
-                process_external_stakeholder_invitations(request_id)
-            except Exception as e:
-                logger.error(f"Error processing external invitations: {e}")
-            
-        elif action == "reject":
+        if action == "reject":
             # Add tracking ID for rejection monitoring
             tracking_id = f"rejection_{request_id}_{datetime.now().isoformat()}"
             
-            # Get request details first
+            # Get request details first, with requester/reviewer names for the email
             request_details = conn.execute(
-                "SELECT requester_id, reviewer_id, external_reviewer_email FROM feedback_requests WHERE request_id = ?", 
+                """
+                SELECT fr.requester_id, fr.reviewer_id, fr.external_reviewer_email,
+                       req.first_name, req.last_name, req.email,
+                       rev.first_name, rev.last_name
+                FROM feedback_requests fr
+                LEFT JOIN users req ON fr.requester_id = req.user_type_id
+                LEFT JOIN users rev ON fr.reviewer_id = rev.user_type_id
+                WHERE fr.request_id = ?
+                """,
                 (request_id,)
             ).fetchone()
             
@@ -860,28 +1032,19 @@ def approve_reject_feedback_request(request_id, manager_id, action, rejection_re
                 
                 # Send rejection email
                 try:
-                    from services.email_service import send_nomination_rejected
-                    # Get requester details for email
-                    requester_result = conn.execute(
-                        "SELECT first_name, last_name, email FROM users WHERE user_type_id = ?",
-                        (request_details[0],)
-                    ).fetchone()
+                    from services.email_service import send_nomination_rejected, send_email_in_background
                     
-                    if requester_result:
-                        requester_name = f"{requester_result[0]} {requester_result[1]}"
-                        requester_email = requester_result[2]
+                    if request_details[5]:
+                        requester_name = f"{request_details[3]} {request_details[4]}"
+                        requester_email = request_details[5]
                         
-                        # Get reviewer name
                         if request_details[1]:  # Internal reviewer
-                            reviewer_result = conn.execute(
-                                "SELECT first_name, last_name FROM users WHERE user_type_id = ?",
-                                (request_details[1],)
-                            ).fetchone()
-                            reviewer_name = f"{reviewer_result[0]} {reviewer_result[1]}" if reviewer_result else "Unknown"
+                            reviewer_name = f"{request_details[6]} {request_details[7]}" if request_details[6] is not None else "Unknown"
                         else:  # External reviewer
                             reviewer_name = request_details[2]
                         
-                        send_nomination_rejected(
+                        send_email_in_background(
+                            send_nomination_rejected,
                             requester_email=requester_email,
                             requester_name=requester_name,
                             reviewer_name=reviewer_name,
@@ -891,6 +1054,7 @@ def approve_reject_feedback_request(request_id, manager_id, action, rejection_re
                     logger.error(f"Error sending rejection email: {e}")
         
         conn.commit()
+        invalidate_nomination_counts()
         return True
     except Exception as e:
         logger.error(f"Error processing approval/rejection: {e}")
@@ -930,6 +1094,7 @@ def approve_reject_feedback_request_OLD(request_id, manager_id, action, rejectio
                 """, (request_details[0], request_details[1], manager_id, rejection_reason))
         
         conn.commit()
+        invalidate_nomination_counts()
         return True
     except Exception as e:
         logger.error(f"Error processing legacy approval/rejection: {e}")
@@ -989,17 +1154,59 @@ def reviewer_accept_reject_request(request_id, reviewer_id, action, rejection_re
                     logger.error(f"Error adding rejection tracking: {e}")
         
         conn.commit()
+        if action == "reject":
+            invalidate_reviewer_rejections()
         return True, f"Request {action}ed successfully"
     except Exception as e:
         logger.error(f"Error processing reviewer response: {e}")
         conn.rollback()
         return False, f"Error processing reviewer response: {e}"
 
-def get_user_nominations_status(user_id):
+# Workflow state -> nomination display status, and the states that use up a nomination slot.
+# The SQL below is generated from these so the mapping lives in one place.
+_WF_DISPLAY_STATUS = {
+    "pending_manager_approval": "pending",
+    "manager_rejected": "rejected",
+    "pending_reviewer_acceptance": "approved",
+    "reviewer_rejected": "rejected",
+    "in_progress": "approved",
+    "completed": "completed",
+    "expired": "expired",
+}
+
+_WF_COUNTED_STATES = (
+    "pending_manager_approval",
+    "pending_reviewer_acceptance",
+    "in_progress",
+    "completed",
+)
+
+_SQL_WF_DISPLAY_STATUS = "CASE fr.workflow_state {} ELSE 'unknown' END".format(
+    " ".join(f"WHEN '{state}' THEN '{status}'" for state, status in _WF_DISPLAY_STATUS.items())
+)
+_SQL_WF_LIMIT_WEIGHT = "CASE WHEN fr.workflow_state IN ({}) THEN COALESCE(fr.counts_toward_limit, 1) ELSE 0 END".format(
+    ", ".join(f"'{state}'" for state in _WF_COUNTED_STATES)
+)
+
+_Q_USER_NOMINATIONS_STATUS = f"""
+    SELECT fr.request_id, fr.reviewer_id, fr.external_reviewer_email,
+           fr.relationship_type, fr.workflow_state, fr.approval_status,
+           fr.reviewer_status, fr.created_at, fr.rejection_reason,
+           fr.reviewer_rejection_reason, fr.counts_toward_limit,
+           u.first_name, u.last_name, u.designation, u.vertical,
+           {_SQL_WF_DISPLAY_STATUS} AS display_status,
+           {_SQL_WF_LIMIT_WEIGHT} AS limit_weight
+    FROM feedback_requests fr
+    LEFT JOIN users u ON fr.reviewer_id = u.user_type_id
+    WHERE fr.requester_id = ? AND fr.cycle_id = ? AND COALESCE(fr.is_active,1) = 1
+    ORDER BY fr.created_at ASC
+"""
+
+def get_user_nominations_status(user_id, conn=None):
     """Get current user's nomination status and existing nominations (includes externals)."""
-    conn = get_connection()
+    conn = conn or get_connection()
     try:
-        active_cycle = get_active_review_cycle()
+        active_cycle = get_active_review_cycle(conn=conn)
         if not active_cycle:
             return {
                 "existing_nominations": [],
@@ -1010,23 +1217,13 @@ def get_user_nominations_status(user_id):
             }
 
         cycle_id = active_cycle["cycle_id"]
-        query = """
-            SELECT fr.request_id, fr.reviewer_id, fr.external_reviewer_email,
-                   fr.relationship_type, fr.workflow_state, fr.approval_status,
-                   fr.reviewer_status, fr.created_at, fr.rejection_reason,
-                   fr.reviewer_rejection_reason, fr.counts_toward_limit,
-                   u.first_name, u.last_name, u.designation, u.vertical
-            FROM feedback_requests fr
-            LEFT JOIN users u ON fr.reviewer_id = u.user_type_id
-            WHERE fr.requester_id = ? AND fr.cycle_id = ? AND COALESCE(fr.is_active,1) = 1
-            ORDER BY fr.created_at ASC
-        """
-        result = conn.execute(query, (user_id, cycle_id))
+        result = conn.execute(_Q_USER_NOMINATIONS_STATUS, (user_id, cycle_id))
 
         active_nominations = []
         rejected_nominations = []
+        limit_count = 0
 
-        for row in result.fetchall():
+        for row in result:
             if row[2]:  # external
                 reviewer_name = (
                     row[2].strip()
@@ -1070,7 +1267,7 @@ def get_user_nominations_status(user_id):
                 "created_at": row[7],
                 "rejection_reason": row[8],
                 "reviewer_rejection_reason": row[9],
-                "status": _wf_get_display_status(row[4]),
+                "status": row[15],
                 "reviewer_status_label": _wf_get_reviewer_status_label(row[4], row[5], row[6]),
                 "reviewer_identifier": reviewer_identifier,
                 "counts_toward_limit": counts_value,
@@ -1080,13 +1277,7 @@ def get_user_nominations_status(user_id):
                 rejected_nominations.append(data)
             else:
                 active_nominations.append(data)
-
-        limit_count = sum(
-            nom["counts_toward_limit"]
-            if _wf_should_count(nom["workflow_state"])
-            else 0
-            for nom in active_nominations
-        )
+                limit_count += int(row[16])
 
         return {
             "existing_nominations": active_nominations,
@@ -1162,7 +1353,7 @@ def get_draft_responses(request_id):
     try:
         result = conn.execute(query, (request_id,))
         drafts = {}
-        for row in result.fetchall():
+        for row in result:
             drafts[row[0]] = {
                 'response_value': row[1],
                 'rating_value': row[2]
@@ -1172,75 +1363,103 @@ def get_draft_responses(request_id):
         logger.error(f"Error fetching draft responses: {e}")
         return {}
 
+_UPSERT_DRAFT_SQL = """
+    INSERT INTO draft_responses (request_id, question_id, response_value, rating_value)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(request_id, question_id) DO UPDATE SET
+    response_value = excluded.response_value,
+    rating_value = excluded.rating_value,
+    saved_at = CURRENT_TIMESTAMP
+"""
+
+@lru_cache(maxsize=64)
+def _insert_responses_sql(row_count):
+    """Multi-row feedback_responses INSERT, generated once per row count."""
+    values_clause = ", ".join(["(?, ?, ?, ?)"] * row_count)
+    return f"""
+        INSERT INTO feedback_responses (request_id, question_id, response_value, rating_value)
+        VALUES {values_clause}
+    """
+
 def save_draft_response(request_id, question_id, response_value, rating_value=None):
     """Save draft response for partial completion."""
     conn = get_connection()
     try:
-        query = """
-            INSERT INTO draft_responses (request_id, question_id, response_value, rating_value)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(request_id, question_id) DO UPDATE SET
-            response_value = excluded.response_value,
-            rating_value = excluded.rating_value,
-            saved_at = CURRENT_TIMESTAMP
-        """
-        conn.execute(query, (request_id, question_id, response_value, rating_value))
+        conn.execute(_UPSERT_DRAFT_SQL, (request_id, question_id, response_value, rating_value))
         conn.commit()
         return True
     except Exception as e:
         logger.error(f"Error saving draft: {e}")
         return False
 
+_Q_SUBMIT_NOTIFICATION_DETAILS = """
+    SELECT req_user.first_name || ' ' || req_user.last_name as requester_name,
+           req_user.email as requester_email,
+           fr.reviewer_name_cached as reviewer_name,
+           cycle.cycle_name
+    FROM feedback_requests fr
+    JOIN users req_user ON fr.requester_id = req_user.user_type_id
+    LEFT JOIN review_cycles cycle ON fr.cycle_id = cycle.cycle_id
+    WHERE fr.request_id = ?
+"""
+
+# Same as above for databases where the *_cached columns have not been migrated yet
+_Q_SUBMIT_NOTIFICATION_DETAILS_JOINED = """
+    SELECT req_user.first_name || ' ' || req_user.last_name as requester_name,
+           req_user.email as requester_email,
+           rev_user.first_name || ' ' || rev_user.last_name as reviewer_name,
+           cycle.cycle_name
+    FROM feedback_requests fr
+    JOIN users req_user ON fr.requester_id = req_user.user_type_id
+    LEFT JOIN users rev_user ON fr.reviewer_id = rev_user.user_type_id
+    LEFT JOIN review_cycles cycle ON fr.cycle_id = cycle.cycle_id
+    WHERE fr.request_id = ?
+"""
+
 def submit_final_feedback(request_id, responses):
     """Submit completed feedback and move from draft to final."""
     conn = get_connection()
     try:
-        # Insert final responses
-        for question_id, response_data in responses.items():
-            response_val = response_data.get('response_value')
-            rating_val = response_data.get('rating_value')
+        # Responses, status and draft cleanup commit together, so a failure cannot
+        # leave final responses on an uncompleted request (and a retry duplicate them)
+        with conn.transaction() as tx:
+            # Insert final responses as one multi-row INSERT
+            if responses:
+                response_params = []
+                for question_id, response_data in responses.items():
+                    response_params.extend((
+                        request_id,
+                        question_id,
+                        response_data.get('response_value'),
+                        response_data.get('rating_value'),
+                    ))
+                tx.execute(_insert_responses_sql(len(responses)), tuple(response_params))
             
-            response_query = """
-                INSERT INTO feedback_responses (request_id, question_id, response_value, rating_value)
-                VALUES (?, ?, ?, ?)
-            """
-            conn.execute(response_query, (request_id, question_id, response_val, rating_val))
-        
-        # Update request status
-        update_query = """
-            UPDATE feedback_requests 
-            SET reviewer_status = 'completed', completed_at = CURRENT_TIMESTAMP,
-                workflow_state = 'completed'
-            WHERE request_id = ?
-        """
-        conn.execute(update_query, (request_id,))
-        
-        # Delete draft responses
-        delete_query = "DELETE FROM draft_responses WHERE request_id = ?"
-        conn.execute(delete_query, (request_id,))
-        
-        conn.commit()
+            # Update request status
+            tx.execute("""
+                UPDATE feedback_requests 
+                SET reviewer_status = 'completed', completed_at = CURRENT_TIMESTAMP,
+                    workflow_state = 'completed'
+                WHERE request_id = ?
+            """, (request_id,))
+            
+            # Delete draft responses
+            tx.execute("DELETE FROM draft_responses WHERE request_id = ?", (request_id,))
         
         # Send notification email
         try:
-            from services.email_service import send_feedback_submitted_notification
+            from services.email_service import send_feedback_submitted_notification, send_email_in_background
             # Get request details
-            details_query = """
-                SELECT req_user.first_name || ' ' || req_user.last_name as requester_name,
-                       req_user.email as requester_email,
-                       rev_user.first_name || ' ' || rev_user.last_name as reviewer_name,
-                       cycle.cycle_name
-                FROM feedback_requests fr
-                JOIN users req_user ON fr.requester_id = req_user.user_type_id
-                LEFT JOIN users rev_user ON fr.reviewer_id = rev_user.user_type_id
-                LEFT JOIN review_cycles cycle ON fr.cycle_id = cycle.cycle_id
-                WHERE fr.request_id = ?
-            """
+            details_query = (
+                _Q_SUBMIT_NOTIFICATION_DETAILS if _feedback_request_name_cache_ready(conn)
+                else _Q_SUBMIT_NOTIFICATION_DETAILS_JOINED
+            )
             details_result = conn.execute(details_query, (request_id,))
             details = details_result.fetchone()
             
             if details:
-                send_feedback_submitted_notification(
+                send_email_in_background(
+                    send_feedback_submitted_notification,
                     requester_email=details[1],
                     requester_name=details[0],
                     reviewer_name=details[2] or "External Reviewer",
@@ -1255,140 +1474,181 @@ def submit_final_feedback(request_id, responses):
         conn.rollback()
         return False, str(e)
 
+_Q_ANON_FEEDBACK = """
+    SELECT fr.request_id, fr.relationship_type, fr.completed_at,
+           fq.question_text, fres.response_value, fres.rating_value, fq.question_type,
+           fq.sort_order
+    FROM feedback_requests fr
+    JOIN feedback_responses fres ON fr.request_id = fres.request_id
+    JOIN feedback_questions fq ON fres.question_id = fq.question_id
+    WHERE fr.requester_id = ?
+      AND fr.workflow_state = 'completed'
+      AND fr.cycle_id = ?
+    ORDER BY fr.request_id, fq.sort_order ASC
+"""
+
+def _active_cycle_id():
+    """Cached active cycle id, or None when no cycle is active."""
+    active_cycle = get_active_review_cycle()
+    return active_cycle['cycle_id'] if active_cycle else None
+
+def _anonymized_feedback_query(user_id, cycle_id=None):
+    """Build (query, params) for a user's completed, anonymized feedback responses.
+    Without a cycle_id the (cached) active cycle is bound directly instead of joining review_cycles;
+    with no active cycle the NULL id matches nothing, as the old join did.
+    """
+    return _Q_ANON_FEEDBACK, (user_id, cycle_id or _active_cycle_id())
+
+def _responses_in_question_order(responses):
+    """Sort a request's grouped responses by question sort_order (NULLs first, as in SQL) and drop the key."""
+    responses.sort(key=lambda response: (response['sort_order'] is not None, response['sort_order'] or 0))
+    for response in responses:
+        del response['sort_order']
+    return responses
+
 def get_anonymized_feedback_for_user(user_id, cycle_id=None):
     """Get completed feedback received by a user (anonymized - no reviewer names).
     Defaults to the active cycle unless a specific cycle_id is provided.
     """
     conn = get_connection()
-    base_query = """
-        SELECT fr.request_id, fr.relationship_type, fr.completed_at,
-               fq.question_text, fres.response_value, fres.rating_value, fq.question_type
-        FROM feedback_requests fr
-        JOIN feedback_responses fres ON fr.request_id = fres.request_id
-        JOIN feedback_questions fq ON fres.question_id = fq.question_id
-        JOIN review_cycles rc ON fr.cycle_id = rc.cycle_id
-        WHERE fr.requester_id = ?
-          AND fr.workflow_state = 'completed'
+    response_query, params = _anonymized_feedback_query(user_id, cycle_id)
+    # Group server-side: one row per request with its responses packed as a JSON array.
+    # Aggregate order is not guaranteed, so each element carries sort_order for the Python sort.
+    grouped_query = f"""
+        SELECT request_id, relationship_type, completed_at,
+               json_group_array(json_object(
+                   'question_text', question_text,
+                   'response_value', response_value,
+                   'rating_value', rating_value,
+                   'question_type', question_type,
+                   'sort_order', sort_order
+               ))
+        FROM ({response_query})
+        GROUP BY request_id, relationship_type, completed_at
+        ORDER BY request_id
     """
-    params = [user_id]
-    if cycle_id:
-        base_query += " AND fr.cycle_id = ?"
-        params.append(cycle_id)
-    else:
-        base_query += " AND rc.is_active = 1"
-    base_query += " ORDER BY fr.request_id, fq.sort_order ASC"
-    try:
-        result = conn.execute(base_query, tuple(params))
-        feedback_groups = {}
-        for row in result.fetchall():
-            request_id = row[0]
-            if request_id not in feedback_groups:
-                feedback_groups[request_id] = {
-                    'relationship_type': row[1],
-                    'completed_at': row[2],
-                    'responses': []
-                }
-            feedback_groups[request_id]['responses'].append({
-                'question_text': row[3],
-                'response_value': row[4],
-                'rating_value': row[5],
-                'question_type': row[6]
-            })
-        return feedback_groups
+    try:
+        result = conn.execute(grouped_query, params)
+        return {
+            row[0]: {
+                'relationship_type': row[1],
+                'completed_at': row[2],
+                'responses': _responses_in_question_order(json.loads(row[3]))
+            }
+            for row in result
+        }
     except Exception as e:
         logger.error(f"Error fetching anonymized feedback: {e}")
         return {}
 
-def get_feedback_progress_for_user(user_id):
-    """Get feedback request progress for a user showing anonymized completion status for the current active cycle only."""
-    conn = get_connection()
-    query = """
+def _empty_feedback_progress():
+    return {'total_requests': 0, 'completed_requests': 0, 'pending_requests': 0, 'awaiting_approval': 0}
+
+@lru_cache(maxsize=64)
+def _progress_query(user_count):
+    """Active-cycle progress query for user_count requesters, generated once per size."""
+    placeholders = ",".join(["?"] * user_count)
+    return f"""
         SELECT 
+            fr.requester_id,
             COUNT(*) as total_requests,
             COALESCE(SUM(CASE WHEN fr.workflow_state = 'completed' THEN 1 ELSE 0 END), 0) as completed_requests,
             COALESCE(SUM(CASE WHEN fr.approval_status = 'approved' THEN 1 ELSE 0 END), 0) as pending_requests,
             COALESCE(SUM(CASE WHEN fr.approval_status = 'pending' THEN 1 ELSE 0 END), 0) as awaiting_approval
         FROM feedback_requests fr
-        JOIN review_cycles rc ON fr.cycle_id = rc.cycle_id
-        WHERE fr.requester_id = ? 
+        WHERE fr.requester_id IN ({placeholders})
             AND fr.approval_status != 'rejected'
-            AND rc.is_active = 1
+            AND fr.cycle_id = ?
+        GROUP BY fr.requester_id
     """
+
+def get_feedback_progress_for_users(user_ids):
+    """Get active-cycle feedback progress for many requesters in one query, keyed by user id."""
+    user_ids = list(dict.fromkeys(user_ids))
+    progress_by_user = {user_id: _empty_feedback_progress() for user_id in user_ids}
+    cycle_id = _active_cycle_id()
+    if not user_ids or not cycle_id:
+        return progress_by_user
+    
+    conn = get_connection()
     try:
-        result = conn.execute(query, (user_id,))
-        progress = result.fetchone()
-        if progress:
-            return {
-                'total_requests': progress[0],
-                'completed_requests': progress[1], 
-                'pending_requests': progress[2],
-                'awaiting_approval': progress[3]
+        result = conn.execute(_progress_query(len(user_ids)), (*user_ids, cycle_id))
+        for row in result:
+            progress_by_user[row[0]] = {
+                'total_requests': row[1],
+                'completed_requests': row[2], 
+                'pending_requests': row[3],
+                'awaiting_approval': row[4]
             }
-        return {'total_requests': 0, 'completed_requests': 0, 'pending_requests': 0, 'awaiting_approval': 0}
+        return progress_by_user
     except Exception as e:
         logger.error(f"Error fetching feedback progress: {e}")
-        return {'total_requests': 0, 'completed_requests': 0, 'pending_requests': 0, 'awaiting_approval': 0}
+        return progress_by_user
+
+def get_feedback_progress_for_user(user_id):
+    """Get feedback request progress for a user showing anonymized completion status for the current active cycle only."""
+    return get_feedback_progress_for_users([user_id])[user_id]
+
+# Names come from the denormalized *_cached columns (set on insert, renames follow via triggers).
+# One statement for both cases: a NULL cycle_id disables the cycle filter.
+_Q_FEEDBACK_BY_CYCLE = """
+    SELECT fr.request_id, fr.reviewer_id, fr.relationship_type, fr.workflow_state AS status,
+           fr.submitted_at, fr.cycle_id, fr.cycle_display_name_cached AS cycle_name,
+           fr.reviewer_name_cached AS reviewer_name
+    FROM feedback_requests fr
+    WHERE fr.requester_id = ? AND fr.workflow_state = 'completed'
+      AND fr.reviewer_name_cached IS NOT NULL
+      AND (? IS NULL OR fr.cycle_id = ?)
+    ORDER BY fr.submitted_at DESC
+"""
+
+# Join-based equivalent, used until the *_cached columns are known to exist
+_Q_FEEDBACK_BY_CYCLE_JOINED = """
+    SELECT fr.request_id, fr.reviewer_id, fr.relationship_type, fr.workflow_state AS status,
+           fr.submitted_at, fr.cycle_id, rc.cycle_display_name AS cycle_name,
+           TRIM(COALESCE(u.first_name, '') || ' ' || COALESCE(u.last_name, '')) AS reviewer_name
+    FROM feedback_requests fr
+    JOIN users u ON fr.reviewer_id = u.user_type_id
+    LEFT JOIN review_cycles rc ON fr.cycle_id = rc.cycle_id
+    WHERE fr.requester_id = ? AND fr.workflow_state = 'completed'
+      AND (? IS NULL OR fr.cycle_id = ?)
+    ORDER BY fr.submitted_at DESC
+"""
 
 def get_feedback_by_cycle(user_id, cycle_id=None):
     """Get user's feedback results filtered by cycle."""
     conn = get_connection()
-    query = """
-        SELECT fr.request_id, fr.reviewer_id, fr.relationship_type, fr.workflow_state,
-               fr.submitted_at, fr.cycle_id, rc.cycle_display_name,
-               u.first_name, u.last_name
-        FROM feedback_requests fr
-        JOIN users u ON fr.reviewer_id = u.user_type_id
-        LEFT JOIN review_cycles rc ON fr.cycle_id = rc.cycle_id
-        WHERE fr.requester_id = ? AND fr.workflow_state = 'completed'
-    """
-    params = [user_id]
-    if cycle_id:
-        query += " AND fr.cycle_id = ?"
-        params.append(cycle_id)
-    
-    query += " ORDER BY fr.submitted_at DESC"
-    
+    cycle_id = cycle_id or None
     try:
-        result = conn.execute(query, tuple(params))
-        feedback_list = []
-        for row in result.fetchall():
-            feedback_list.append({
-                'request_id': row[0],
-                'reviewer_id': row[1],
-                'relationship_type': row[2],
-                'status': row[3],
-                'submitted_at': row[4],
-                'cycle_id': row[5],
-                'cycle_name': row[6],
-                'reviewer_name': f"{row[7]} {row[8]}".strip()
-            })
-        return feedback_list
+        query = _Q_FEEDBACK_BY_CYCLE if _feedback_request_name_cache_ready(conn) else _Q_FEEDBACK_BY_CYCLE_JOINED
+        return conn.execute(query, (user_id, cycle_id, cycle_id)).fetchall_dicts()
     except Exception as e:
         logger.error(f"Error fetching feedback by cycle: {e}")
         return []
 
+def iter_feedback_excel_rows(user_id, cycle_id=None):
+    """Yield Excel-ready rows for a user's feedback, one per response row from the database."""
+    conn = get_connection()
+    try:
+        result = conn.execute(*_anonymized_feedback_query(user_id, cycle_id))
+    except Exception as e:
+        logger.error(f"Error fetching feedback for Excel export: {e}")
+        return
+    
+    for request_id, relationship_type, completed_at, question_text, response_value, rating_value, question_type, _ in result:
+        yield {
+            'Review_Number': f"Review_{request_id}",
+            'Relationship_Type': relationship_type.replace('_', ' ').title(),
+            'Question': question_text,
+            'Question_Type': question_type,
+            'Rating': rating_value if rating_value else '',
+            'Text_Response': response_value if response_value else '',
+            'Completed_Date': completed_at
+        }
+
 def generate_feedback_excel_data(user_id, cycle_id=None):
     """Generate Excel-ready data for a user's feedback."""
-    feedback_data = get_anonymized_feedback_for_user(user_id, cycle_id)
-    
-    excel_rows = []
-    
-    for request_id, feedback in feedback_data.items():
-        relationship_type = feedback['relationship_type']
-        completed_at = feedback['completed_at']
-        
-        for response in feedback['responses']:
-            excel_rows.append({
-                'Review_Number': f"Review_{request_id}",
-                'Relationship_Type': relationship_type.replace('_', ' ').title(),
-                'Question': response['question_text'],
-                'Question_Type': response['question_type'],
-                'Rating': response['rating_value'] if response['rating_value'] else '',
-                'Text_Response': response['response_value'] if response['response_value'] else '',
-                'Completed_Date': completed_at
-            })
-    
-    return excel_rows
+    return list(iter_feedback_excel_rows(user_id, cycle_id))
 
 # =====================================================
 # USER MANAGEMENT AND RELATIONSHIP FUNCTIONS
@@ -1405,7 +1665,6 @@ def get_direct_reports(manager_email):
             ORDER BY first_name, last_name
         """
         result = conn.execute(query, (manager_email,))
-        rows = result.fetchall()
         return [
             {
                 'user_type_id': r[0],
@@ -1414,27 +1673,27 @@ def get_direct_reports(manager_email):
                 'vertical': r[4],
                 'designation': r[5],
             }
-            for r in rows
+            for r in result
         ]
     except Exception as e:
         logger.error(f"Error fetching direct reports for {manager_email}: {e}")
         return []
 
-def has_direct_reports(user_email):
+def has_direct_reports(user_email, conn=None):
     """Check if a user has any direct reports."""
-    conn = get_connection()
+    conn = conn or get_connection()
     try:
-        query = "SELECT COUNT(*) FROM users WHERE reporting_manager_email = ? AND is_active = 1;"
+        # EXISTS stops at the first matching report instead of counting them all
+        query = "SELECT EXISTS (SELECT 1 FROM users WHERE reporting_manager_email = ? AND is_active = 1);"
         result = conn.execute(query, (user_email,))
-        count = result.fetchone()[0]
-        return count > 0
+        return bool(result.fetchone()[0])
     except Exception as e:
         logger.error(f"Error checking for direct reports for {user_email}: {e}")
         return False
 
-def get_user_direct_manager(user_id):
+def get_user_direct_manager(user_id, conn=None):
     """Get the user's direct manager information."""
-    conn = get_connection()
+    conn = conn or get_connection()
     try:
         query = """
             SELECT m.user_type_id, m.first_name, m.last_name, m.email, m.designation
@@ -1459,6 +1718,26 @@ def get_user_direct_manager(user_id):
         logger.error(f"Error getting user's direct manager: {e}")
         return None
 
+# (vertical, email, reporting_manager_email) of the users a relationship is derived from
+_RELATIONSHIP_USER_COLUMNS = "user_type_id, vertical, email, reporting_manager_email"
+
+def _classify_relationship(requester, reviewer):
+    """Relationship type from (vertical, email, reporting_manager_email) tuples; raises ValueError for the manager."""
+    requester_vertical, requester_email, requester_manager_email = requester
+    reviewer_vertical, reviewer_email, reviewer_manager_email = reviewer
+    
+    # Check if reviewer is the requester's manager
+    if reviewer_email == requester_manager_email:
+        raise ValueError("Cannot request feedback from your direct manager")
+    
+    # Check if reviewer reports to requester
+    if reviewer_manager_email == requester_email:
+        return "direct_reportee"
+    # Check if same team/vertical
+    if requester_vertical == reviewer_vertical:
+        return "peer"
+    return "internal_collaborator"
+
 def determine_relationship_type(requester_id, reviewer_id):
     """
     Automatically determine relationship type based on organizational structure.
@@ -1469,6 +1748,12 @@ def determine_relationship_type(requester_id, reviewer_id):
     3) Reviewer reports to requester -> direct_reportee
     4) Cannot request feedback from your own manager (should be blocked at UI level)
     """
+    # Only successful classifications are cached; the manager case always re-raises
+    cache_key = f"relationship:{requester_id}:{reviewer_id}"
+    cached = get_cached_value(cache_key, USER_CACHE_SECONDS)
+    if cached is not None:
+        return cached
+    
     conn = get_connection()
     try:
         # Get both users' information
@@ -1476,8 +1761,8 @@ def determine_relationship_type(requester_id, reviewer_id):
             SELECT 
                 r.vertical as requester_vertical, r.email as requester_email,
                 r.reporting_manager_email as requester_manager_email,
-                rv.vertical as reviewer_vertical, rv.reporting_manager_email as reviewer_manager_email,
-                rv.email as reviewer_email
+                rv.vertical as reviewer_vertical, rv.email as reviewer_email,
+                rv.reporting_manager_email as reviewer_manager_email
             FROM users r, users rv
             WHERE r.user_type_id = ? AND rv.user_type_id = ?
             AND r.is_active = 1 AND rv.is_active = 1
@@ -1488,26 +1773,9 @@ def determine_relationship_type(requester_id, reviewer_id):
         if not data:
             raise ValueError("User data not found")
         
-        requester_vertical = data[0]
-        requester_email = data[1]
-        requester_manager_email = data[2]
-        reviewer_vertical = data[3]
-        reviewer_manager_email = data[4]
-        reviewer_email = data[5]
-        
-        # Check if reviewer is the requester's manager
-        if reviewer_email == requester_manager_email:
-            raise ValueError("Cannot request feedback from your direct manager")
-        
-        # Check if reviewer reports to requester
-        if reviewer_manager_email == requester_email:
-            return "direct_reportee"
-        
-        # Check if same team/vertical
-        if requester_vertical == reviewer_vertical:
-            return "peer"
-        else:
-            return "internal_collaborator"
+        relationship_type = _classify_relationship(tuple(data[0:3]), tuple(data[3:6]))
+        set_cached_value(cache_key, relationship_type, USER_CACHE_SECONDS)
+        return relationship_type
             
     except Exception as e:
         logger.error(f"Error determining relationship type: {e}")
@@ -1522,17 +1790,44 @@ def get_relationship_with_preview(requester_id, reviewer_list):
         requester_id: ID of the user requesting feedback
         reviewer_list: List of reviewer identifiers (user IDs or emails)
     """
+    # Load the requester and every uncached internal reviewer in one query
+    known = {
+        reviewer_identifier: get_cached_value(f"relationship:{requester_id}:{reviewer_identifier}", USER_CACHE_SECONDS)
+        for reviewer_identifier in reviewer_list
+        if isinstance(reviewer_identifier, int)
+    }
+    uncached_ids = [reviewer_id for reviewer_id, relationship_type in known.items() if relationship_type is None]
+    users_by_id = {}
+    if uncached_ids:
+        lookup_ids = [requester_id, *uncached_ids]
+        placeholders = ",".join(["?"] * len(lookup_ids))
+        try:
+            result = get_connection().execute(
+                f"SELECT {_RELATIONSHIP_USER_COLUMNS} FROM users WHERE is_active = 1 AND user_type_id IN ({placeholders})",
+                lookup_ids,
+            )
+            users_by_id = {row[0]: tuple(row[1:4]) for row in result}
+        except Exception as e:
+            logger.error(f"Error loading users for relationship preview: {e}")
+    
     relationships = []
     for reviewer_identifier in reviewer_list:
         if isinstance(reviewer_identifier, int):
             # Internal reviewer
-            try:
-                relationship_type = determine_relationship_type(requester_id, reviewer_identifier)
-                relationships.append((reviewer_identifier, relationship_type))
-            except ValueError as e:
-                # Skip invalid relationships (like requesting from direct manager)
-                logger.warning(f"Skipping invalid relationship: {e}")
-                continue
+            relationship_type = known[reviewer_identifier]
+            if relationship_type is None:
+                requester = users_by_id.get(requester_id)
+                reviewer = users_by_id.get(reviewer_identifier)
+                try:
+                    if not requester or not reviewer:
+                        raise ValueError("User data not found")
+                    relationship_type = _classify_relationship(requester, reviewer)
+                except ValueError as e:
+                    # Skip invalid relationships (like requesting from direct manager)
+                    logger.warning(f"Skipping invalid relationship: {e}")
+                    continue
+                set_cached_value(f"relationship:{requester_id}:{reviewer_identifier}", relationship_type, USER_CACHE_SECONDS)
+            relationships.append((reviewer_identifier, relationship_type))
         else:
             # External reviewer - always external_stakeholder
             relationships.append((reviewer_identifier, "external_stakeholder"))
@@ -1554,6 +1849,7 @@ def update_user_details(user_id, first_name, last_name, vertical, designation, r
     try:
         conn.execute(query, (first_name, last_name, vertical, designation, reporting_manager_email, user_id))
         conn.commit()
+        invalidate_user_cache()
         return True
     except Exception as e:
         logger.error(f"Error updating user details: {e}")
@@ -1563,54 +1859,42 @@ def get_all_users_by_vertical(vertical):
     """Get all users from a specific vertical."""
     conn = get_connection()
     query = """
-        SELECT u.user_type_id, u.first_name, u.last_name, u.vertical, u.designation
+        SELECT u.user_type_id, u.first_name || ' ' || u.last_name AS name, u.vertical, u.designation
         FROM users u
         WHERE u.vertical = ? AND u.is_active = 1
         ORDER BY u.first_name, u.last_name
     """
     try:
-        result = conn.execute(query, (vertical,))
-        users = []
-        for row in result.fetchall():
-            users.append({
-                "user_type_id": row[0],
-                "name": f"{row[1]} {row[2]}",
-                "vertical": row[3],
-                "designation": row[4],
-            })
-        return users
+        return conn.execute(query, (vertical,)).fetchall_dicts()
     except Exception as e:
         logger.error(f"Error fetching users by vertical: {e}")
         return []
 
-def get_all_users():
-    """Get all users for email reminder purposes."""
+_Q_ALL_USERS = """
+    SELECT user_type_id, email, first_name || ' ' || last_name AS name,
+           first_name, last_name, designation, vertical, is_active
+    FROM users 
+    ORDER BY first_name, last_name
+"""
+
+def iter_all_users():
+    """Yield all users one dict at a time, for callers that walk the list once (e.g. reminder sends)."""
     conn = get_connection()
     try:
-        query = """
-            SELECT user_type_id, email, first_name, last_name, designation, vertical, is_active
-            FROM users 
-            ORDER BY first_name, last_name
-        """
-        result = conn.execute(query)
-        
-        users = []
-        for row in result.fetchall():
-            users.append({
-                'user_type_id': row[0],
-                'email': row[1],
-                'name': f"{row[2]} {row[3]}",
-                'first_name': row[2],
-                'last_name': row[3],
-                'designation': row[4],
-                'vertical': row[5],
-                'is_active': bool(row[6])
-            })
-        
-        return users
+        result = conn.execute(_Q_ALL_USERS)
     except Exception as e:
         logger.error(f"Error fetching all users: {e}")
-        return []
+        return
+    
+    columns = [col[0] for col in result.description]
+    for row in result:
+        user = dict(zip(columns, row))
+        user['is_active'] = bool(user['is_active'])
+        yield user
+
+def get_all_users():
+    """Get all users for email reminder purposes."""
+    return list(iter_all_users())
 
 # =====================================================
 # ANALYTICS AND REPORTING FUNCTIONS
@@ -1622,38 +1906,26 @@ def get_hr_dashboard_metrics():
     try:
         metrics = {}
         
-        # Total users
-        total_users_result = conn.execute("SELECT COUNT(*) FROM users WHERE is_active = 1")
-        total_users = total_users_result.fetchone()[0]
-        
         # Check if there's an active cycle
-        active_cycle_result = conn.execute("SELECT cycle_id FROM review_cycles WHERE is_active = 1")
-        active_cycle = active_cycle_result.fetchone()
+        active_cycle = get_active_review_cycle()
         
         if active_cycle:
-            cycle_id = active_cycle[0]
-            
-            # Pending feedback requests (only for active cycle)
-            pending_result = conn.execute(
-                "SELECT COUNT(*) FROM feedback_requests WHERE approval_status = 'approved' AND cycle_id = ?"
-                , (cycle_id,))
-            pending_requests = pending_result.fetchone()[0]
-            
-            # Completed feedback this month (only for active cycle)
-            completed_result = conn.execute("""
-                SELECT COUNT(*) FROM feedback_requests 
-                WHERE status = 'completed' AND cycle_id = ? AND DATE(completed_at) >= DATE('now', 'start of month')
-            """, (cycle_id,))
-            completed_this_month = completed_result.fetchone()[0]
-            
-            # Users with incomplete reviews (only for active cycle)
-            incomplete_result = conn.execute("""
-                SELECT COUNT(DISTINCT reviewer_id) FROM feedback_requests 
-                WHERE approval_status = 'approved' AND cycle_id = ?
-            """, (cycle_id,))
-            incomplete_reviews = incomplete_result.fetchone()[0]
-            
+            # Total users plus the active-cycle counts in a single pass over feedback_requests
+            metrics_result = conn.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM users WHERE is_active = 1),
+                    COALESCE(SUM(CASE WHEN approval_status = 'approved' THEN 1 ELSE 0 END), 0),
+                    COALESCE(SUM(CASE WHEN status = 'completed'
+                                       AND DATE(completed_at) >= DATE('now', 'start of month')
+                                      THEN 1 ELSE 0 END), 0),
+                    COUNT(DISTINCT CASE WHEN approval_status = 'approved' THEN reviewer_id END)
+                FROM feedback_requests
+                WHERE cycle_id = ?
+            """, (active_cycle['cycle_id'],))
+            total_users, pending_requests, completed_this_month, incomplete_reviews = metrics_result.fetchone()
         else:
+            total_users_result = conn.execute("SELECT COUNT(*) FROM users WHERE is_active = 1")
+            total_users = total_users_result.fetchone()[0]
             pending_requests = 0
             completed_this_month = 0
             incomplete_reviews = 0
@@ -1675,13 +1947,12 @@ def get_users_with_pending_reviews():
     conn = get_connection()
     
     # Check if there's an active cycle
-    active_cycle_result = conn.execute("SELECT cycle_id FROM review_cycles WHERE is_active = 1")
-    active_cycle = active_cycle_result.fetchone()
+    active_cycle = get_active_review_cycle()
     
     if not active_cycle:
         return []  # No active cycle, no pending reviews
     
-    cycle_id = active_cycle[0]
+    cycle_id = active_cycle['cycle_id']
     
     query = """
         SELECT u.user_type_id, u.first_name, u.last_name, u.vertical, u.email,
@@ -1695,7 +1966,7 @@ def get_users_with_pending_reviews():
     try:
         result = conn.execute(query, (cycle_id,))
         users = []
-        for row in result.fetchall():
+        for row in result:
             users.append({
                 'user_type_id': row[0],
                 'name': f"{row[1]} {row[2]}",
@@ -1708,6 +1979,23 @@ def get_users_with_pending_reviews():
         logger.error(f"Error fetching users with pending reviews: {e}")
         return []
 
+_Q_HR_REJECTIONS = """
+    SELECT rt.tracking_id, rt.rejection_type, rt.rejected_at,
+           rt.rejection_reason, rt.viewed_by_hr,
+           u1.first_name || ' ' || u1.last_name as requester_name,
+           u1.email as requester_email,
+           COALESCE(u2.first_name || ' ' || u2.last_name, fr.external_reviewer_email) as reviewer_name,
+           u3.first_name || ' ' || u3.last_name as rejected_by_name,
+           fr.relationship_type
+    FROM rejection_tracking rt
+    JOIN users u1 ON rt.requester_id = u1.user_type_id
+    LEFT JOIN users u2 ON rt.rejected_reviewer_id = u2.user_type_id
+    LEFT JOIN users u3 ON rt.rejected_by = u3.user_type_id
+    JOIN feedback_requests fr ON rt.request_id = fr.request_id
+    WHERE rt.cycle_id = ?
+    ORDER BY rt.rejected_at DESC
+"""
+
 def get_hr_rejections_dashboard():
     """Get all rejections for HR monitoring (manager + reviewer)."""
     conn = get_connection()
@@ -1715,42 +2003,49 @@ def get_hr_rejections_dashboard():
         active_cycle = get_active_review_cycle()
         if not active_cycle:
             return []
-        query = """
-            SELECT rt.tracking_id, rt.rejection_type, rt.rejected_at,
-                   rt.rejection_reason, rt.viewed_by_hr,
-                   u1.first_name || ' ' || u1.last_name as requester_name,
-                   u1.email as requester_email,
-                   COALESCE(u2.first_name || ' ' || u2.last_name, fr.external_reviewer_email) as reviewer_name,
-                   u3.first_name || ' ' || u3.last_name as rejected_by_name,
-                   fr.relationship_type
-            FROM rejection_tracking rt
-            JOIN users u1 ON rt.requester_id = u1.user_type_id
-            LEFT JOIN users u2 ON rt.rejected_reviewer_id = u2.user_type_id
-            LEFT JOIN users u3 ON rt.rejected_by = u3.user_type_id
-            JOIN feedback_requests fr ON rt.request_id = fr.request_id
-            WHERE rt.cycle_id = ?
-            ORDER BY rt.rejected_at DESC
-        """
-        result = conn.execute(query, (active_cycle["cycle_id"],))
-        rejections = []
-        for row in result.fetchall():
-            rejections.append({
-                "tracking_id": row[0],
-                "rejection_type": row[1],
-                "rejected_at": row[2],
-                "rejection_reason": row[3],
-                "viewed_by_hr": row[4],
-                "requester_name": row[5],
-                "requester_email": row[6],
-                "reviewer_name": row[7],
-                "rejected_by_name": row[8],
-                "relationship_type": row[9]
-            })
-        return rejections
+        # Column names match the dashboard keys, so rows map straight to dicts
+        return conn.execute(_Q_HR_REJECTIONS, (active_cycle["cycle_id"],)).fetchall_dicts()
     except Exception as e:
         logger.error(f"Error fetching HR rejections dashboard: {e}")
         return []
 
+_Q_USERS_PROGRESS = """
+    WITH req AS (
+        SELECT requester_id,
+               COUNT(*) AS requested_count,
+               SUM(CASE WHEN approval_status = 'approved' THEN 1 ELSE 0 END) AS approved_count,
+               SUM(CASE WHEN reviewer_status = 'accepted' THEN 1 ELSE 0 END) AS accepted_count
+        FROM feedback_requests
+        WHERE cycle_id = ?
+        GROUP BY requester_id
+    ),
+    asg AS (
+        SELECT reviewer_id,
+               COUNT(*) AS assigned_count,
+               SUM(CASE WHEN workflow_state = 'completed' THEN 1 ELSE 0 END) AS completed_count
+        FROM feedback_requests
+        WHERE cycle_id = ? AND reviewer_id IS NOT NULL
+        GROUP BY reviewer_id
+    )
+    SELECT 
+        u.user_type_id,
+        u.first_name || ' ' || u.last_name AS name,
+        u.email,
+        u.vertical,
+        u.designation,
+        COALESCE(req.requested_count, 0) as requested_count,
+        CASE WHEN EXISTS (SELECT 1 FROM users m WHERE m.email = u.reporting_manager_email)
+             THEN COALESCE(req.approved_count, 0) ELSE 0 END as manager_approved_count,
+        COALESCE(req.accepted_count, 0) as respondent_approved_count,
+        COALESCE(asg.assigned_count, 0) as assigned_feedback_count,
+        COALESCE(asg.completed_count, 0) as completed_feedback_count
+    FROM users u
+    LEFT JOIN req ON req.requester_id = u.user_type_id
+    LEFT JOIN asg ON asg.reviewer_id = u.user_type_id
+    WHERE u.is_active = 1
+    ORDER BY u.first_name, u.last_name
+"""
+
 def get_users_progress_summary():
     """Get progress summary for all users in the current cycle for HR dashboard."""
     conn = get_connection()
@@ -1761,142 +2056,175 @@ def get_users_progress_summary():
         
         cycle_id = active_cycle['cycle_id']
         
-        # Get all users and their progress
-        query = """
-            SELECT 
-                u.user_type_id,
-                u.first_name,
-                u.last_name,
-                u.email,
-                u.vertical,
-                u.designation,
-                COUNT(DISTINCT fr_requested.request_id) as requested_count,
-                COUNT(DISTINCT CASE WHEN fr_requested.approval_status = 'approved' 
-                                  AND m.user_type_id IS NOT NULL THEN fr_requested.request_id END) as manager_approved_count,
-                COUNT(DISTINCT CASE WHEN fr_requested.reviewer_status = 'accepted' THEN fr_requested.request_id END) as respondent_approved_count,
-                COUNT(DISTINCT fr_assigned.request_id) as assigned_feedback_count,
-                COUNT(DISTINCT CASE WHEN fr_assigned.workflow_state = 'completed' THEN fr_assigned.request_id END) as completed_feedback_count
-            FROM users u
-            LEFT JOIN feedback_requests fr_requested ON u.user_type_id = fr_requested.requester_id 
-                AND fr_requested.cycle_id = ?
-            LEFT JOIN users m ON fr_requested.approval_status = 'approved' 
-                AND u.reporting_manager_email = m.email
-            LEFT JOIN feedback_requests fr_assigned ON u.user_type_id = fr_assigned.reviewer_id 
-                AND fr_assigned.cycle_id = ?
-            WHERE u.is_active = 1
-            GROUP BY u.user_type_id, u.first_name, u.last_name, u.email, u.vertical, u.designation
-            ORDER BY u.first_name, u.last_name
-        """
-        result = conn.execute(query, (cycle_id, cycle_id))
-        
-        users_progress = []
-        for row in result.fetchall():
-            users_progress.append({
-                'user_type_id': row[0],
-                'name': f"{row[1]} {row[2]}",
-                'email': row[3],
-                'vertical': row[4],
-                'designation': row[5],
-                'requested_count': row[6],
-                'manager_approved_count': row[7],
-                'respondent_approved_count': row[8],
-                'assigned_feedback_count': row[9],
-                'completed_feedback_count': row[10]
-            })
-        
-        return users_progress
+        # Aggregate each role once per cycle, then attach to users (no join fan-out)
+        return conn.execute(_Q_USERS_PROGRESS, (cycle_id, cycle_id)).fetchall_dicts()
     except Exception as e:
         logger.error(f"Error getting users progress summary: {e}")
         return []
 
-def get_reviewer_nomination_counts():
-    """Get current nomination counts for all reviewers in the active cycle."""
+# Short TTL: nomination writes in this process invalidate explicitly, the TTL covers other processes
+NOMINATION_COUNTS_CACHE_SECONDS = 5
+
+_Q_REVIEWER_NOMINATION_COUNTS = """
+    SELECT reviewer_id, COUNT(*) as nomination_count
+    FROM feedback_requests 
+    WHERE cycle_id = ? AND approval_status IN ('pending', 'approved')
+    GROUP BY reviewer_id
+"""
+
+def invalidate_nomination_counts():
+    """Drop cached reviewer nomination counts after a feedback_requests nomination/approval write."""
+    clear_cached_values("nomination_counts:")
+    clear_cached_values("users_for_selection:limits:")
+
+def get_reviewer_nomination_counts(cycle_id=None):
+    """Get current nomination counts for all reviewers in the active cycle.
+    
+    Callers that already hold the active cycle can pass its cycle_id to skip the lookup.
+    """
     conn = get_connection()
     try:
-        active_cycle = get_active_review_cycle()
-        if not active_cycle:
-            return {}
+        if cycle_id is None:
+            active_cycle = get_active_review_cycle(conn=conn)
+            if not active_cycle:
+                return {}
+            cycle_id = active_cycle['cycle_id']
         
-        cycle_id = active_cycle['cycle_id']
+        cache_key = f"nomination_counts:{cycle_id}"
+        cached = get_cached_value(cache_key, NOMINATION_COUNTS_CACHE_SECONDS)
+        if cached is not None:
+            return cached
         
         # Count active nominations (approved, pending approval) for each reviewer
-        query = """
-            SELECT reviewer_id, COUNT(*) as nomination_count
-            FROM feedback_requests 
-            WHERE cycle_id = ? AND approval_status IN ('pending', 'approved')
-            GROUP BY reviewer_id
-        """
-        result = conn.execute(query, (cycle_id,))
-        
-        nomination_counts = {}
-        for row in result.fetchall():
-            nomination_counts[row[0]] = row[1]
+        result = conn.execute(_Q_REVIEWER_NOMINATION_COUNTS, (cycle_id,))
         
+        nomination_counts = {row[0]: row[1] for row in result}
+        set_cached_value(cache_key, nomination_counts, NOMINATION_COUNTS_CACHE_SECONDS)
         return nomination_counts
     except Exception as e:
         logger.error(f"Error getting reviewer nomination counts: {e}")
         return {}
 
-def is_reviewer_at_limit(reviewer_id):
+_Q_REVIEWER_AT_LIMIT = """
+    SELECT COUNT(*) >= 4
+    FROM feedback_requests
+    WHERE cycle_id = ? AND reviewer_id = ? AND approval_status IN ('pending', 'approved')
+"""
+
+def is_reviewer_at_limit(reviewer_id, cycle_id=None):
     """Check if a reviewer has reached the nomination limit of 4."""
-    nomination_counts = get_reviewer_nomination_counts()
-    return nomination_counts.get(reviewer_id, 0) >= 4
+    conn = get_connection()
+    try:
+        if cycle_id is None:
+            active_cycle = get_active_review_cycle(conn=conn)
+            if not active_cycle:
+                return False
+            cycle_id = active_cycle['cycle_id']
+        
+        # Reuse the all-reviewer counts if a recent page load cached them
+        cached = get_cached_value(f"nomination_counts:{cycle_id}", NOMINATION_COUNTS_CACHE_SECONDS)
+        if cached is not None:
+            return cached.get(reviewer_id, 0) >= 4
+        
+        # Otherwise count just this reviewer (idx_fr_cycle_reviewer) instead of grouping every reviewer
+        row = conn.execute(_Q_REVIEWER_AT_LIMIT, (cycle_id, reviewer_id)).fetchone()
+        return bool(row and row[0])
+    except Exception as e:
+        logger.error(f"Error checking reviewer nomination limit: {e}")
+        return False
 
-def get_users_for_selection_with_limits(exclude_user_id=None, requester_user_id=None):
-    """Get list of users for selection with nomination limit information."""
-    # Get base user list
-    users = get_users_for_selection(exclude_user_id, requester_user_id)
-    
-    # Get nomination counts
-    nomination_counts = get_reviewer_nomination_counts()
-    
-    # Add nomination count and limit status to each user
-    for user in users:
-        user_id = user['user_type_id']
-        user['nomination_count'] = nomination_counts.get(user_id, 0)
-        user['at_limit'] = user['nomination_count'] >= 4
+# Eligible reviewers (same rules as get_users_for_selection) with their active-cycle nomination counts
+_Q_USERS_WITH_NOMINATION_COUNTS = f"""
+    SELECT u.user_type_id, u.first_name, u.last_name, u.vertical, u.designation, u.email,
+           COALESCE(n.nomination_count, 0) AS nomination_count,
+           COALESCE(n.nomination_count, 0) >= 4 AS at_limit
+    FROM users u
+    LEFT JOIN (
+        SELECT reviewer_id, COUNT(*) AS nomination_count
+        FROM feedback_requests
+        WHERE cycle_id = ? AND approval_status IN ('pending', 'approved')
+        GROUP BY reviewer_id
+    ) n ON n.reviewer_id = u.user_type_id
+    WHERE {_REVIEWER_ELIGIBILITY_WHERE}
+    ORDER BY u.first_name, u.last_name
+"""
+
+def get_users_for_selection_with_limits(exclude_user_id=None, requester_user_id=None, cycle_id=None):
+    """Get list of users for selection with nomination limit information.
     
-    return users
+    Callers that already hold the active cycle can pass its cycle_id to skip the lookup.
+    """
+    conn = get_connection()
+    try:
+        if cycle_id is None:
+            active_cycle = get_active_review_cycle(conn=conn)
+            cycle_id = active_cycle['cycle_id'] if active_cycle else None
+        tenure_cutoff = _reviewer_tenure_cutoff()
+        
+        # Cached like the plain selection list (user edits clear the users_for_selection: prefix),
+        # with the short nomination-count TTL; invalidate_nomination_counts clears it too
+        cache_key = f"users_for_selection:limits:{cycle_id}:{tenure_cutoff}"
+        user_rows = get_cached_value(cache_key, NOMINATION_COUNTS_CACHE_SECONDS)
+        if user_rows is None:
+            # Users and their counts come back together; no separate GROUP BY + Python merge
+            rows = conn.execute(_Q_USERS_WITH_NOMINATION_COUNTS, (cycle_id, tenure_cutoff)).fetchall()
+            user_rows = tuple(
+                (user, row[6], bool(row[7])) for user, row in zip(_iter_user_rows(rows), rows)
+            )
+            set_cached_value(cache_key, user_rows, NOMINATION_COUNTS_CACHE_SECONDS)
+        
+        users = []
+        for user, nomination_count, at_limit in user_rows:
+            if exclude_user_id and user.user_type_id == exclude_user_id:
+                continue
+            data = user._asdict()
+            data['nomination_count'] = nomination_count
+            data['at_limit'] = at_limit
+            users.append(data)
+        return users
+    except Exception as e:
+        logger.error(f"Error fetching users with nomination limits: {e}")
+        return []
+
+_Q_PENDING_REVIEWER_REQUESTS = """
+    SELECT fr.request_id, fr.requester_id, fr.relationship_type, fr.created_at,
+           COALESCE(NULLIF(TRIM(COALESCE(TRIM(req.first_name), '') || ' ' || COALESCE(TRIM(req.last_name), '')), ''),
+                    'Unknown') AS requester_name,
+           req.vertical, req.designation,
+           rc.cycle_display_name, rc.nomination_deadline
+    FROM feedback_requests fr
+    JOIN users req ON fr.requester_id = req.user_type_id
+    JOIN review_cycles rc ON fr.cycle_id = rc.cycle_id
+    WHERE fr.reviewer_id = ? 
+        AND fr.approval_status = 'approved' 
+        AND fr.reviewer_status = 'pending_acceptance'
+        AND rc.is_active = 1
+    ORDER BY fr.created_at ASC
+"""
 
 def get_pending_reviewer_requests(user_id):
     """Get feedback requests where user is the reviewer and needs to accept/reject for the current active cycle only."""
     conn = get_connection()
     try:
-        query = """
-            SELECT fr.request_id, fr.requester_id, fr.relationship_type, fr.created_at,
-                   req.first_name, req.last_name, req.vertical, req.designation,
-                   rc.cycle_display_name, rc.nomination_deadline
-            FROM feedback_requests fr
-            JOIN users req ON fr.requester_id = req.user_type_id
-            JOIN review_cycles rc ON fr.cycle_id = rc.cycle_id
-            WHERE fr.reviewer_id = ? 
-                AND fr.approval_status = 'approved' 
-                AND fr.reviewer_status = 'pending_acceptance'
-                AND rc.is_active = 1
-            ORDER BY fr.created_at ASC
-        """
-        result = conn.execute(query, (user_id,))
+        result = conn.execute(_Q_PENDING_REVIEWER_REQUESTS, (user_id,))
         
         requests = []
-        for row in result.fetchall():
-            first_name = row[4] or ""
-            last_name = row[5] or ""
-            requester_name = f"{first_name.strip()} {last_name.strip()}".strip() or "Unknown"
-            vertical = (row[6] or "Unknown").strip() if isinstance(row[6], str) else "Unknown"
-            designation = (row[7] or "Unknown").strip() if isinstance(row[7], str) else "Unknown"
+        for row in result:
+            vertical = (row[5] or "Unknown").strip() if isinstance(row[5], str) else "Unknown"
+            designation = (row[6] or "Unknown").strip() if isinstance(row[6], str) else "Unknown"
 
             requests.append({
                 'request_id': row[0],
                 'requester_id': row[1],
                 'relationship_type': row[2],
                 'created_at': row[3],
-                'requester_name': requester_name,
+                'requester_name': row[4],
                 'requester_vertical': vertical,
                 'requester_designation': designation,
                 'vertical': vertical,
                 'designation': designation,
-                'cycle_name': row[8],
-                'deadline': row[9]
+                'cycle_name': row[7],
+                'deadline': row[8]
             })
         
         return requests
@@ -1910,10 +2238,19 @@ def get_pending_reviewer_requests(user_id):
 
 def generate_external_token():
     """Generate a secure token for external stakeholders."""
-    import secrets
-    import string
-    alphabet = string.ascii_letters + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(16))
+    # 12 random bytes -> 16 URL-safe characters, same length as before
+    return secrets.token_urlsafe(12)
+
+_Q_INSERT_EXTERNAL_TOKEN = """
+    INSERT INTO external_stakeholder_tokens (email, token, request_id, cycle_id)
+    VALUES (?, ?, ?, ?)
+"""
+
+_Q_MARK_EXTERNAL_INVITED = """
+    UPDATE feedback_requests
+    SET external_token = ?, external_status = 'invitation_sent'
+    WHERE request_id = ?
+"""
 
 def create_external_stakeholder_token(email, request_id, cycle_id):
     """Create a new token for external stakeholder."""
@@ -1921,58 +2258,90 @@ def create_external_stakeholder_token(email, request_id, cycle_id):
     try:
         token = generate_external_token()
         
-        # Insert token
-        insert_query = """
-            INSERT INTO external_stakeholder_tokens (email, token, request_id, cycle_id)
-            VALUES (?, ?, ?, ?)
-        """
-        conn.execute(insert_query, (email, token, request_id, cycle_id))
-        
-        # Update feedback request with token
-        update_query = """
-            UPDATE feedback_requests 
-            SET external_token = ?, external_status = 'invitation_sent'
-            WHERE request_id = ?
-        """
-        conn.execute(update_query, (token, request_id))
-        
-        conn.commit()
+        # Token and request stamp commit together; the batch raises if either fails
+        with conn.transaction() as tx:
+            tx.execute(_Q_INSERT_EXTERNAL_TOKEN, (email, token, request_id, cycle_id))
+            tx.execute(_Q_MARK_EXTERNAL_INVITED, (token, request_id))
         return token
     except Exception as e:
         logger.error(f"Error creating external stakeholder token: {e}")
         conn.rollback()
         return None
 
+_Q_VALIDATE_EXTERNAL_TOKEN = """
+    SELECT est.request_id, est.cycle_id, est.status, est.token_id,
+           fr.requester_id, req.first_name || ' ' || req.last_name AS requester_name, req.vertical,
+           fr.relationship_type, rc.cycle_display_name
+    FROM external_stakeholder_tokens est
+    JOIN feedback_requests fr ON est.request_id = fr.request_id
+    JOIN users req ON fr.requester_id = req.user_type_id
+    JOIN review_cycles rc ON est.cycle_id = rc.cycle_id
+    WHERE est.email = ? AND est.token = ? AND est.is_active = 1
+"""
+
 def validate_external_token(email, token):
     """Validate external stakeholder token and return request info."""
     conn = get_connection()
     try:
-        query = """
-            SELECT est.request_id, est.cycle_id, est.status, est.token_id,
-                   fr.requester_id, req.first_name, req.last_name, req.vertical,
-                   fr.relationship_type, rc.cycle_display_name
-            FROM external_stakeholder_tokens est
-            JOIN feedback_requests fr ON est.request_id = fr.request_id
-            JOIN users req ON fr.requester_id = req.user_type_id
-            JOIN review_cycles rc ON est.cycle_id = rc.cycle_id
-            WHERE est.email = ? AND est.token = ? AND est.is_active = 1
-        """
-        result = conn.execute(query, (email.lower().strip(), token.strip()))
-        token_data = result.fetchone()
-        
-        if token_data:
-            return {
-                'request_id': token_data[0],
-                'cycle_id': token_data[1],
-                'status': token_data[2],
-                'token_id': token_data[3],
-                'requester_id': token_data[4],
-                'requester_name': f"{token_data[5]} {token_data[6]}",
-                'requester_vertical': token_data[7],
-                'relationship_type': token_data[8],
-                'cycle_name': token_data[9]
-            }
+        result = conn.execute(_Q_VALIDATE_EXTERNAL_TOKEN, (email.lower().strip(), token.strip()))
+        return _external_token_dict(result.fetchone())
+    except Exception as e:
+        logger.error(f"Error validating external token: {e}")
         return None
+
+def _external_token_dict(token_data):
+    """Map a _Q_VALIDATE_EXTERNAL_TOKEN row to the token dict used by the external pages."""
+    if not token_data:
+        return None
+    return {
+        'request_id': token_data[0],
+        'cycle_id': token_data[1],
+        'status': token_data[2],
+        'token_id': token_data[3],
+        'requester_id': token_data[4],
+        'requester_name': token_data[5],
+        'requester_vertical': token_data[6],
+        'relationship_type': token_data[7],
+        'cycle_name': token_data[8]
+    }
+
+_Q_ACCEPT_PENDING_EXTERNAL_TOKEN = """
+    UPDATE external_stakeholder_tokens
+    SET status = 'accepted', used_at = CURRENT_TIMESTAMP
+    WHERE email = ? AND token = ? AND is_active = 1 AND status = 'pending'
+    RETURNING token_id, request_id, cycle_id
+"""
+
+# changes() still reports the token UPDATE above, so the request row only
+# flips when this call is the one that accepted the token.
+_Q_ACCEPT_EXTERNAL_REQUEST_FOR_TOKEN = """
+    UPDATE feedback_requests
+    SET external_status = 'accepted', reviewer_status = 'accepted',
+        reviewer_response_date = CURRENT_TIMESTAMP
+    WHERE request_id = (
+        SELECT request_id FROM external_stakeholder_tokens
+        WHERE email = ? AND token = ? AND is_active = 1
+    )
+    AND changes() > 0
+"""
+
+def accept_or_validate(email, token):
+    """Validate an external token, accepting it on the spot if it is still pending.
+    
+    The token flip, the request flip and the display lookup run as one atomic
+    batch, so a pending token is accepted exactly once and the returned dict
+    already carries status 'accepted'. Tokens in any other state are returned
+    unchanged, exactly as validate_external_token would.
+    """
+    conn = get_connection()
+    params = (email.lower().strip(), token.strip())
+    try:
+        _, _, lookup = conn.execute_batch([
+            (_Q_ACCEPT_PENDING_EXTERNAL_TOKEN, params),
+            (_Q_ACCEPT_EXTERNAL_REQUEST_FOR_TOKEN, params),
+            (_Q_VALIDATE_EXTERNAL_TOKEN, params),
+        ])
+        return _external_token_dict(lookup.fetchone())
     except Exception as e:
         logger.error(f"Error validating external token: {e}")
         return None
@@ -1981,22 +2350,23 @@ def accept_external_stakeholder_request(token_data):
     """Mark external stakeholder request as accepted."""
     conn = get_connection()
     try:
-        # Update token status
-        conn.execute("""
-            UPDATE external_stakeholder_tokens 
-            SET status = 'accepted', used_at = CURRENT_TIMESTAMP
-            WHERE token_id = ?
-        """, (token_data['token_id'],))
-        
-        # Update request status
-        conn.execute("""
-            UPDATE feedback_requests 
-            SET external_status = 'accepted', reviewer_status = 'accepted',
-                reviewer_response_date = CURRENT_TIMESTAMP
-            WHERE request_id = ?
-        """, (token_data['request_id'],))
+        # Token and request move together in one atomic round-trip
+        with conn.transaction() as tx:
+            # Update token status
+            tx.execute("""
+                UPDATE external_stakeholder_tokens 
+                SET status = 'accepted', used_at = CURRENT_TIMESTAMP
+                WHERE token_id = ?
+            """, (token_data['token_id'],))
+            
+            # Update request status
+            tx.execute("""
+                UPDATE feedback_requests 
+                SET external_status = 'accepted', reviewer_status = 'accepted',
+                    reviewer_response_date = CURRENT_TIMESTAMP
+                WHERE request_id = ?
+            """, (token_data['request_id'],))
         
-        conn.commit()
         return True
     except Exception as e:
         logger.error(f"Error accepting external stakeholder request: {e}")
@@ -2007,22 +2377,24 @@ def reject_external_stakeholder_request(token_data, rejection_reason):
     """Mark external stakeholder request as rejected."""
     conn = get_connection()
     try:
-        # Update token status
-        conn.execute("""
-            UPDATE external_stakeholder_tokens 
-            SET status = 'rejected', rejection_reason = ?, used_at = CURRENT_TIMESTAMP
-            WHERE token_id = ?
-        """, (rejection_reason, token_data['token_id']))
-        
-        # Update request status
-        conn.execute("""
-            UPDATE feedback_requests 
-            SET external_status = 'rejected', reviewer_status = 'rejected',
-                reviewer_rejection_reason = ?, reviewer_response_date = CURRENT_TIMESTAMP
-            WHERE request_id = ?
-        """, (rejection_reason, token_data['request_id']))
+        # Token and request move together in one atomic round-trip
+        with conn.transaction() as tx:
+            # Update token status
+            tx.execute("""
+                UPDATE external_stakeholder_tokens 
+                SET status = 'rejected', rejection_reason = ?, used_at = CURRENT_TIMESTAMP
+                WHERE token_id = ?
+            """, (rejection_reason, token_data['token_id']))
+            
+            # Update request status
+            tx.execute("""
+                UPDATE feedback_requests 
+                SET external_status = 'rejected', reviewer_status = 'rejected',
+                    reviewer_rejection_reason = ?, reviewer_response_date = CURRENT_TIMESTAMP
+                WHERE request_id = ?
+            """, (rejection_reason, token_data['request_id']))
         
-        conn.commit()
+        invalidate_reviewer_rejections()
         return True
     except Exception as e:
         logger.error(f"Error rejecting external stakeholder request: {e}")
@@ -2033,39 +2405,46 @@ def complete_external_stakeholder_feedback(request_id, responses):
     """Submit completed feedback from external stakeholder."""
     conn = get_connection()
     try:
-        # Insert final responses
-        for question_id, response_data in responses.items():
-            response_value = response_data.get('response_value')
-            rating_value = response_data.get('rating_value')
-            
-            response_query = """
+        response_rows = [
+            (request_id, question_id, response_data.get('response_value'), response_data.get('rating_value'))
+            for question_id, response_data in responses.items()
+        ]
+        
+        # Responses, request status and token status are written as one atomic batch
+        with conn.transaction() as tx:
+            # Insert final responses
+            tx.executemany(
+                """
                 INSERT INTO feedback_responses (request_id, question_id, response_value, rating_value)
                 VALUES (?, ?, ?, ?)
-            """
-            conn.execute(response_query, (request_id, question_id, response_value, rating_value))
-        
-        # Update request status
-        update_query = """
-            UPDATE feedback_requests 
-            SET reviewer_status = 'completed', completed_at = CURRENT_TIMESTAMP,
-                workflow_state = 'completed', external_status = 'completed'
-            WHERE request_id = ?
-        """
-        conn.execute(update_query, (request_id,))
-        
-        # Update token status
-        token_update = """
-            UPDATE external_stakeholder_tokens 
-            SET status = 'completed'
-            WHERE request_id = ?
-        """
-        conn.execute(token_update, (request_id,))
-        
-        conn.commit()
+                """,
+                response_rows,
+            )
+            
+            # Update request status
+            tx.execute(
+                """
+                UPDATE feedback_requests 
+                SET reviewer_status = 'completed', completed_at = CURRENT_TIMESTAMP,
+                    workflow_state = 'completed', external_status = 'completed'
+                WHERE request_id = ?
+                """,
+                (request_id,),
+            )
+            
+            # Update token status
+            tx.execute(
+                """
+                UPDATE external_stakeholder_tokens 
+                SET status = 'completed'
+                WHERE request_id = ?
+                """,
+                (request_id,),
+            )
         
         # Send notification email
         try:
-            from services.email_service import send_feedback_submitted_notification
+            from services.email_service import send_feedback_submitted_notification, send_email_in_background
             # Get request details
             details_query = """
                 SELECT req_user.first_name || ' ' || req_user.last_name as requester_name,
@@ -2081,7 +2460,8 @@ def complete_external_stakeholder_feedback(request_id, responses):
             details = details_result.fetchone()
             
             if details:
-                send_feedback_submitted_notification(
+                send_email_in_background(
+                    send_feedback_submitted_notification,
                     requester_email=details[1],
                     requester_name=details[0],
                     reviewer_name=details[2] or "External Stakeholder",
@@ -2096,140 +2476,131 @@ def complete_external_stakeholder_feedback(request_id, responses):
         conn.rollback()
         return False, str(e)
 
+# Everything an external invitation needs; callers append their own WHERE filter
+_Q_EXTERNAL_INVITATION_REQUESTS = """
+    SELECT fr.request_id, fr.external_reviewer_email, fr.relationship_type,
+           req.first_name, req.last_name, req.email as requester_email,
+           req.vertical, rc.cycle_display_name, rc.cycle_id,
+           fr.external_stakeholder_first_name, fr.external_stakeholder_last_name
+    FROM feedback_requests fr
+    JOIN users req ON fr.requester_id = req.user_type_id
+    JOIN review_cycles rc ON fr.cycle_id = rc.cycle_id
+    WHERE fr.external_reviewer_email IS NOT NULL
+"""
+
+def _external_invitation_requests(conn, where_sql="", params=()):
+    """Invitation payload dicts for external requests matching an extra WHERE clause."""
+    result = conn.execute(_Q_EXTERNAL_INVITATION_REQUESTS + where_sql, params)
+    return [
+        {
+            'request_id': row[0],
+            'external_email': row[1],
+            'relationship_type': row[2],
+            'requester_name': f"{row[3]} {row[4]}",
+            'requester_email': row[5],
+            'requester_vertical': row[6],
+            'cycle_name': row[7],
+            'cycle_id': row[8],
+            'external_stakeholder_name': f"{row[9] or ''} {row[10] or ''}".strip(),
+        }
+        for row in result
+    ]
+
 def get_external_stakeholder_requests_for_email():
     """Get external stakeholder requests that need email invitations."""
     conn = get_connection()
     try:
-        query = """
-            SELECT fr.request_id, fr.external_reviewer_email, fr.relationship_type,
-                   req.first_name, req.last_name, req.email as requester_email,
-                   req.vertical, rc.cycle_display_name, rc.cycle_id
-            FROM feedback_requests fr
-            JOIN users req ON fr.requester_id = req.user_type_id
-            JOIN review_cycles rc ON fr.cycle_id = rc.cycle_id
-            WHERE fr.external_reviewer_email IS NOT NULL 
+        return _external_invitation_requests(
+            conn,
+            """
               AND fr.external_status = 'pending'
               AND fr.approval_status = 'approved'
               AND rc.is_active = 1
-        """
-        result = conn.execute(query)
-        
-        requests = []
-        for row in result.fetchall():
-            requests.append({
-                'request_id': row[0],
-                'external_email': row[1],
-                'relationship_type': row[2],
-                'requester_name': f"{row[3]} {row[4]}",
-                'requester_email': row[5],
-                'requester_vertical': row[6],
-                'cycle_name': row[7],
-                'cycle_id': row[8]
-            })
-        
-        return requests
+            """,
+        )
     except Exception as e:
         logger.error(f"Error fetching external stakeholder requests: {e}")
         return []
 
-def process_external_stakeholder_invitations(request_id):
-    """Process external stakeholder invitation after manager approval."""
+def send_external_stakeholder_invitations(requests):
+    """
+    Create tokens for preloaded invitation payloads (see get_external_stakeholder_requests_for_email)
+    in one atomic batch, then queue the invitation emails. Returns the number of invitations.
+    """
+    if not requests:
+        return 0
+    
     conn = get_connection()
-    try:
-        # Get request details including external stakeholder names
-        query = """
-            SELECT fr.external_reviewer_email, fr.relationship_type, fr.cycle_id,
-                   req.first_name, req.last_name, req.vertical,
-                   rc.cycle_display_name, fr.external_stakeholder_first_name, fr.external_stakeholder_last_name
-            FROM feedback_requests fr
-            JOIN users req ON fr.requester_id = req.user_type_id
-            JOIN review_cycles rc ON fr.cycle_id = rc.cycle_id
-            WHERE fr.request_id = ? AND fr.external_reviewer_email IS NOT NULL
-        """
-        result = conn.execute(query, (request_id,))
-        request_data = result.fetchone()
-        
-        if not request_data:
-            return False, "External request not found"
-        
-        # Create token for this external stakeholder
-        token = create_external_stakeholder_token(
-            request_data[0],  # external_reviewer_email
-            request_id,
-            request_data[2]   # cycle_id
+    tokens = [generate_external_token() for _ in requests]
+    
+    # All tokens and request stamps land together; the batch raises on any error,
+    # so invitations only go out for tokens that were stored
+    with conn.transaction() as tx:
+        tx.executemany(
+            _Q_INSERT_EXTERNAL_TOKEN,
+            [(req['external_email'], token, req['request_id'], req['cycle_id']) for req, token in zip(requests, tokens)],
         )
-        
-        if token:
-            # Send invitation email
-            try:
-                from services.email_service import send_external_stakeholder_invitation
-                send_external_stakeholder_invitation(
-                    to_email=request_data[0],
-                    requester_name=f"{request_data[3]} {request_data[4]}".strip(),
-                    requester_vertical=request_data[5] or "",
-                    cycle_name=request_data[6],
-                    token=token,
-                    external_stakeholder_name=(
-                        f"{request_data[7] or ''} {request_data[8] or ''}".strip()
-                        or request_data[0]
-                    ),
-                )
-                return True, "Invitation sent successfully"
-            except Exception as e:
-                logger.error(f"Error sending external invitation: {e}")
-                return False, f"Failed to send invitation: {str(e)}"
-        else:
-            return False, "Failed to create external token"
-            
-    except Exception as e:
-        logger.error(f"Error processing external stakeholder invitations: {e}")
-        return False, str(e)
+        tx.executemany(
+            _Q_MARK_EXTERNAL_INVITED,
+            [(token, req['request_id']) for req, token in zip(requests, tokens)],
+        )
+    
+    # All invitations are rendered and queued by one background task with one INSERT
+    from services.email_service import send_external_stakeholder_invites_bulk, send_email_in_background
+    send_email_in_background(
+        send_external_stakeholder_invites_bulk,
+        [
+            {
+                'external_email': req['external_email'],
+                'requester_name': req['requester_name'].strip(),
+                'requester_designation': "",
+                'cycle_name': req['cycle_name'],
+                'token': token,
+                'feedback_deadline': "",
+                'requester_vertical': req['requester_vertical'] or "",
+                'external_stakeholder_name': req['external_stakeholder_name'] or req['external_email'],
+            }
+            for req, token in zip(requests, tokens)
+        ],
+    )
+    return len(requests)
+
+def process_external_stakeholder_invitations_bulk(request_ids):
+    """Create tokens and queue invitations for the external requests among request_ids."""
+    request_ids = list(request_ids)
+    if not request_ids:
+        return 0
+    
+    placeholders = ",".join(["?"] * len(request_ids))
+    requests = _external_invitation_requests(
+        get_connection(), f" AND fr.request_id IN ({placeholders})", request_ids
+    )
+    return send_external_stakeholder_invitations(requests)
 
 # =====================================================
 # DEADLINE AND WORKFLOW MANAGEMENT FUNCTIONS
 # =====================================================
 
-def _wf_get_display_status(workflow_state: str) -> str:
-    """Get display status from workflow state"""
-    status_map = {
-        "pending_manager_approval": "pending",
-        "manager_rejected": "rejected",
-        "pending_reviewer_acceptance": "approved",
-        "reviewer_rejected": "rejected",
-        "in_progress": "approved",
-        "completed": "completed",
-        "expired": "expired",
-    }
-    return status_map.get(workflow_state or "", "unknown")
-
-def _wf_should_count(workflow_state: str) -> bool:
-    """Check if workflow state should count toward limits"""
-    return (workflow_state or "") in {
-        "pending_manager_approval",
-        "pending_reviewer_acceptance",
-        "in_progress",
-        "completed",
-    }
+_WF_REVIEWER_STATUS_LABELS = {
+    "pending_manager_approval": "Waiting for manager approval",
+    "pending_reviewer_acceptance": "Waiting for reviewer approval",
+    "in_progress": "In progress",
+    "completed": "Completed",
+    "manager_rejected": "Rejected by manager",
+    "reviewer_rejected": "Rejected by reviewer",
+    "expired": "Expired",
+}
 
 def _wf_get_reviewer_status_label(workflow_state: str, approval_status: str, reviewer_status: str) -> str:
     """Human readable reviewer status messaging for nominations"""
     state = (workflow_state or "").lower()
-    approval = (approval_status or "").lower()
-    reviewer = (reviewer_status or "").lower()
-    
-    label_map = {
-        "pending_manager_approval": "Waiting for manager approval",
-        "pending_reviewer_acceptance": "Waiting for reviewer approval",
-        "in_progress": "In progress",
-        "completed": "Completed",
-        "manager_rejected": "Rejected by manager",
-        "reviewer_rejected": "Rejected by reviewer",
-        "expired": "Expired",
-    }
     
-    if state in label_map:
-        return label_map[state]
+    label = _WF_REVIEWER_STATUS_LABELS.get(state)
+    if label:
+        return label
     
+    approval = (approval_status or "").lower()
+    reviewer = (reviewer_status or "").lower()
     if approval == "pending":
         return "Waiting for manager approval"
     if approval == "approved" and reviewer in ("pending", "pending_acceptance", ""):
@@ -2243,7 +2614,10 @@ def is_deadline_passed(deadline_date):
     """Check if a deadline has passed."""
     try:
         if isinstance(deadline_date, str):
-            deadline = datetime.strptime(deadline_date, '%Y-%m-%d').date()
+            # YYYY-MM-DD strings order like the dates they spell, so compare them directly
+            if len(deadline_date) != 10 or deadline_date[4] != '-' or deadline_date[7] != '-':
+                return False
+            return date.today().isoformat() > deadline_date
         elif isinstance(deadline_date, date):
             deadline = deadline_date
         else:
@@ -2259,12 +2633,11 @@ def extend_user_deadline(cycle_id, user_id, deadline_type, new_deadline, reason,
     conn = get_connection()
     try:
         # Get original deadline from cycle
-        cycle_result = conn.execute("SELECT nomination_deadline, feedback_deadline FROM review_cycles WHERE cycle_id = ?", (cycle_id,))
-        cycle = cycle_result.fetchone()
+        cycle = _get_cycle_row(cycle_id, conn)
         if not cycle:
             return False, "Cycle not found"
         
-        original_deadline = cycle[0] if deadline_type == 'nomination' else cycle[1]
+        original_deadline = cycle.nomination_deadline if deadline_type == 'nomination' else cycle.feedback_deadline
         if not original_deadline:
             return False, f"Invalid deadline type: {deadline_type}"
         
@@ -2283,9 +2656,9 @@ def extend_user_deadline(cycle_id, user_id, deadline_type, new_deadline, reason,
         conn.rollback()
         return False, str(e)
 
-def get_user_deadline(cycle_id, user_id, deadline_type):
+def get_user_deadline(cycle_id, user_id, deadline_type, conn=None):
     """Get the effective deadline for a user (considering extensions)."""
-    conn = get_connection()
+    conn = conn or get_connection()
     try:
         # Check if user has an extension
         extension_query = """
@@ -2300,16 +2673,10 @@ def get_user_deadline(cycle_id, user_id, deadline_type):
             return extension[0]  # Return extended deadline
         
         # Return original deadline from cycle
-        cycle_query = """
-            SELECT nomination_deadline, feedback_deadline 
-            FROM review_cycles 
-            WHERE cycle_id = ?
-        """
-        cycle_result = conn.execute(cycle_query, (cycle_id,))
-        cycle = cycle_result.fetchone()
+        cycle = _get_cycle_row(cycle_id, conn)
         
         if cycle:
-            return cycle[0] if deadline_type == 'nomination' else cycle[1]
+            return cycle.nomination_deadline if deadline_type == 'nomination' else cycle.feedback_deadline
         
         return None
     except Exception as e:
@@ -2333,7 +2700,7 @@ def get_user_deadline_extensions(cycle_id):
         result = conn.execute(query, (cycle_id,))
         
         extensions = []
-        for row in result.fetchall():
+        for row in result:
             extensions.append({
                 'user_id': row[0],
                 'deadline_type': row[1],
@@ -2366,21 +2733,23 @@ def auto_accept_expired_nominations():
         if not is_deadline_passed(nomination_deadline):
             return False, "Nomination deadline has not passed yet"
         
-        # Auto-approve all pending manager approvals
-        manager_approvals = conn.execute("""
-            UPDATE feedback_requests 
-            SET approval_status = 'approved', workflow_state = 'pending_reviewer_acceptance'
-            WHERE cycle_id = ? AND approval_status = 'pending'
-        """, (cycle_id,))
-        
-        # Auto-accept all pending reviewer acceptances
-        reviewer_acceptances = conn.execute("""
-            UPDATE feedback_requests 
-            SET reviewer_status = 'accepted', workflow_state = 'in_progress'
-            WHERE cycle_id = ? AND reviewer_status = 'pending_acceptance'
-        """, (cycle_id,))
+        # Both bulk updates commit together in one round-trip
+        with conn.transaction() as tx:
+            # Auto-approve all pending manager approvals
+            tx.execute("""
+                UPDATE feedback_requests 
+                SET approval_status = 'approved', workflow_state = 'pending_reviewer_acceptance'
+                WHERE cycle_id = ? AND approval_status = 'pending'
+            """, (cycle_id,))
+            
+            # Auto-accept all pending reviewer acceptances
+            tx.execute("""
+                UPDATE feedback_requests 
+                SET reviewer_status = 'accepted', workflow_state = 'in_progress'
+                WHERE cycle_id = ? AND reviewer_status = 'pending_acceptance'
+            """, (cycle_id,))
         
-        conn.commit()
+        invalidate_nomination_counts()
         
         return True, "Expired nominations auto-accepted successfully"
     except Exception as e:
@@ -2419,12 +2788,11 @@ def check_user_deadline_enforcement(user_id, action_type):
         logger.error(f"Error checking deadline enforcement: {e}")
         return True, ""  # Default to allowing action if error
 
-def ensure_database_schema():
-    """Ensure all required tables and columns exist for the feedback system."""
-    conn = get_connection()
-    try:
+def _ensure_core_tables(conn):
+    """Tables the email log and deadline-extension features write to."""
+    with conn.transaction() as tx:
         # Create email_logs table if not exists
-        conn.execute("""
+        tx.execute("""
             CREATE TABLE IF NOT EXISTS email_logs (
                 log_id INTEGER PRIMARY KEY AUTOINCREMENT,
                 email_type TEXT NOT NULL,
@@ -2439,7 +2807,7 @@ def ensure_database_schema():
         """)
         
         # Create user_deadline_extensions table if not exists
-        conn.execute("""
+        tx.execute("""
             CREATE TABLE IF NOT EXISTS user_deadline_extensions (
                 extension_id INTEGER PRIMARY KEY AUTOINCREMENT,
                 cycle_id INTEGER NOT NULL,
@@ -2455,14 +2823,154 @@ def ensure_database_schema():
                 FOREIGN KEY (extended_by) REFERENCES users(user_type_id)
             )
         """)
+
+def _ensure_feedback_request_name_cache(conn):
+    """Add the reviewer/cycle name columns on feedback_requests, their triggers and the backfill, atomically."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(feedback_requests)").fetchall()}
+    with conn.transaction() as tx:
+        added = False
+        if 'reviewer_name_cached' not in columns:
+            tx.execute("ALTER TABLE feedback_requests ADD COLUMN reviewer_name_cached TEXT")
+            added = True
+        if 'cycle_display_name_cached' not in columns:
+            tx.execute("ALTER TABLE feedback_requests ADD COLUMN cycle_display_name_cached TEXT")
+            added = True
+        
+        # New rows get their names from the INSERT itself (_insert_feedback_requests_sql);
+        # the triggers only follow later renames
+        tx.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_users_name_cache_update
+            AFTER UPDATE OF first_name, last_name ON users
+            BEGIN
+                UPDATE feedback_requests
+                SET reviewer_name_cached = TRIM(COALESCE(NEW.first_name, '') || ' ' || COALESCE(NEW.last_name, ''))
+                WHERE reviewer_id = NEW.user_type_id;
+            END
+        """)
+        tx.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_cycles_name_cache_update
+            AFTER UPDATE OF cycle_display_name ON review_cycles
+            BEGIN
+                UPDATE feedback_requests
+                SET cycle_display_name_cached = NEW.cycle_display_name
+                WHERE cycle_id = NEW.cycle_id;
+            END
+        """)
         
-        conn.commit()
-        logger.info("Database schema ensured successfully")
-        return True
+        if added:
+            # One-time backfill of existing rows, committed together with the new columns
+            tx.execute("""
+                UPDATE feedback_requests
+                SET reviewer_name_cached = (
+                        SELECT TRIM(COALESCE(u.first_name, '') || ' ' || COALESCE(u.last_name, ''))
+                        FROM users u WHERE u.user_type_id = feedback_requests.reviewer_id
+                    ),
+                    cycle_display_name_cached = (
+                        SELECT rc.cycle_display_name FROM review_cycles rc
+                        WHERE rc.cycle_id = feedback_requests.cycle_id
+                    )
+            """)
+
+# Migrations other code depends on; each runs in its own batch and is recorded
+# in _APPLIED_MIGRATIONS once it commits, so one failure cannot undo the others
+_SCHEMA_MIGRATIONS = [
+    ("core_tables", _ensure_core_tables),
+    ("feedback_request_name_cache", _ensure_feedback_request_name_cache),
+]
+_APPLIED_MIGRATIONS = set()
+
+# Performance-only: a failure here is logged and never blocks the migrations above
+_SCHEMA_INDEXES = [
+    # Reviewer eligibility lookup (get_users_for_selection)
+    "CREATE INDEX IF NOT EXISTS idx_users_active_doj ON users(is_active, date_of_joining)",
+    
+    # Compound indexes for the hot read paths
+    "CREATE INDEX IF NOT EXISTS idx_fr_reviewer_status ON feedback_requests(reviewer_id, approval_status, reviewer_status)",
+    "CREATE INDEX IF NOT EXISTS idx_fr_requester_cycle ON feedback_requests(requester_id, cycle_id)",
+    "CREATE INDEX IF NOT EXISTS idx_users_email_active ON users(email, is_active)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_draft_req_q ON draft_responses(request_id, question_id)",
+    "CREATE INDEX IF NOT EXISTS idx_eq_status_created ON email_queue(status, created_at)",
+    
+    # Cycle-scoped feedback_requests filters
+    "CREATE INDEX IF NOT EXISTS idx_fr_cycle_reviewer ON feedback_requests(cycle_id, reviewer_id, approval_status)",
+    "CREATE INDEX IF NOT EXISTS idx_fr_cycle_status_completed ON feedback_requests(cycle_id, status, completed_at)",
+    "CREATE INDEX IF NOT EXISTS idx_fr_cycle_approval ON feedback_requests(cycle_id, approval_status, reviewer_status)",
+    
+    # auto_accept_expired_nominations: the approval sweep seeks idx_fr_cycle_approval, but the
+    # acceptance sweep skips approval_status, so it gets a partial index over its own predicate
+    "CREATE INDEX IF NOT EXISTS idx_fr_pending_acceptance ON feedback_requests(cycle_id) WHERE reviewer_status = 'pending_acceptance'",
+    
+    # External invitation queue, token validation and the reviewer-rejection report
+    "CREATE INDEX IF NOT EXISTS idx_fr_ext ON feedback_requests(external_status, approval_status) WHERE external_reviewer_email IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS idx_est_lookup ON external_stakeholder_tokens(email, token, is_active)",
+    "CREATE INDEX IF NOT EXISTS idx_fr_reviewer_rejected ON feedback_requests(reviewer_status, reviewer_response_date DESC)",
+    
+    # HR rejections dashboard and manager -> direct reports lookups
+    "CREATE INDEX IF NOT EXISTS idx_rt_cycle_rejected_at ON rejection_tracking(cycle_id, rejected_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_users_mgr_email_active ON users(reporting_manager_email, is_active)",
+]
+
+def _ensure_schema_indexes(conn):
+    """Best-effort index creation: one batch, or statement by statement if the batch fails."""
+    global _SCHEMA_INDEXES_ENSURED
+    try:
+        conn.execute_batch([(statement, None) for statement in _SCHEMA_INDEXES])
     except Exception as e:
-        logger.error(f"Error ensuring database schema: {e}")
-        conn.rollback()
-        return False
+        logger.warning(f"Index batch failed, creating indexes individually: {e}")
+        for statement in _SCHEMA_INDEXES:
+            try:
+                result = conn.execute(statement)
+                if result.error:
+                    logger.warning(f"Skipping optional schema statement ({result.error}): {statement}")
+            except Exception as statement_error:
+                logger.warning(f"Skipping optional schema statement ({statement_error}): {statement}")
+    # Attempted once per process either way; a rerun would hit the same errors
+    _SCHEMA_INDEXES_ENSURED = True
+
+def _feedback_request_name_cache_ready(conn):
+    """
+    True once feedback_requests has the *_cached name columns. They are added together
+    with their triggers and backfill, so readers fall back to joins until then.
+    """
+    global _NAME_CACHE_COLUMNS_PRESENT
+    if _NAME_CACHE_COLUMNS_PRESENT or "feedback_request_name_cache" in _APPLIED_MIGRATIONS:
+        return True
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(feedback_requests)").fetchall()}
+    # Only a positive answer is remembered; a missing column is re-checked next time
+    _NAME_CACHE_COLUMNS_PRESENT = {'reviewer_name_cached', 'cycle_display_name_cached'} <= columns
+    return _NAME_CACHE_COLUMNS_PRESENT
+
+def ensure_database_schema():
+    """
+    Ensure all required tables and columns exist for the feedback system.
+    
+    Not called by the app; run it once per deployment (see README). The first run
+    adds the feedback_requests name-cache columns and backfills every row.
+    """
+    global _SCHEMA_ENSURED
+    if _SCHEMA_ENSURED:
+        return True
+    conn = get_connection()
+    
+    ok = True
+    for name, migration in _SCHEMA_MIGRATIONS:
+        if name in _APPLIED_MIGRATIONS:
+            continue
+        try:
+            migration(conn)
+            _APPLIED_MIGRATIONS.add(name)
+        except Exception as e:
+            logger.error(f"Error applying schema migration {name}: {e}")
+            ok = False
+    
+    if not _SCHEMA_INDEXES_ENSURED:
+        _ensure_schema_indexes(conn)
+    
+    # Failed migrations are retried on the next call; applied ones are skipped
+    _SCHEMA_ENSURED = ok
+    if ok:
+        logger.info("Database schema ensured successfully")
+    return ok
 
 if __name__ == "__main__":
     # Test the new db_helper functions
@@ -2486,71 +2994,82 @@ if __name__ == "__main__":
         print(f"❌ Test failed: {e}")
 
 
+_Q_NOMINATED_REVIEWERS = """
+    SELECT reviewer_id, external_reviewer_email
+    FROM feedback_requests
+    WHERE requester_id = ? AND cycle_id = ?
+"""
+
 def get_user_nominated_reviewers(user_id):
-    """Get list of reviewer IDs that user has already nominated (including rejected)."""
+    """Get the set of reviewer IDs / external emails the user has already nominated (including rejected)."""
     with get_connection() as conn:
         try:
             active_cycle = get_active_review_cycle()
             if not active_cycle:
-                return []
+                return set()
             
             cycle_id = active_cycle['cycle_id']
             
-            # Get all nominated reviewers (both internal and external)
-            query = """
-                SELECT reviewer_id, external_reviewer_email
-                FROM feedback_requests
-                WHERE requester_id = ? AND cycle_id = ?
-            """
-            result = conn.execute(query, (user_id, cycle_id))
-            
-            nominated_reviewers = []
-            for row in result.fetchall():
-                if row[0]:  # Internal reviewer
-                    nominated_reviewers.append(row[0])
-                elif row[1]:  # External reviewer
-                    nominated_reviewers.append(row[1])
-            
-            return nominated_reviewers
+            # Get all nominated reviewers (both internal and external); callers only test membership
+            result = conn.execute(_Q_NOMINATED_REVIEWERS, (user_id, cycle_id))
+            return {row[0] or row[1] for row in result if row[0] or row[1]}
         except Exception as e:
             logger.error(f"Error getting nominated reviewers: {e}")
-            return []
+            return set()
+
+
+# Same slot weighting as get_user_nominations_status, plus the requester's active manager
+_Q_NOMINATION_CONTEXT = f"""
+    SELECT m.user_type_id, m.first_name, m.last_name, m.email,
+           (SELECT COALESCE(SUM({_SQL_WF_LIMIT_WEIGHT}), 0)
+            FROM feedback_requests fr
+            WHERE fr.requester_id = ? AND fr.cycle_id = ? AND COALESCE(fr.is_active, 1) = 1) AS used_slots
+    FROM (SELECT 1)
+    LEFT JOIN users u ON u.user_type_id = ? AND u.is_active = 1
+    LEFT JOIN users m ON u.reporting_manager_email = m.email AND m.is_active = 1
+"""
 
+_NOMINATION_INTERNAL_COLUMNS = ('cycle_id', 'requester_id', 'reviewer_id', 'relationship_type')
+_NOMINATION_EXTERNAL_COLUMNS = (
+    'cycle_id', 'requester_id', 'external_reviewer_email', 'external_stakeholder_first_name',
+    'external_stakeholder_last_name', 'relationship_type',
+)
+_NOMINATION_INITIAL_STATE = (
+    ('workflow_state', "'pending_manager_approval'"), ('approval_status', "'pending'"),
+    ('reviewer_status', "'pending_acceptance'"), ('counts_toward_limit', "1"), ('is_active', "1"),
+)
 
 def create_feedback_request_fixed(requester_id, reviewer_data):
     """Create feedback requests (internal & external) pending manager approval and email manager."""
     with get_connection() as conn:
         try:
-            active_cycle = get_active_review_cycle()
+            active_cycle = get_active_review_cycle(conn=conn)
             if not active_cycle:
                 return False, "No active review cycle found"
             cycle_id = active_cycle["cycle_id"]
             
-            # Current status to enforce limit
-            current_status = get_user_nominations_status(requester_id)
-            if current_status["total_count"] + len(reviewer_data) > 4:
-                return False, f"Cannot nominate {len(reviewer_data)} more reviewers. You have {current_status['remaining_slots']} slots remaining."
+            # Slots used so far and the direct manager, in one round-trip
+            context = conn.execute(_Q_NOMINATION_CONTEXT, (requester_id, cycle_id, requester_id)).fetchone()
+            used_slots = int(context[4] or 0)
+            
+            # Enforce limit
+            if used_slots + len(reviewer_data) > 4:
+                return False, f"Cannot nominate {len(reviewer_data)} more reviewers. You have {max(0, 4 - used_slots)} slots remaining."
             
             # Prevent nominating direct manager
-            direct_manager = get_user_direct_manager(requester_id)
-            manager_id = direct_manager["user_type_id"] if direct_manager else None
-            manager_email = (direct_manager.get("email") if direct_manager else "") or ""
+            manager_id = context[0]
+            manager_name = f"{context[1]} {context[2]}"
+            manager_email = context[3] or ""
+            manager_email_norm = manager_email.strip().lower()
             
-            # Insert rows
+            # Validate every nominee before writing anything
+            internal_rows = []
+            external_rows = []
             for reviewer_id, relationship_type in reviewer_data:
                 if isinstance(reviewer_id, int):
                     if reviewer_id == manager_id:
-                        return False, f"Note: Your Direct manager ({direct_manager['name']}) should not be nominated — their feedback is shared through ongoing discussions and review touchpoints like check-ins or H1 assessments."
-                    conn.execute(
-                        """
-                        INSERT INTO feedback_requests
-                        (cycle_id, requester_id, reviewer_id, relationship_type,
-                         workflow_state, approval_status, reviewer_status,
-                         counts_toward_limit, is_active)
-                        VALUES (?, ?, ?, ?, 'pending_manager_approval', 'pending', 'pending_acceptance', 1, 1)
-                        """,
-                        (cycle_id, requester_id, reviewer_id, relationship_type),
-                    )
+                        return False, f"Note: Your Direct manager ({manager_name}) should not be nominated — their feedback is shared through ongoing discussions and review touchpoints like check-ins or H1 assessments."
+                    internal_rows.append((cycle_id, requester_id, reviewer_id, relationship_type))
                 else:
                     # External stakeholder data (email + names) or just email (legacy)
                     if isinstance(reviewer_id, dict):
@@ -2565,21 +3084,31 @@ def create_feedback_request_fixed(requester_id, reviewer_data):
                         external_last_name = None
                     
                     # Guard against nominating manager email
-                    if external_email.strip().lower() == manager_email.strip().lower():
+                    if external_email.strip().lower() == manager_email_norm:
                         return False, f"You cannot nominate your direct manager ({external_email}) as an external stakeholder."
                     
-                    conn.execute(
-                        """
-                        INSERT INTO feedback_requests
-                        (cycle_id, requester_id, external_reviewer_email, external_stakeholder_first_name, 
-                         external_stakeholder_last_name, relationship_type, workflow_state, approval_status, 
-                         reviewer_status, counts_toward_limit, is_active)
-                        VALUES (?, ?, ?, ?, ?, ?, 'pending_manager_approval', 'pending', 'pending_acceptance', 1, 1)
-                        """,
-                        (cycle_id, requester_id, external_email, external_first_name, external_last_name, relationship_type),
+                    external_rows.append((cycle_id, requester_id, external_email, external_first_name, external_last_name, relationship_type))
+            
+            # Insert all nominations together so a failure leaves none behind; once the
+            # name-cache migration has run, each INSERT also fills the cached names
+            name_cache = _feedback_request_name_cache_ready(conn)
+            with conn.transaction() as tx:
+                if internal_rows:
+                    tx.execute(
+                        _insert_feedback_requests_sql(
+                            _NOMINATION_INTERNAL_COLUMNS, _NOMINATION_INITIAL_STATE, len(internal_rows), name_cache
+                        ),
+                        [value for row in internal_rows for value in row],
+                    )
+                if external_rows:
+                    tx.execute(
+                        _insert_feedback_requests_sql(
+                            _NOMINATION_EXTERNAL_COLUMNS, _NOMINATION_INITIAL_STATE, len(external_rows), name_cache
+                        ),
+                        [value for row in external_rows for value in row],
                     )
             
-            conn.commit()
+            invalidate_nomination_counts()
             return True, "Feedback requests created successfully"
             
         except Exception as e:
@@ -2587,17 +3116,29 @@ def create_feedback_request_fixed(requester_id, reviewer_data):
             return False, f"Error creating feedback requests: {e}"
 
 
+# Reviewer rejection writes in this process invalidate explicitly, the TTL covers other processes
+REVIEWER_REJECTIONS_CACHE_SECONDS = 60
+
+def invalidate_reviewer_rejections():
+    """Drop the cached HR reviewer-rejections list after a reviewer rejects a request."""
+    clear_cached_values("reviewer_rejections")
+
 def get_reviewer_rejections_for_hr():
     """Get all reviewer rejections for HR review."""
+    cached = get_cached_value("reviewer_rejections", REVIEWER_REJECTIONS_CACHE_SECONDS)
+    if cached is not None:
+        return [dict(rejection) for rejection in cached]
+    
     with get_connection() as conn:
         try:
             query = """
-                SELECT fr.request_id, fr.reviewer_rejection_reason, fr.reviewer_response_date,
-                       req.first_name as requester_first, req.last_name as requester_last,
+                SELECT fr.request_id, fr.reviewer_rejection_reason as rejection_reason,
+                       fr.reviewer_response_date as rejection_date,
+                       req.first_name || ' ' || req.last_name as requester_name,
                        req.email as requester_email, req.vertical as requester_vertical,
-                       rev.first_name as reviewer_first, rev.last_name as reviewer_last,
+                       rev.first_name || ' ' || rev.last_name as reviewer_name,
                        rev.email as reviewer_email, rev.vertical as reviewer_vertical,
-                       fr.relationship_type, rc.cycle_display_name
+                       fr.relationship_type, rc.cycle_display_name as cycle_name
                 FROM feedback_requests fr
                 JOIN users req ON fr.requester_id = req.user_type_id
                 JOIN users rev ON fr.reviewer_id = rev.user_type_id
@@ -2605,25 +3146,9 @@ def get_reviewer_rejections_for_hr():
                 WHERE fr.reviewer_status = 'rejected'
                 ORDER BY fr.reviewer_response_date DESC
             """
-            result = conn.execute(query)
-            
-            rejections = []
-            for row in result.fetchall():
-                rejections.append({
-                    'request_id': row[0],
-                    'rejection_reason': row[1],
-                    'rejection_date': row[2],
-                    'requester_name': f"{row[3]} {row[4]}",
-                    'requester_email': row[5],
-                    'requester_vertical': row[6],
-                    'reviewer_name': f"{row[7]} {row[8]}",
-                    'reviewer_email': row[9],
-                    'reviewer_vertical': row[10],
-                    'relationship_type': row[11],
-                    'cycle_name': row[12]
-                })
-            
-            return rejections
+            rejections = conn.execute(query).fetchall_dicts()
+            set_cached_value("reviewer_rejections", rejections, REVIEWER_REJECTIONS_CACHE_SECONDS)
+            return [dict(rejection) for rejection in rejections]
         except Exception as e:
             logger.error(f"Error fetching reviewer rejections: {e}")
             return []
@@ -2632,34 +3157,33 @@ def get_reviewer_rejections_for_hr():
 def get_user_cycle_history(user_id):
     """Get a user's participation history across cycles."""
     with get_connection() as conn:
+        # Aggregate each role separately, then join per cycle (avoids the requester x reviewer fan-out)
         query = """
-            SELECT DISTINCT rc.cycle_id, rc.cycle_display_name, rc.cycle_year, rc.cycle_quarter,
-                   COUNT(DISTINCT fr_as_requester.request_id) as requested_reviews,
-                   COUNT(DISTINCT fr_as_reviewer.request_id) as completed_reviews,
+            WITH req AS (
+                SELECT cycle_id, COUNT(*) AS c
+                FROM feedback_requests
+                WHERE requester_id = ?
+                GROUP BY cycle_id
+            ),
+            rev AS (
+                SELECT cycle_id, COUNT(*) AS c
+                FROM feedback_requests
+                WHERE reviewer_id = ? AND status = 'completed'
+                GROUP BY cycle_id
+            )
+            SELECT rc.cycle_id, rc.cycle_display_name AS display_name,
+                   rc.cycle_year AS year, rc.cycle_quarter AS quarter,
+                   COALESCE(req.c, 0) as requested_reviews,
+                   COALESCE(rev.c, 0) as completed_reviews,
                    rc.created_at
             FROM review_cycles rc
-            LEFT JOIN feedback_requests fr_as_requester ON rc.cycle_id = fr_as_requester.cycle_id 
-                AND fr_as_requester.requester_id = ?
-            LEFT JOIN feedback_requests fr_as_reviewer ON rc.cycle_id = fr_as_reviewer.cycle_id 
-                AND fr_as_reviewer.reviewer_id = ? AND fr_as_reviewer.status = 'completed'
-            WHERE (fr_as_requester.request_id IS NOT NULL OR fr_as_reviewer.request_id IS NOT NULL)
-            GROUP BY rc.cycle_id, rc.cycle_display_name, rc.cycle_year, rc.cycle_quarter, rc.created_at
+            LEFT JOIN req ON req.cycle_id = rc.cycle_id
+            LEFT JOIN rev ON rev.cycle_id = rc.cycle_id
+            WHERE req.cycle_id IS NOT NULL OR rev.cycle_id IS NOT NULL
             ORDER BY rc.created_at DESC
         """
         try:
-            result = conn.execute(query, (user_id, user_id))
-            history = []
-            for row in result.fetchall():
-                history.append({
-                    'cycle_id': row[0],
-                    'display_name': row[1],
-                    'year': row[2],
-                    'quarter': row[3],
-                    'requested_reviews': row[4],
-                    'completed_reviews': row[5],
-                    'created_at': row[6]
-                })
-            return history
+            return conn.execute(query, (user_id, user_id)).fetchall_dicts()
         except Exception as e:
             logger.error(f"Error getting user cycle history: {e}")
             return []
@@ -2674,18 +3198,22 @@ def create_new_review_cycle(cycle_name, nomination_start, nomination_deadline, f
                 INSERT INTO review_cycles 
                 (cycle_name, nomination_start_date, nomination_deadline, feedback_deadline, is_active, created_by)
                 VALUES (?, ?, ?, ?, 1, ?)
+                RETURNING cycle_id
             """
-            result = conn.execute(insert_query, (
-                cycle_name, nomination_start, nomination_deadline, feedback_deadline, created_by
-            ))
+            # Only deactivate other cycles after successfully creating the new one (same transaction)
+            deactivate_query = "UPDATE review_cycles SET is_active = 0 WHERE cycle_id != last_insert_rowid()"
+            insert_result, _ = conn.execute_batch([
+                (insert_query, (cycle_name, nomination_start, nomination_deadline, feedback_deadline, created_by)),
+                (deactivate_query, None),
+            ])
             
-            new_cycle_id = result.lastrowid
-            
-            # Only deactivate other cycles after successfully creating the new one
-            deactivate_query = "UPDATE review_cycles SET is_active = 0 WHERE cycle_id != ?"
-            conn.execute(deactivate_query, (new_cycle_id,))
+            cycle_row = insert_result.fetchone()
+            if not cycle_row:
+                raise Exception("Failed to retrieve created cycle ID")
+            new_cycle_id = cycle_row[0]
             
             conn.commit()
+            _invalidate_active_cycle()
             logger.info(f"Successfully created new cycle with ID {new_cycle_id} and deactivated others")
             return True
         except Exception as e:
@@ -2712,6 +3240,7 @@ def update_cycle_deadlines(cycle_id, nomination_deadline, feedback_deadline):
             if verify_result.fetchone():
                 logger.info(f"Cycle deadlines updated successfully for cycle {cycle_id}")
                 conn.commit()
+                _invalidate_active_cycle()
                 return True
             else:
                 logger.warning(f"No active cycle found with ID {cycle_id}")
@@ -2724,6 +3253,9 @@ def update_cycle_deadlines(cycle_id, nomination_deadline, feedback_deadline):
 
 def create_user_deadline_extension_table():
     """Create the user deadline extensions table if it doesn't exist."""
+    global _DEADLINE_EXTENSION_TABLE_ENSURED
+    if _DEADLINE_EXTENSION_TABLE_ENSURED:
+        return True
     with get_connection() as conn:
         try:
             conn.execute("""
@@ -2744,6 +3276,7 @@ def create_user_deadline_extension_table():
                 )
             """)
             conn.commit()
+            _DEADLINE_EXTENSION_TABLE_ENSURED = True
             logger.info("User deadline extensions table created/verified successfully")
             return True
         except Exception as e:
@@ -2772,22 +3305,25 @@ def handle_reviewer_response_OLD(request_id, reviewer_id, action, rejection_reas
             if not rejection_reason or not rejection_reason.strip():
                 return False, "Rejection reason is required"
             
-            conn.execute("""
-                UPDATE feedback_requests 
-                SET reviewer_status = 'rejected', reviewer_response_date = CURRENT_TIMESTAMP,
-                    reviewer_rejection_reason = ?
-                WHERE request_id = ? AND reviewer_id = ?
-            """, (rejection_reason.strip(), request_id, reviewer_id))
-            
-            conn.execute("""
-                UPDATE reviewer_nominations 
-                SET nomination_count = CASE 
-                    WHEN nomination_count > 0 THEN nomination_count - 1 
-                    ELSE 0 
-                END,
-                last_updated = CURRENT_TIMESTAMP
-                WHERE reviewer_id = ?
-            """, (reviewer_id,))
+            # Rejection and nomination-count release commit together
+            with conn.transaction() as tx:
+                tx.execute("""
+                    UPDATE feedback_requests 
+                    SET reviewer_status = 'rejected', reviewer_response_date = CURRENT_TIMESTAMP,
+                        reviewer_rejection_reason = ?
+                    WHERE request_id = ? AND reviewer_id = ?
+                """, (rejection_reason.strip(), request_id, reviewer_id))
+                
+                tx.execute("""
+                    UPDATE reviewer_nominations 
+                    SET nomination_count = CASE 
+                        WHEN nomination_count > 0 THEN nomination_count - 1 
+                        ELSE 0 
+                    END,
+                    last_updated = CURRENT_TIMESTAMP
+                    WHERE reviewer_id = ?
+                """, (reviewer_id,))
+            invalidate_reviewer_rejections()
         
         conn.commit()
         return True, "Response recorded successfully"
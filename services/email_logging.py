@@ -4,11 +4,131 @@ Centralizes email logging patterns across the application.
 This is a safe refactor that doesn't change any functionality.
 """
 
-from typing import Optional
+import logging
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Iterable, Optional
 from services.db_helper import get_connection, get_active_review_cycle
+from services import email_logging_writer
 
+logger = logging.getLogger(__name__)
 
-def log_email_basic(email_type: str, subject: str, status: str = "sent", recipient_email: Optional[str] = None):
+
+def _utc_timestamp() -> str:
+    """Current UTC time in SQLite's datetime('now') format, bound as a parameter."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+_SQL_BASIC = """
+    INSERT INTO email_logs (email_type, subject, status, recipient_email)
+    VALUES (?, ?, ?, ?)
+"""
+
+# A missing cycle_id is filled with the active cycle inside the INSERT
+_SQL_ENHANCED = """
+    INSERT INTO email_logs (
+        email_type, subject, status, email_category,
+        recipient_email, recipient_name, initiated_by, 
+        cycle_id, request_id, sent_at
+    ) VALUES (
+        ?, ?, ?, ?, ?, ?, ?,
+        COALESCE(?, (SELECT cycle_id FROM review_cycles WHERE is_active = 1 LIMIT 1)),
+        ?, ?
+    )
+    RETURNING log_id
+"""
+
+_SQL_BULK_MASTER = """
+    INSERT INTO email_logs (
+        email_type, subject, status, email_category, 
+        initiated_by, cycle_id, sent_at
+    ) VALUES (?, ?, 'sent', ?, ?, ?, ?)
+    RETURNING log_id
+"""
+
+# Bulk recipient rows are written as multi-row INSERTs of up to this many rows
+# (8 bound values per row keeps each statement under SQLite's 999-variable limit)
+BULK_ROWS_PER_INSERT = 100
+
+_SQL_BULK_RECIPIENTS = """
+    INSERT INTO email_logs (
+        email_type, subject, status, email_category,
+        recipient_email, recipient_name, initiated_by, 
+        cycle_id, request_id, sent_at
+    ) VALUES {rows}
+    RETURNING log_id
+"""
+_SQL_BULK_RECIPIENT_ROW = "(?, ?, 'sent', ?, ?, ?, ?, ?, NULL, ?)"
+
+_SQL_RECIPIENT = """
+    INSERT INTO email_recipients (
+        log_id, user_id, email, name, status, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Only valid directly after the email_logs INSERT it belongs to
+_SQL_RECIPIENT_FOR_LAST_LOG = """
+    INSERT INTO email_recipients (
+        log_id, user_id, email, name, status, created_at
+    ) VALUES (last_insert_rowid(), ?, ?, ?, ?, ?)
+"""
+
+_SQL_FAILURE = """
+    INSERT INTO email_logs (
+        email_type, subject, status, recipient_email, sent_at
+    ) VALUES (?, ?, 'failed', ?, ?)
+"""
+
+
+def flush_email_logs():
+    """
+    Block until every queued email log row has been written.
+    
+    Log rows are written in batches by a background writer thread
+    (services/email_logging_writer.py); request handlers can call this when they
+    need the rows to be visible before continuing.
+    """
+    email_logging_writer.flush()
+
+
+def _queue_email_log(*statements):
+    """Queue one log event's (sql, params) statements for the background writer."""
+    email_logging_writer.enqueue(statements)
+
+
+# Flipped once an enhanced INSERT fails on a missing column, so later calls go
+# straight to log_email_basic instead of failing the same way again
+_enhanced_schema_ok = True
+
+
+def _is_schema_mismatch(error: BaseException) -> bool:
+    """True if error says email_logs lacks the enhanced columns."""
+    message = str(error).lower()
+    return "no such column" in message or "has no column" in message
+
+
+def _log_id_future(results_future: Future) -> Future:
+    """Map a writer Future for an event whose first statement RETURNs log_id to that id."""
+    log_id_future = Future()
+    
+    def _resolve(done: Future):
+        if done.exception() is not None:
+            log_id_future.set_exception(done.exception())
+        else:
+            log_id_future.set_result(done.result()[0].fetchone()[0])
+    
+    results_future.add_done_callback(_resolve)
+    return log_id_future
+
+
+def log_email_basic(
+    email_type: str,
+    subject: str,
+    status: str = "sent",
+    recipient_email: Optional[str] = None,
+    flush_now: bool = False
+):
     """
     Basic email logging for backward compatibility.
     
@@ -17,20 +137,20 @@ def log_email_basic(email_type: str, subject: str, status: str = "sent", recipie
         subject: Email subject line
         status: Email status (sent, failed, pending)
         recipient_email: Optional recipient email
+        flush_now: Write immediately instead of queueing for the background writer
     """
+    statement = (_SQL_BASIC, (email_type, subject, status, recipient_email))
+    if not flush_now:
+        _queue_email_log(statement)
+        return
+    
     try:
         conn = get_connection()
-        conn.execute(
-            """
-            INSERT INTO email_logs (email_type, subject, status, recipient_email)
-            VALUES (?, ?, ?, ?)
-            """,
-            (email_type, subject, status, recipient_email)
-        )
+        conn.execute(*statement)
         conn.commit()
     except Exception as e:
         # Silent fail to not break email sending
-        print(f"Email logging failed: {e}")
+        logger.warning("Email logging failed: %s", e)
 
 
 def log_email_enhanced(
@@ -42,11 +162,19 @@ def log_email_enhanced(
     recipient_name: Optional[str] = None,
     initiated_by: Optional[int] = None,
     cycle_id: Optional[int] = None,
-    request_id: Optional[int] = None
+    request_id: Optional[int] = None,
+    recipient_user_id: Optional[int] = None,
+    recipient_status: Optional[str] = None,
+    flush_now: bool = False,
+    return_future: bool = False
 ):
     """
     Enhanced email logging with full metadata.
     
+    The row is queued for the background writer unless flush_now is set. The new
+    log_id is returned directly with flush_now, as a Future with return_future,
+    and not at all otherwise.
+    
     Args:
         email_type: Type of email being sent
         subject: Email subject line  
@@ -57,45 +185,67 @@ def log_email_enhanced(
         initiated_by: User ID who initiated the email
         cycle_id: Review cycle ID (auto-detected if None)
         request_id: Associated feedback request ID
+        recipient_user_id: With recipient_status, also log an email_recipients row
+        recipient_status: Delivery status for the email_recipients row
+        flush_now: Write immediately and return the log_id instead of queueing
+        return_future: Queue the row and return a Future resolving to its log_id
     """
+    global _enhanced_schema_ok
+    if not _enhanced_schema_ok:
+        log_email_basic(email_type, subject, status, recipient_email, flush_now=flush_now)
+        return None
+    
     try:
-        conn = get_connection()
+        sent_at = _utc_timestamp()
         
-        # Auto-detect cycle if not provided
-        if cycle_id is None:
-            active_cycle = get_active_review_cycle()
-            if active_cycle:
-                cycle_id = active_cycle['cycle_id']
-        
-        # Insert into enhanced email_logs structure
-        cursor = conn.execute(
-            """
-            INSERT INTO email_logs (
-                email_type, subject, status, email_category,
-                recipient_email, recipient_name, initiated_by, 
-                cycle_id, request_id, sent_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
-            """,
+        # Insert into enhanced email_logs structure; the caller never looks up the cycle
+        statements = [(
+            _SQL_ENHANCED,
             (
                 email_type, subject, status, email_category,
                 recipient_email, recipient_name, initiated_by,
-                cycle_id, request_id
+                cycle_id, request_id, sent_at
             )
-        )
-        conn.commit()
-        return cursor.lastrowid
+        )]
+        if recipient_status is not None and recipient_email:
+            # Written right after the log row, so last_insert_rowid() is its log_id
+            statements.append((
+                _SQL_RECIPIENT_FOR_LAST_LOG,
+                (recipient_user_id or 0, recipient_email, recipient_name, recipient_status, sent_at)
+            ))
+        
+        if not flush_now:
+            results_future = email_logging_writer.submit(statements)
+            
+            def _fallback_if_schema_mismatch(done: Future):
+                global _enhanced_schema_ok
+                error = done.exception()
+                if error is not None and _is_schema_mismatch(error):
+                    _enhanced_schema_ok = False
+                    log_email_basic(email_type, subject, status, recipient_email)
+            
+            results_future.add_done_callback(_fallback_if_schema_mismatch)
+            return _log_id_future(results_future) if return_future else None
+        
+        results = get_connection().execute_batch(statements)
+        return results[0].fetchone()[0]
         
     except Exception as e:
+        if not _is_schema_mismatch(e):
+            # Not a schema problem (network, lock, ...): a second write would fail too
+            logger.warning("Enhanced email logging failed: %s", e)
+            return None
         # Fallback to basic logging if enhanced schema fails
-        print(f"Enhanced email logging failed, falling back to basic: {e}")
-        log_email_basic(email_type, subject, status, recipient_email)
+        logger.warning("Enhanced email logging failed, falling back to basic: %s", e)
+        _enhanced_schema_ok = False
+        log_email_basic(email_type, subject, status, recipient_email, flush_now=flush_now)
         return None
 
 
 def log_bulk_email_batch(
     email_type: str,
     subject: str,
-    recipients: list,
+    recipients: Iterable,
     initiated_by: Optional[int] = None,
     email_category: str = "targeted"
 ):
@@ -105,7 +255,7 @@ def log_bulk_email_batch(
     Args:
         email_type: Type of email being sent
         subject: Email subject line
-        recipients: List of recipient tuples (email, name, user_id)
+        recipients: Iterable of recipient tuples (email, name, user_id)
         initiated_by: User ID who initiated the email
         email_category: Category (targeted, automation)
         
@@ -115,46 +265,45 @@ def log_bulk_email_batch(
     try:
         conn = get_connection()
         
-        # Get active cycle
+        # Get active cycle once for the whole batch (memoized in db_helper)
         active_cycle = get_active_review_cycle()
         cycle_id = active_cycle['cycle_id'] if active_cycle else None
         
-        # Create a master log entry for the batch
-        cursor = conn.execute(
-            """
-            INSERT INTO email_logs (
-                email_type, subject, status, email_category, 
-                initiated_by, cycle_id, sent_at
-            ) VALUES (?, ?, 'sent', ?, ?, ?, datetime('now'))
-            """,
-            (email_type, subject, email_category, initiated_by, cycle_id)
-        )
-        master_log_id = cursor.lastrowid
+        # Every row in the batch shares one sent_at
+        sent_at = _utc_timestamp()
         
-        # Create individual recipient records
-        individual_log_ids = []
-        for recipient in recipients:
-            if len(recipient) >= 2:
-                recipient_email = recipient[0]
-                recipient_name = recipient[1]
-                
-                log_id = log_email_enhanced(
-                    email_type=email_type,
-                    subject=subject,
-                    status="sent",
-                    email_category=email_category,
-                    recipient_email=recipient_email,
-                    recipient_name=recipient_name,
-                    initiated_by=initiated_by,
-                    cycle_id=cycle_id
-                )
-                if log_id:
-                    individual_log_ids.append(log_id)
+        # Master entry and multi-row recipient INSERTs go out as a single atomic
+        # batch; RETURNING hands back the ids, so no per-recipient insert/commit
+        statements = [(
+            _SQL_BULK_MASTER,
+            (email_type, subject, email_category, initiated_by, cycle_id, sent_at)
+        )]
+        # Recipients are consumed lazily, one INSERT chunk at a time
+        recipient_pairs = ((recipient[0], recipient[1]) for recipient in recipients if len(recipient) >= 2)
+        while True:
+            chunk = list(islice(recipient_pairs, BULK_ROWS_PER_INSERT))
+            if not chunk:
+                break
+            params = []
+            for recipient_email, recipient_name in chunk:
+                params.extend((
+                    email_type, subject, email_category, recipient_email, recipient_name,
+                    initiated_by, cycle_id, sent_at
+                ))
+            statements.append((
+                _SQL_BULK_RECIPIENTS.format(rows=", ".join([_SQL_BULK_RECIPIENT_ROW] * len(chunk))),
+                params
+            ))
+        
+        results = conn.execute_batch(statements)
+        master_log_id = results[0].fetchone()[0]
+        # RETURNING order is unspecified; ids are allocated in row order within the batch
+        individual_log_ids = sorted(row[0] for result in results[1:] for row in result)
         
         return master_log_id, individual_log_ids
         
     except Exception as e:
-        print(f"Bulk email logging failed: {e}")
+        logger.warning("Bulk email logging failed: %s", e)
         # Fallback to basic logging
         log_email_basic(email_type, subject, "sent")
         return None, []
@@ -165,7 +314,8 @@ def log_email_recipient_details(
     user_id: int,
     email: str,
     name: str,
-    status: str = "delivered"
+    status: str = "delivered",
+    flush_now: bool = False
 ):
     """
     Log detailed recipient information for an email.
@@ -176,24 +326,29 @@ def log_email_recipient_details(
         email: Recipient email
         name: Recipient name
         status: Delivery status
+        flush_now: Write immediately instead of queueing for the background writer
     """
+    statement = (_SQL_RECIPIENT, (log_id, user_id, email, name, status, _utc_timestamp()))
+    if not flush_now:
+        _queue_email_log(statement)
+        return
+    
     try:
         conn = get_connection()
-        conn.execute(
-            """
-            INSERT INTO email_recipients (
-                log_id, user_id, email, name, status, created_at
-            ) VALUES (?, ?, ?, ?, ?, datetime('now'))
-            """,
-            (log_id, user_id, email, name, status)
-        )
+        conn.execute(*statement)
         conn.commit()
     except Exception as e:
         # Silent fail to not break email sending
-        print(f"Recipient logging failed: {e}")
+        logger.warning("Recipient logging failed: %s", e)
 
 
-def log_email_failure(email_type: str, subject: str, error: str, recipient_email: Optional[str] = None):
+def log_email_failure(
+    email_type: str,
+    subject: str,
+    error: str,
+    recipient_email: Optional[str] = None,
+    flush_now: bool = False
+):
     """
     Log failed email attempts with error details.
     
@@ -202,17 +357,19 @@ def log_email_failure(email_type: str, subject: str, error: str, recipient_email
         subject: Email subject line
         error: Error message or description
         recipient_email: Optional recipient email
+        flush_now: Write immediately instead of queueing for the background writer
     """
+    statement = (
+        _SQL_FAILURE,
+        (email_type, f"{subject} [ERROR: {error}]", recipient_email, _utc_timestamp())
+    )
+    if not flush_now:
+        _queue_email_log(statement)
+        return
+    
     try:
         conn = get_connection()
-        conn.execute(
-            """
-            INSERT INTO email_logs (
-                email_type, subject, status, recipient_email, sent_at
-            ) VALUES (?, ?, 'failed', ?, datetime('now'))
-            """,
-            (email_type, f"{subject} [ERROR: {error}]", recipient_email)
-        )
+        conn.execute(*statement)
         conn.commit()
     except Exception as e:
-        print(f"Failed email logging failed: {e}")
\ No newline at end of file
+        logger.warning("Failed email logging failed: %s", e)
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""
+Email Logging Writer
+Single background thread that writes queued email log rows in batches,
+so the email-sending path only pays for a queue put.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import List, Optional
+
+from services.db_helper import get_connection
+from services.turso_connection import TursoConnection
+
+logger = logging.getLogger(__name__)
+
+
+# Most log events drained from the queue into one batch round-trip
+MAX_EVENTS_PER_BATCH = 128
+
+# Longest interpreter exit waits for queued logs (e.g. while Turso is unreachable)
+EXIT_FLUSH_TIMEOUT_SECONDS = 5
+
+# Each item is (statements, future): statements is the list of (sql, params)
+# for one log event, written back-to-back; future (optional) receives that
+# event's per-statement results.
+_queue = queue.Queue()
+
+# Created on the writer thread and used only there
+_write_conn: Optional[TursoConnection] = None
+
+
+def enqueue(statements: List[tuple], future: Optional[Future] = None):
+    """Queue one log event's (sql, params) statements for the writer thread."""
+    _queue.put((list(statements), future))
+
+
+def submit(statements: List[tuple]) -> Future:
+    """Queue one log event and return a Future resolving to its statement results."""
+    future = Future()
+    enqueue(statements, future)
+    return future
+
+
+def flush(timeout: Optional[float] = None) -> bool:
+    """
+    Block until every event queued so far has been written, or until timeout seconds
+    have passed. Returns False if events were still pending at the timeout.
+    """
+    if timeout is None:
+        _queue.join()
+        return True
+    waiter = threading.Thread(target=_queue.join, name="email-log-flush", daemon=True)
+    waiter.start()
+    waiter.join(timeout)
+    return not waiter.is_alive()
+
+
+def _flush_at_exit():
+    if not flush(EXIT_FLUSH_TIMEOUT_SECONDS):
+        logger.warning(
+            "Email logging: gave up on %d queued events at exit", _queue.qsize()
+        )
+
+
+def _get_write_connection() -> TursoConnection:
+    """
+    The writer's own connection, opened once from the shared connection's credentials.
+    Its HTTP session is never shared with request threads, and batches skip the
+    get_connection() lookup.
+    """
+    global _write_conn
+    if _write_conn is None:
+        shared = get_connection()
+        _write_conn = TursoConnection(shared.database_url, shared.auth_token)
+    return _write_conn
+
+
+def _write_events(events):
+    """Write a drained set of events as one batch, falling back to event-by-event."""
+    conn = _get_write_connection()
+    try:
+        results = conn.execute_batch([statement for statements, _ in events for statement in statements])
+    except Exception as e:
+        # One bad row must not drop the rest of the batch; retry event by event
+        logger.warning("Email logging batch failed, retrying individually: %s", e)
+        for statements, future in events:
+            try:
+                event_results = conn.execute_batch(statements)
+            except Exception as event_error:
+                # Silent fail to not break email sending
+                logger.warning("Email logging failed: %s", event_error)
+                if future is not None:
+                    future.set_exception(event_error)
+            else:
+                if future is not None:
+                    future.set_result(event_results)
+        return
+
+    offset = 0
+    for statements, future in events:
+        if future is not None:
+            future.set_result(results[offset:offset + len(statements)])
+        offset += len(statements)
+
+
+def _writer_loop():
+    while True:
+        events = [_queue.get()]
+        while len(events) < MAX_EVENTS_PER_BATCH:
+            try:
+                events.append(_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _write_events(events)
+        except Exception as e:
+            logger.exception("Email logging writer error")
+            # e.g. no write connection: fail the waiting callers instead of hanging them
+            for _, future in events:
+                if future is not None and not future.done():
+                    future.set_exception(e)
+        finally:
+            for _ in events:
+                _queue.task_done()
+
+
+_writer = threading.Thread(target=_writer_loop, name="email-log-writer", daemon=True)
+_writer.start()
+
+# The writer is a daemon thread; drain what is queued before the interpreter exits,
+# but never hold up exit for long
+atexit.register(_flush_at_exit)
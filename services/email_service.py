@@ -19,11 +19,22 @@ try:
 except ImportError:  # Allow app to run without SendGrid installed
     sendgrid = None
     Mail = Email = To = Content = None
+import atexit
+import html
 import logging
+import random
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+from string import Template
 import sqlite3
 
+from services.email_logging import log_email_basic, log_email_enhanced
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -39,25 +50,90 @@ TEMP_EMAIL_WHITELIST = {
 }
 # --------------------------------------------------------------
 
+# Notification emails are queued off the request thread so the UI does not wait on them
+_MAIL_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mailer")
+atexit.register(_MAIL_POOL.shutdown, wait=True)
+
+
+def _log_mail_task_error(future):
+    """Log failures of background email tasks (they have no caller to report to)."""
+    error = future.exception()
+    if error:
+        logger.error(f"Background email task failed: {error}")
+
+
+def send_email_in_background(send_func, *args, **kwargs):
+    """
+    Run one of the send_* helpers on the mail pool and return immediately.
+    Pass plain values only - never connection handles or Streamlit objects.
+    """
+    future = _MAIL_POOL.submit(send_func, *args, **kwargs)
+    future.add_done_callback(_log_mail_task_error)
+    return future
+
+
+DEFAULT_SENDER_EMAIL = "noreply@tech4dev.com"
+
+# [email] section of secrets.toml; configured is False when the section is missing
+EmailConfig = namedtuple(
+    "EmailConfig",
+    [
+        "configured",
+        "smtp_server",
+        "smtp_port",
+        "email_user",
+        "email_password",
+        "from_email",
+        "sendgrid_rate_per_second",
+        "worker_parallelism",
+    ],
+)
+
+# SendGrid API calls per second when email.sendgrid_rate_per_second is not set
+SENDGRID_SENDS_PER_SECOND = 10.0
+
+
+@lru_cache(maxsize=1)
+def _email_cfg() -> EmailConfig:
+    """Email settings, read from st.secrets once per process."""
+    if "email" not in st.secrets:
+        return EmailConfig(
+            False, None, 587, None, None, None, SENDGRID_SENDS_PER_SECOND, None
+        )
+    cfg = st.secrets["email"]
+    return EmailConfig(
+        True,
+        cfg.get("smtp_server"),
+        int(cfg.get("smtp_port", 587)),
+        cfg.get("email_user"),
+        cfg.get("email_password"),
+        cfg.get("from_email"),
+        float(cfg.get("sendgrid_rate_per_second", SENDGRID_SENDS_PER_SECOND)),
+        cfg.get("worker_parallelism"),
+    )
+
+
+@lru_cache(maxsize=1)
+def _sg_client():
+    """The process-wide SendGrid client, or None when it cannot be built."""
+    cfg = _email_cfg()
+    if not cfg.configured:
+        logger.error("Email configuration not found in streamlit secrets")
+        return None
+    # SendGrid API key may be stored as email_password
+    if not cfg.email_password:
+        logger.error("SendGrid API key not found in email.email_password")
+        return None
+    if sendgrid:
+        return sendgrid.SendGridAPIClient(api_key=cfg.email_password)
+    else:
+        return None
+
 
 def get_sendgrid_client():
     """Initialize SendGrid client with API key from secrets."""
     try:
-        # Use existing email configuration from secrets.toml
-        if "email" in st.secrets:
-            api_key = st.secrets["email"].get(
-                "email_password"
-            )  # SendGrid API key may be stored as email_password
-            if not api_key:
-                logger.error("SendGrid API key not found in email.email_password")
-                return None
-            if sendgrid:
-                return sendgrid.SendGridAPIClient(api_key=api_key)
-            else:
-                return None
-        else:
-            logger.error("Email configuration not found in streamlit secrets")
-            return None
+        return _sg_client()
     except Exception as e:
         logger.error(f"Failed to initialize SendGrid client: {e}")
         return None
@@ -66,13 +142,21 @@ def get_sendgrid_client():
 def get_sender_email():
     """Get sender email from secrets."""
     try:
-        if "email" in st.secrets:
-            return st.secrets["email"].get("from_email", "noreply@tech4dev.com")
-        else:
-            return "noreply@tech4dev.com"
+        return _email_cfg().from_email or DEFAULT_SENDER_EMAIL
     except Exception as e:
         logger.warning(f"Failed to get sender email: {e}")
-        return "noreply@tech4dev.com"
+        return DEFAULT_SENDER_EMAIL
+
+
+# System-generated email types; everything else is logged as "targeted"
+AUTOMATION_EMAIL_TYPES = frozenset(
+    {
+        "external_stakeholder_invite",
+        "manager_approval_notification",
+        "reviewer_acceptance",
+        "feedback_reminder",
+    }
+)
 
 
 def log_email_sent(
@@ -86,27 +170,22 @@ def log_email_sent(
     request_id: int = None,
     initiated_by: int = None,
 ):
-    """Enhanced email logging to the new email_logs structure."""
+    """
+    Enhanced email logging to the new email_logs structure.
+    Only queues the rows; the email logging writer thread batches them into the database.
+    """
     try:
-        # Use centralized email logging service
-        from .email_logging import log_email_enhanced, log_email_recipient_details
-
         # Determine status based on success
         status = "sent" if success else "failed"
 
         # Categorize email type - automation emails are system-generated
-        if email_type in [
-            "external_stakeholder_invite",
-            "manager_approval_notification",
-            "reviewer_acceptance",
-            "feedback_reminder",
-        ]:
+        if email_type in AUTOMATION_EMAIL_TYPES:
             email_category = "automation"
         else:
             email_category = "targeted"
 
-        # Log the email using centralized service
-        log_id = log_email_enhanced(
+        # Log the email and its recipient row using centralized service (buffered)
+        log_email_enhanced(
             email_type=email_type,
             subject=subject,
             status=status,
@@ -116,25 +195,15 @@ def log_email_sent(
             initiated_by=initiated_by,
             cycle_id=cycle_id,
             request_id=request_id,
+            recipient_user_id=initiated_by or 0,
+            recipient_status="delivered" if success else "failed",
         )
 
-        # Log recipient details if we got a log ID back
-        if log_id and to_email:
-            log_email_recipient_details(
-                log_id=log_id,
-                user_id=initiated_by or 0,
-                email=to_email,
-                name=recipient_name or "Unknown Recipient",
-                status="delivered" if success else "failed",
-            )
-
     except Exception as e:
         logger.warning(f"Failed to log email with enhanced structure: {e}")
 
         # Fallback to basic logging using centralized service
         try:
-            from .email_logging import log_email_basic
-
             log_email_basic(
                 email_type, subject, "sent" if success else "failed", to_email
             )
@@ -142,19 +211,165 @@ def log_email_sent(
             logger.error(f"Even fallback email logging failed: {fallback_e}")
 
 
+# Messages sent over one SMTP connection before it is replaced (providers cap
+# messages per connection)
+SMTP_MESSAGES_PER_CONNECTION = 100
+
+# A connection idle this long gets a NOOP before reuse; the server may have dropped it
+SMTP_IDLE_CHECK_SECONDS = 30
+
+
+class PipeliningSMTP(smtplib.SMTP):
+    """
+    smtplib.SMTP that writes MAIL FROM and every RCPT TO in one go and then reads
+    their replies (RFC 2920 PIPELINING), saving a round-trip per command.
+    Falls back to the standard sendmail when the server does not advertise it.
+    """
+
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=(), rcpt_options=()):
+        self.ehlo_or_helo_if_needed()
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+        commands = [f"MAIL FROM:{smtplib.quoteaddr(from_addr)}"] + [
+            f"RCPT TO:{smtplib.quoteaddr(to_addr)}" for to_addr in to_addrs
+        ]
+        if (
+            not self.has_extn("pipelining")
+            or mail_options
+            or rcpt_options
+            or not all(command.isascii() for command in commands)
+        ):
+            return super().sendmail(from_addr, to_addrs, msg, mail_options, rcpt_options)
+
+        self.send("".join(f"{command}\r\n" for command in commands))
+        # Every pipelined command gets a reply, in order, even after a failure
+        replies = [self.getreply() for _ in commands]
+
+        mail_code, mail_resp = replies[0]
+        if mail_code != 250:
+            if mail_code == 421:
+                self.close()
+            else:
+                self._rset()
+            raise smtplib.SMTPSenderRefused(mail_code, mail_resp, from_addr)
+
+        refused = {
+            to_addr: reply
+            for to_addr, reply in zip(to_addrs, replies[1:])
+            if reply[0] not in (250, 251)
+        }
+        if len(refused) == len(to_addrs):
+            self._rset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+
+        code, resp = self.data(msg)
+        if code != 250:
+            if code == 421:
+                self.close()
+            else:
+                self._rset()
+            raise smtplib.SMTPDataError(code, resp)
+        return refused
+
+
+class SmtpSession:
+    """
+    One authenticated SMTP connection reused across sends.
+    Connects lazily, rotates after SMTP_MESSAGES_PER_CONNECTION messages and
+    reconnects (retrying once) if the server has dropped the connection.
+    """
+
+    def __init__(self, smtp_server: str, smtp_port: int, email_user: str, email_password: str):
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.email_user = email_user
+        self.email_password = email_password
+        self.server = None
+        self.sent_count = 0
+        self.last_used = 0.0
+
+    def _connect(self):
+        self.close()
+        server = PipeliningSMTP(self.smtp_server, self.smtp_port)
+        server.starttls()
+        server.login(self.email_user, self.email_password)
+        self.server = server
+        self.sent_count = 0
+
+    def _is_usable(self) -> bool:
+        if self.server is None or self.sent_count >= SMTP_MESSAGES_PER_CONNECTION:
+            return False
+        if time.monotonic() - self.last_used < SMTP_IDLE_CHECK_SECONDS:
+            return True
+        try:
+            return self.server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def send(self, from_email: str, to_addrs: List[str], msg_str: str):
+        """Send one message, reconnecting and retrying once if the connection dropped."""
+        if not self._is_usable():
+            self._connect()
+        try:
+            self.server.sendmail(from_email, to_addrs, msg_str)
+        except (smtplib.SMTPServerDisconnected, ConnectionError):
+            self._connect()
+            self.server.sendmail(from_email, to_addrs, msg_str)
+        self.sent_count += 1
+        self.last_used = time.monotonic()
+
+    def close(self):
+        if self.server is not None:
+            try:
+                self.server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.server = None
+
+
+# One session per sending thread; open ones are tracked so a worker can close them after a batch
+_smtp_local = threading.local()
+_open_smtp_sessions = set()
+_smtp_sessions_lock = threading.Lock()
+
+
+def get_smtp_session(
+    smtp_server: str, smtp_port: int, email_user: str, email_password: str
+) -> SmtpSession:
+    """Return this thread's SMTP session, creating it on first use."""
+    session = getattr(_smtp_local, "session", None)
+    if session is None:
+        session = SmtpSession(smtp_server, smtp_port, email_user, email_password)
+        _smtp_local.session = session
+    if session.server is None:
+        # About to (re)connect: track it until the next close_smtp_sessions()
+        with _smtp_sessions_lock:
+            _open_smtp_sessions.add(session)
+    return session
+
+
+def close_smtp_sessions():
+    """Close every tracked SMTP connection; a session used again reconnects lazily."""
+    with _smtp_sessions_lock:
+        sessions = list(_open_smtp_sessions)
+        _open_smtp_sessions.clear()
+    for session in sessions:
+        session.close()
+
+
 def _send_email_smtp(
     to_email: str, subject: str, html_body: str, text_body: Optional[str] = None
 ) -> bool:
     """Send email using SMTP settings from secrets (works with SendGrid SMTP relay)."""
     try:
-        if "email" not in st.secrets:
+        cfg = _email_cfg()
+        if not cfg.configured:
             return False
-        cfg = st.secrets["email"]
-        smtp_server = cfg.get("smtp_server")
-        smtp_port = int(cfg.get("smtp_port", 587))
-        email_user = cfg.get("email_user")
-        email_password = cfg.get("email_password")
-        from_email = cfg.get("from_email", email_user)
+        smtp_server = cfg.smtp_server
+        smtp_port = cfg.smtp_port
+        email_user = cfg.email_user
+        email_password = cfg.email_password
+        from_email = cfg.from_email or email_user
 
         if not (smtp_server and email_user and email_password and from_email):
             return False
@@ -169,11 +384,8 @@ def _send_email_smtp(
         if html_body:
             msg.attach(MIMEText(html_body, "html"))
 
-        server = smtplib.SMTP(smtp_server, smtp_port)
-        server.starttls()
-        server.login(email_user, email_password)
-        server.sendmail(from_email, [to_email], msg.as_string())
-        server.quit()
+        session = get_smtp_session(smtp_server, smtp_port, email_user, email_password)
+        session.send(from_email, [to_email], msg.as_string())
         return True
     except Exception as e:
         logger.error(f"SMTP send failed: {e}")
@@ -204,19 +416,146 @@ def send_email(
     Returns:
         bool: True if email queued successfully, False otherwise
     """
-    from services.db_helper import queue_email
+    return send_emails_bulk(
+        [
+            {
+                "to_email": to_email,
+                "subject": subject,
+                "html_body": html_body,
+                "text_body": text_body,
+                "email_type": email_type,
+            }
+        ]
+    )
+
+
+def send_emails_bulk(messages: List[Dict[str, Any]]) -> bool:
+    """
+    Queue several emails for background processing in bounded multi-row INSERTs.
 
-    # Queue the email for background processing
-    success = queue_email(to_email, subject, html_body, text_body, email_type)
+    Args:
+        messages: Dicts with to_email, subject, html_body and optionally
+            text_body and email_type (same meaning as send_email's arguments)
+
+    Returns:
+        bool: True if every email was queued, False otherwise
+    """
+    from services.db_helper import queue_emails_bulk
+
+    rows = [
+        (
+            message["to_email"],
+            message["subject"],
+            message["html_body"],
+            message.get("text_body"),
+            message.get("email_type", "general"),
+        )
+        for message in messages
+    ]
+    if not rows:
+        return True
+
+    # Queue the emails for background processing
+    success = queue_emails_bulk(rows)
 
     if success:
-        logger.info(f"[EMAIL-QUEUED] Email queued for {to_email} - type: {email_type}")
+        for to_email, _, _, _, email_type in rows:
+            logger.info(f"[EMAIL-QUEUED] Email queued for {to_email} - type: {email_type}")
     else:
-        logger.error(f"[EMAIL-QUEUE-FAILED] Failed to queue email for {to_email}")
+        recipients = ", ".join(row[0] for row in rows)
+        logger.error(f"[EMAIL-QUEUE-FAILED] Failed to queue one or more emails for {recipients}")
 
     return success
 
 
+# Attempts per email when SendGrid answers 429 or 5xx
+SENDGRID_MAX_ATTEMPTS = 5
+SENDGRID_BACKOFF_BASE_SECONDS = 0.5
+SENDGRID_BACKOFF_CAP_SECONDS = 30.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket: refills rate tokens per second, holding at most burst."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+@lru_cache(maxsize=1)
+def _sendgrid_rate_limiter() -> TokenBucket:
+    """One limiter shared by every sender thread in the process."""
+    rate = max(_email_cfg().sendgrid_rate_per_second, 0.1)
+    return TokenBucket(rate=rate, burst=2 * rate)
+
+
+def _sendgrid_retry_delay(response, attempt: int) -> float:
+    """Seconds before the next attempt: the server's hint on 429, else backoff with jitter."""
+    if response.status_code == 429:
+        headers = getattr(response, "headers", None) or {}
+        try:
+            retry_after = headers.get("Retry-After")
+            if retry_after:
+                return min(SENDGRID_BACKOFF_CAP_SECONDS, float(retry_after))
+            reset_at = headers.get("X-RateLimit-Reset")
+            if reset_at:
+                return min(
+                    SENDGRID_BACKOFF_CAP_SECONDS, max(0.0, float(reset_at) - time.time())
+                )
+        except (TypeError, ValueError):
+            pass
+    return min(
+        SENDGRID_BACKOFF_CAP_SECONDS,
+        SENDGRID_BACKOFF_BASE_SECONDS * 2**attempt + random.random(),
+    )
+
+
+def _sendgrid_send(sg_client, mail, to_email: str, subject: str, email_type: str):
+    """
+    Send through SendGrid within the process rate limit, retrying 429 and 5xx answers.
+    Returns the last response (or the HTTP error, which carries status_code and body).
+    """
+    limiter = _sendgrid_rate_limiter()
+    for attempt in range(SENDGRID_MAX_ATTEMPTS):
+        limiter.acquire()
+        try:
+            response = sg_client.send(mail)
+        except Exception as e:
+            # The SendGrid client raises for 4xx/5xx; its HTTP errors carry the status
+            if getattr(e, "status_code", None) is None:
+                raise
+            response = e
+
+        status = response.status_code
+        if (status == 429 or status >= 500) and attempt < SENDGRID_MAX_ATTEMPTS - 1:
+            delay = _sendgrid_retry_delay(response, attempt)
+            logger.warning(
+                f"SendGrid returned {status} for {to_email}, retrying in {delay:.1f}s"
+            )
+            log_email_sent(to_email, subject, email_type, False, "rate_limited_retrying")
+            time.sleep(delay)
+            continue
+        return response
+
+
 def _send_email_sync(
     to_email: str,
     subject: str,
@@ -243,8 +582,12 @@ def _send_email_sync(
         logger.warning(f"Whitelist check failed: {e}")
 
     # Prefer SMTP if configured (works without installing SendGrid SDK)
-    smtp_cfg = st.secrets.get("email", {}) if "email" in st.secrets else {}
-    if smtp_cfg.get("smtp_server"):
+    try:
+        smtp_server = _email_cfg().smtp_server
+    except Exception as e:
+        logger.warning(f"Failed to read email configuration: {e}")
+        smtp_server = None
+    if smtp_server:
         ok = _send_email_smtp(to_email, subject, html_body, text_body)
         if ok:
             log_email_sent(to_email, subject, email_type, True)
@@ -271,7 +614,7 @@ def _send_email_sync(
                 from_email, to_email_obj, subject, Content("text/html", html_body)
             )
 
-        response = sg_client.send(mail)
+        response = _sendgrid_send(sg_client, mail, to_email, subject, email_type)
         if response.status_code in [200, 202]:
             logger.info(
                 f"Email sent successfully to {to_email} - Status: {response.status_code}"
@@ -292,96 +635,325 @@ def _send_email_sync(
         return False, error_msg
 
 
-def send_external_stakeholder_invite(
-    external_email: str,
-    requester_name: str,
-    requester_designation: str,
-    cycle_name: str,
-    token: str,
-    feedback_deadline: str,
-    requester_vertical: str = "",
-    external_stakeholder_name: str = "",
-    cycle_id: int = None,
-    request_id: int = None,
-    initiated_by: int = None,
-) -> bool:
-    """Send invitation email to external stakeholder with token-based access."""
-
-    # Use production domain
-    app_url = "https://360feedback.projecttech4dev.org"
-
-    subject = f"Feedback Request from {requester_name} at Tech4Dev"
-
-    html_body = f"""
+# ---------------- EMAIL HTML TEMPLATES ----------------
+# Built once at import; each send_* call does a single substitute() per template.
+_BASE_HTML_TEMPLATE = Template(
+    """
     <!DOCTYPE html>
     <html>
     <head>
         <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .header {{ background-color: #1E4796; color: white; padding: 20px; text-align: center; }}
-            .header h1 {{ margin: 0; font-size: 24px; }}
-            .header h2 {{ margin: 5px 0 0 0; font-size: 18px; opacity: 0.9; }}
-            .content {{ padding: 20px; }}
-            .token-box {{ background-color: #f0f0f0; padding: 15px; border-left: 4px solid #1E4796; margin: 20px 0; }}
-            .steps {{ background-color: #f9f9f9; padding: 15px; border-radius: 5px; margin: 20px 0; }}
-            .footer {{ background-color: #f0f0f0; padding: 10px; text-align: center; font-size: 12px; }}
+            body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+            .header { background-color: #1E4796; color: white; padding: 20px; text-align: center; }
+            .header h1 { margin: 0; font-size: 24px; }
+            .header h2 { margin: 5px 0 0 0; font-size: 18px; opacity: 0.9; }
+            .content { padding: 20px; }
+            .info-box { background-color: #f0f8ff; padding: 15px; border-left: 4px solid #1E4796; margin: 20px 0; }
+            .token-box { background-color: #f0f0f0; padding: 15px; border-left: 4px solid #1E4796; margin: 20px 0; }
+            .steps { background-color: #f9f9f9; padding: 15px; border-radius: 5px; margin: 20px 0; }
+            .nominees-box { background-color: #fff8f0; padding: 15px; border-left: 4px solid #E55325; margin: 20px 0; }
+            .success-box { background-color: #f0fff0; padding: 15px; border-left: 4px solid #28a745; margin: 20px 0; }
+            .rejection-box { background-color: #fff5f5; padding: 15px; border-left: 4px solid #dc3545; margin: 20px 0; }
+            .warning-box { background-color: #fff8e1; padding: 15px; border-left: 4px solid #ffc107; margin: 20px 0; }
+            .footer { background-color: #f0f0f0; padding: 10px; text-align: center; font-size: 12px; }
         </style>
     </head>
     <body>
         <div class="header">
             <h1>Insight 360°</h1>
-            <h2>Feedback Request</h2>
+            <h2>$title</h2>
         </div>
         
         <div class="content">
-            <h2>Hi {external_stakeholder_name if external_stakeholder_name else "there"},</h2>
-            
-            <p><strong>{requester_name}</strong> ({requester_designation}{f", {requester_vertical}" if requester_vertical else ""}) 
+$body
+        </div>
+        
+        <div class="footer">
+            <p>This is an automated $footer from the Tech4Dev Insight 360°.</p>
+        </div>
+    </body>
+    </html>
+    """
+)
+
+# Content section of each email type; every $field is HTML-escaped when rendered
+_EMAIL_BODY_TEMPLATES = {
+    "external_stakeholder_invite": Template(
+        """
+            <h2>Hi $greeting_name,</h2>
+
+            <p><strong>$requester_name</strong> ($requester_role) 
             has requested your feedback as part of their 360° review at Tech4Dev.</p>
-            
+
             <p>Your insights and perspective are valuable for their professional development. 
             The feedback process is anonymous and should take about 10-15 minutes to complete.</p>
-            
+
             <div class="token-box">
                 <h3>Your Access Information:</h3>
-                <p><strong>Email:</strong> {external_email}</p>
-                <p><strong>Access Token:</strong> <code style="background-color: #e0e0e0; padding: 2px 5px;">{token}</code></p>
+                <p><strong>Email:</strong> $external_email</p>
+                <p><strong>Access Token:</strong> <code style="background-color: #e0e0e0; padding: 2px 5px;">$token</code></p>
             </div>
-            
+
             <div class="steps">
                 <h3>How to Provide Feedback:</h3>
                 <ol>
-                    <li>Visit the feedback portal: <a href="{app_url}">{app_url}</a></li>
+                    <li>Visit the feedback portal: <a href="$app_url">$app_url</a></li>
                     <li>Click "External Stakeholder Login"</li>
-                    <li>Enter your email address: <strong>{external_email}</strong></li>
-                    <li>Enter your access token: <strong>{token}</strong></li>
+                    <li>Enter your email address: <strong>$external_email</strong></li>
+                    <li>Enter your access token: <strong>$token</strong></li>
                     <li>Complete the feedback questions</li>
                 </ol>
             </div>
-            
+
             <p><strong>Important Details:</strong></p>
             <ul>
-                <li><strong>Feedback Deadline:</strong> {feedback_deadline}</li>
-                <li><strong>Review Cycle:</strong> {cycle_name}</li>
+                <li><strong>Feedback Deadline:</strong> $feedback_deadline</li>
+                <li><strong>Review Cycle:</strong> $cycle_name</li>
                 <li>Your feedback will remain completely anonymous</li>
                 <li>You can save your progress and return later using the same token</li>
                 <li>You can decline to participate if you don't have sufficient working relationship</li>
             </ul>
-            
+
             <p>If you have any questions or need assistance, please contact diana@projecttech4dev.org.</p>
-            
+
             <p>Thank you for taking the time to provide valuable feedback!</p>
-            
+
             <p>Best regards,<br>
             The Tech4Dev Team</p>
-        </div>
-        
-        <div class="footer">
-            <p>This is an automated message from the Tech4Dev Insight 360°.</p>
-        </div>
-    </body>
-    </html>
-    """
+        """
+    ),
+    "nominee_invite": Template(
+        """
+            <p>Hi $reviewer_name,</p>
+
+            <p>You have been nominated by <strong>$requester_name</strong> to provide feedback as part of the 360-degree feedback process. This is an opportunity for you to share your valuable feedback on the individual's strengths and areas for improvement which can help the person grow and excel. Request you to take out the time and fill the form in earnest.</p>
+
+            <p>🔹 <strong>How to Submit Your Feedback?</strong></p>
+            <p>Please complete the following form by <strong>$feedback_deadline</strong>:</p>
+            <p>📝 <a href="$app_url">$app_url</a></p>
+
+            <p><strong>Approve the nomination and fill out the form!</strong></p>
+
+            <p>Your feedback will remain confidential and will be used to support professional development. If you have any questions, feel free to reach out to diana@projecttech4dev.org.</p>
+
+            <p>Thanks for your time and input!</p>
+
+            <p>Best regards,<br>
+            Talent Management</p>
+        """
+    ),
+    "manager_approval_request": Template(
+        """
+            <h2>Hi $manager_name,</h2>
+
+            <p><strong>$requester_name</strong> has submitted 360° feedback nominations that require your approval.</p>
+
+            <div class="nominees-box">
+                <h3>Pending Nominations:</h3>
+                <pre>$nominees_list</pre>
+            </div>
+
+            <p><strong>Action Required:</strong></p>
+            <ol>
+                <li>Login to the feedback portal: <a href="$app_url">$app_url</a></li>
+                <li>Navigate to "Approve Nominations" (check for notification badge)</li>
+                <li>Review each nomination for appropriateness</li>
+                <li>Approve or reject with reasons</li>
+            </ol>
+
+            <p><strong>Review Guidelines:</strong></p>
+            <ul>
+                <li>Ensure nominees have sufficient working relationship with the requester</li>
+                <li>Check that the relationship type is appropriate</li>
+                <li>Consider nominee's current workload and availability</li>
+                <li>Provide clear reasons if rejecting nominations</li>
+            </ul>
+
+            <p>Please review and approve/reject these nominations promptly to keep the feedback process on track.</p>
+
+            <p>Best regards,<br>
+            Talent Management</p>
+        """
+    ),
+    "nomination_approved": Template(
+        """
+            <h2>Hi $requester_name,</h2>
+
+            <p>Great news! Your manager has approved the following feedback nominations.</p>
+
+            <div class="success-box">
+                <h3>Approved Reviewers:</h3>
+                <pre>$nominees_list</pre>
+            </div>
+
+            <p><strong>What happens next:</strong></p>
+            <ul>
+                <li>Approved reviewers will receive invitation emails to provide feedback</li>
+                <li>You can track the progress in your "Current Cycle Feedback" dashboard</li>
+                <li>You'll be notified by email when feedback is provided</li>
+                <li>You will be able to view your anonymized feedback on the app.</li>
+            </ul>
+
+            <p><strong>Portal:</strong> <a href="https://360feedback.projecttech4dev.org">https://360feedback.projecttech4dev.org</a></p>
+
+            <p>The feedback collection process is now underway!</p>
+
+            <p>Best regards,<br>
+            Talent Management</p>
+        """
+    ),
+    "nomination_rejected": Template(
+        """
+            <h2>Hi $requester_name,</h2>
+
+            <p>Your manager has reviewed your feedback nominations and has rejected the following:</p>
+
+            <div class="rejection-box">
+                <h3>Rejected Nominations:</h3>
+                <pre>$rejections_list</pre>
+            </div>
+
+            <p><strong>Next Steps:</strong></p>
+            <ul>
+                <li>Review the rejection reasons carefully</li>
+                <li>Submit new nominations for different reviewers</li>
+                <li>Ensure nominees have sufficient working relationship with you</li>
+                <li>You can still nominate up to your remaining allocation</li>
+            </ul>
+
+            <p><strong>Portal:</strong> <a href="https://360feedback.projecttech4dev.org">https://360feedback.projecttech4dev.org</a></p>
+
+            <p>Please submit replacement nominations promptly to stay on track for the feedback deadline.</p>
+
+            <p>Best regards,<br>
+            Talent Management</p>
+        """
+    ),
+    "feedback_submitted_notification": Template(
+        """
+            <h2>Hi $requester_name,</h2>
+
+            <p>Good news! You have received feedback!</p>
+
+            <div class="info-box">
+                <h3>Progress Update:</h3>
+                <p>A reviewer has completed their feedback for you. You can view your anonymized feedback in the "Current Cycle Feedback" dashboard.</p>
+                <p><strong>Portal:</strong> <a href="https://360feedback.projecttech4dev.org">https://360feedback.projecttech4dev.org</a></p>
+            </div>
+
+            <p><strong>What's Next:</strong></p>
+            <ul>
+                <li>Continue to encourage any remaining reviewers to complete their feedback</li>
+                <li>Your anonymized feedback is available for you to review</li>
+            </ul>
+
+            <p>Thank you for participating in the 360° feedback process!</p>
+
+            <p>Best regards,<br>
+            Talent Management</p>
+        """
+    ),
+    "deadline_reminder": Template(
+        """
+            <h2>Hi $user_name,</h2>
+
+            <p>This is a friendly reminder that you have <strong>$days_remaining days</strong> 
+            remaining to $action.</p>
+
+            <div class="warning-box">
+                <h3>Important Details:</h3>
+                <p><strong>Deadline:</strong> $deadline_date</p>
+                <p><strong>Days Remaining:</strong> $days_remaining</p>
+                <p><strong>Action Required:</strong> $action_title</p>
+            </div>
+
+            <p><strong>To complete this task:</strong></p>
+            <ol>
+                <li>Login to the feedback portal: <a href="$app_url">$app_url</a></li>
+                <li>Navigate to "$page"</li>
+                <li>Complete your pending items</li>
+            </ol>
+
+            <p>Don't miss the deadline! Please complete your tasks promptly.</p>
+
+            <p>Best regards,<br>
+            Talent Management</p>
+        """
+    ),
+    "password_reset": Template(
+        """
+            <h2>Hello $first_name,</h2>
+            <p>You have requested to reset your password for Insight 360°.</p>
+
+            <div class="token-box">
+                <h3>Your Reset Token:</h3>
+                <p style="font-family: monospace; font-size: 16px; font-weight: bold; color: #333;">
+                    $reset_token
+                </p>
+            </div>
+
+            <p><strong>Instructions:</strong></p>
+            <ol>
+                <li>Copy the reset token above</li>
+                <li>Return to the login page</li>
+                <li>Click "Forgot Password?" again</li>
+                <li>Select "I have a reset token"</li>
+                <li>Paste the token and create your new password</li>
+            </ol>
+
+            <p><strong>Important:</strong></p>
+            <ul>
+                <li>This token expires in 24 hours</li>
+                <li>Use this token only once</li>
+                <li>If you didn't request this reset, please contact your administrator</li>
+            </ul>
+
+            <p>If you have any issues, please contact your system administrator.</p>
+
+            <p>Best regards,<br>Insight 360°</p>
+        """
+    ),
+}
+
+
+def _render_email_html(kind: str, title: str, footer: str = "message", **fields) -> str:
+    """Fill an email type's body template with escaped fields and wrap it in the shared shell."""
+    body = _EMAIL_BODY_TEMPLATES[kind].substitute(
+        {name: html.escape(str(value)) for name, value in fields.items()}
+    )
+    return _BASE_HTML_TEMPLATE.substitute(title=title, body=body, footer=footer)
+
+
+def _external_stakeholder_invite_message(
+    external_email: str,
+    requester_name: str,
+    requester_designation: str,
+    cycle_name: str,
+    token: str,
+    feedback_deadline: str,
+    requester_vertical: str = "",
+    external_stakeholder_name: str = "",
+) -> Dict[str, Any]:
+    """Render one external stakeholder invitation as a send_emails_bulk message."""
+
+    # Use production domain
+    app_url = "https://360feedback.projecttech4dev.org"
+
+    subject = f"Feedback Request from {requester_name} at Tech4Dev"
+
+    html_body = _render_email_html(
+        "external_stakeholder_invite",
+        "Feedback Request",
+        greeting_name=external_stakeholder_name or "there",
+        requester_name=requester_name,
+        requester_role=requester_designation
+        + (f", {requester_vertical}" if requester_vertical else ""),
+        external_email=external_email,
+        token=token,
+        app_url=app_url,
+        feedback_deadline=feedback_deadline,
+        cycle_name=cycle_name,
+    )
 
     text_body = f"""
     Feedback Request from {requester_name}
@@ -411,12 +983,41 @@ def send_external_stakeholder_invite(
     The Tech4Dev Team
     """
 
-    return send_email(
+    return {
+        "to_email": external_email,
+        "subject": subject,
+        "html_body": html_body,
+        "text_body": text_body,
+        "email_type": "external_stakeholder_invite",
+    }
+
+
+def send_external_stakeholder_invite(
+    external_email: str,
+    requester_name: str,
+    requester_designation: str,
+    cycle_name: str,
+    token: str,
+    feedback_deadline: str,
+    requester_vertical: str = "",
+    external_stakeholder_name: str = "",
+    cycle_id: int = None,
+    request_id: int = None,
+    initiated_by: int = None,
+) -> bool:
+    """Send invitation email to external stakeholder with token-based access."""
+    message = _external_stakeholder_invite_message(
         external_email,
-        subject,
-        html_body,
-        text_body,
-        "external_stakeholder_invite",
+        requester_name,
+        requester_designation,
+        cycle_name,
+        token,
+        feedback_deadline,
+        requester_vertical,
+        external_stakeholder_name,
+    )
+    return send_email(
+        **message,
         recipient_name=external_stakeholder_name,
         cycle_id=cycle_id,
         request_id=request_id,
@@ -424,6 +1025,24 @@ def send_external_stakeholder_invite(
     )
 
 
+def send_external_stakeholder_invites_bulk(recipients: List[Dict[str, Any]]) -> bool:
+    """
+    Queue invitations for several external stakeholders with a single INSERT.
+
+    Args:
+        recipients: Dicts of send_external_stakeholder_invite arguments
+            (external_email, requester_name, requester_designation, cycle_name,
+            token, feedback_deadline, and optionally requester_vertical and
+            external_stakeholder_name)
+
+    Returns:
+        bool: True if every invitation was queued, False otherwise
+    """
+    return send_emails_bulk(
+        [_external_stakeholder_invite_message(**recipient) for recipient in recipients]
+    )
+
+
 def send_nominee_invite(
     reviewer_email: str,
     reviewer_name: str,
@@ -440,51 +1059,14 @@ def send_nominee_invite(
 
     subject = "📌 360° Feedback – Your Input Requested"
 
-    html_body = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .header {{ background-color: #1E4796; color: white; padding: 20px; text-align: center; }}
-            .header h1 {{ margin: 0; font-size: 24px; }}
-            .header h2 {{ margin: 5px 0 0 0; font-size: 18px; opacity: 0.9; }}
-            .content {{ padding: 20px; }}
-            .info-box {{ background-color: #f0f8ff; padding: 15px; border-left: 4px solid #1E4796; margin: 20px 0; }}
-            .footer {{ background-color: #f0f0f0; padding: 10px; text-align: center; font-size: 12px; }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>Insight 360°</h1>
-            <h2>Feedback Request</h2>
-        </div>
-        
-        <div class="content">
-            <p>Hi {reviewer_name},</p>
-            
-            <p>You have been nominated by <strong>{requester_name}</strong> to provide feedback as part of the 360-degree feedback process. This is an opportunity for you to share your valuable feedback on the individual's strengths and areas for improvement which can help the person grow and excel. Request you to take out the time and fill the form in earnest.</p>
-            
-            <p>🔹 <strong>How to Submit Your Feedback?</strong></p>
-            <p>Please complete the following form by <strong>{feedback_deadline}</strong>:</p>
-            <p>📝 <a href="{app_url}">{app_url}</a></p>
-            
-            <p><strong>Approve the nomination and fill out the form!</strong></p>
-            
-            <p>Your feedback will remain confidential and will be used to support professional development. If you have any questions, feel free to reach out to diana@projecttech4dev.org.</p>
-            
-            <p>Thanks for your time and input!</p>
-            
-            <p>Best regards,<br>
-            Talent Management</p>
-        </div>
-        
-        <div class="footer">
-            <p>This is an automated message from the Tech4Dev Insight 360°.</p>
-        </div>
-    </body>
-    </html>
-    """
+    html_body = _render_email_html(
+        "nominee_invite",
+        "Feedback Request",
+        reviewer_name=reviewer_name,
+        requester_name=requester_name,
+        feedback_deadline=feedback_deadline,
+        app_url=app_url,
+    )
 
     text_body = f"""
     Feedback Request
@@ -535,64 +1117,14 @@ def send_manager_approval_request(
             f"{i}. {nominee.get('reviewer_name', 'Unknown')} ({relationship})\n"
         )
 
-    html_body = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .header {{ background-color: #1E4796; color: white; padding: 20px; text-align: center; }}
-            .header h1 {{ margin: 0; font-size: 24px; }}
-            .header h2 {{ margin: 5px 0 0 0; font-size: 18px; opacity: 0.9; }}
-            .content {{ padding: 20px; }}
-            .nominees-box {{ background-color: #fff8f0; padding: 15px; border-left: 4px solid #E55325; margin: 20px 0; }}
-            .footer {{ background-color: #f0f0f0; padding: 10px; text-align: center; font-size: 12px; }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>Insight 360°</h1>
-            <h2>Nomination Approval Required</h2>
-        </div>
-        
-        <div class="content">
-            <h2>Hi {manager_name},</h2>
-            
-            <p><strong>{requester_name}</strong> has submitted 360° feedback nominations that require your approval.</p>
-            
-            <div class="nominees-box">
-                <h3>Pending Nominations:</h3>
-                <pre>{nominees_list}</pre>
-            </div>
-            
-            <p><strong>Action Required:</strong></p>
-            <ol>
-                <li>Login to the feedback portal: <a href="{app_url}">{app_url}</a></li>
-                <li>Navigate to "Approve Nominations" (check for notification badge)</li>
-                <li>Review each nomination for appropriateness</li>
-                <li>Approve or reject with reasons</li>
-            </ol>
-            
-            <p><strong>Review Guidelines:</strong></p>
-            <ul>
-                <li>Ensure nominees have sufficient working relationship with the requester</li>
-                <li>Check that the relationship type is appropriate</li>
-                <li>Consider nominee's current workload and availability</li>
-                <li>Provide clear reasons if rejecting nominations</li>
-            </ul>
-            
-            <p>Please review and approve/reject these nominations promptly to keep the feedback process on track.</p>
-            
-            <p>Best regards,<br>
-            Talent Management</p>
-        </div>
-        
-        <div class="footer">
-            <p>This is an automated message from the Tech4Dev Insight 360°.</p>
-        </div>
-    </body>
-    </html>
-    """
+    html_body = _render_email_html(
+        "manager_approval_request",
+        "Nomination Approval Required",
+        manager_name=manager_name,
+        requester_name=requester_name,
+        nominees_list=nominees_list,
+        app_url=app_url,
+    )
 
     text_body = f"""
     Nomination Approval Required
@@ -632,58 +1164,12 @@ def send_nomination_approved(
 
     nominees_list = "\n".join([f"• {nominee}" for nominee in approved_nominees])
 
-    html_body = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .header {{ background-color: #1E4796; color: white; padding: 20px; text-align: center; }}
-            .header h1 {{ margin: 0; font-size: 24px; }}
-            .header h2 {{ margin: 5px 0 0 0; font-size: 18px; opacity: 0.9; }}
-            .content {{ padding: 20px; }}
-            .success-box {{ background-color: #f0fff0; padding: 15px; border-left: 4px solid #28a745; margin: 20px 0; }}
-            .footer {{ background-color: #f0f0f0; padding: 10px; text-align: center; font-size: 12px; }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>Insight 360°</h1>
-            <h2>Nominations Approved ✅</h2>
-        </div>
-        
-        <div class="content">
-            <h2>Hi {requester_name},</h2>
-            
-            <p>Great news! Your manager has approved the following feedback nominations.</p>
-            
-            <div class="success-box">
-                <h3>Approved Reviewers:</h3>
-                <pre>{nominees_list}</pre>
-            </div>
-            
-            <p><strong>What happens next:</strong></p>
-            <ul>
-                <li>Approved reviewers will receive invitation emails to provide feedback</li>
-                <li>You can track the progress in your "Current Cycle Feedback" dashboard</li>
-                <li>You'll be notified by email when feedback is provided</li>
-                <li>You will be able to view your anonymized feedback on the app.</li>
-            </ul>
-            
-            <p><strong>Portal:</strong> <a href="https://360feedback.projecttech4dev.org">https://360feedback.projecttech4dev.org</a></p>
-            
-            <p>The feedback collection process is now underway!</p>
-            
-            <p>Best regards,<br>
-            Talent Management</p>
-        </div>
-        
-        <div class="footer">
-            <p>This is an automated message from the Tech4Dev Insight 360°.</p>
-        </div>
-    </body>
-    </html>
-    """
+    html_body = _render_email_html(
+        "nomination_approved",
+        "Nominations Approved ✅",
+        requester_name=requester_name,
+        nominees_list=nominees_list,
+    )
 
     return send_email(requester_email, subject, html_body, None, "nomination_approved")
 
@@ -703,58 +1189,12 @@ def send_nomination_rejected(
         reason = nominee.get("rejection_reason", "No reason provided")
         rejections_list += f"• {nominee.get('reviewer_name', 'Unknown')}: {reason}\n"
 
-    html_body = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .header {{ background-color: #1E4796; color: white; padding: 20px; text-align: center; }}
-            .header h1 {{ margin: 0; font-size: 24px; }}
-            .header h2 {{ margin: 5px 0 0 0; font-size: 18px; opacity: 0.9; }}
-            .content {{ padding: 20px; }}
-            .rejection-box {{ background-color: #fff5f5; padding: 15px; border-left: 4px solid #dc3545; margin: 20px 0; }}
-            .footer {{ background-color: #f0f0f0; padding: 10px; text-align: center; font-size: 12px; }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>Insight 360°</h1>
-            <h2>360° Feedback Nominations Require Revision</h2>
-        </div>
-        
-        <div class="content">
-            <h2>Hi {requester_name},</h2>
-            
-            <p>Your manager has reviewed your feedback nominations and has rejected the following:</p>
-            
-            <div class="rejection-box">
-                <h3>Rejected Nominations:</h3>
-                <pre>{rejections_list}</pre>
-            </div>
-            
-            <p><strong>Next Steps:</strong></p>
-            <ul>
-                <li>Review the rejection reasons carefully</li>
-                <li>Submit new nominations for different reviewers</li>
-                <li>Ensure nominees have sufficient working relationship with you</li>
-                <li>You can still nominate up to your remaining allocation</li>
-            </ul>
-            
-            <p><strong>Portal:</strong> <a href="https://360feedback.projecttech4dev.org">https://360feedback.projecttech4dev.org</a></p>
-            
-            <p>Please submit replacement nominations promptly to stay on track for the feedback deadline.</p>
-            
-            <p>Best regards,<br>
-            Talent Management</p>
-        </div>
-        
-        <div class="footer">
-            <p>This is an automated message from the Tech4Dev Insight 360°.</p>
-        </div>
-    </body>
-    </html>
-    """
+    html_body = _render_email_html(
+        "nomination_rejected",
+        "360° Feedback Nominations Require Revision",
+        requester_name=requester_name,
+        rejections_list=rejections_list,
+    )
 
     return send_email(requester_email, subject, html_body, None, "nomination_rejected")
 
@@ -771,55 +1211,11 @@ def send_feedback_submitted_notification(
     # Use generic subject since feedback is anonymized
     subject = "Feedback received"
 
-    html_body = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .header {{ background-color: #1E4796; color: white; padding: 20px; text-align: center; }}
-            .header h1 {{ margin: 0; font-size: 24px; }}
-            .header h2 {{ margin: 5px 0 0 0; font-size: 18px; opacity: 0.9; }}
-            .content {{ padding: 20px; }}
-            .info-box {{ background-color: #f0f8ff; padding: 15px; border-left: 4px solid #1E4796; margin: 20px 0; }}
-            .footer {{ background-color: #f0f0f0; padding: 10px; text-align: center; font-size: 12px; }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>Insight 360°</h1>
-            <h2>360° Feedback Received</h2>
-        </div>
-        
-        <div class="content">
-            <h2>Hi {requester_name},</h2>
-            
-            <p>Good news! You have received feedback!</p>
-            
-            <div class="info-box">
-                <h3>Progress Update:</h3>
-                <p>A reviewer has completed their feedback for you. You can view your anonymized feedback in the "Current Cycle Feedback" dashboard.</p>
-                <p><strong>Portal:</strong> <a href="https://360feedback.projecttech4dev.org">https://360feedback.projecttech4dev.org</a></p>
-            </div>
-            
-            <p><strong>What's Next:</strong></p>
-            <ul>
-                <li>Continue to encourage any remaining reviewers to complete their feedback</li>
-                <li>Your anonymized feedback is available for you to review</li>
-            </ul>
-            
-            <p>Thank you for participating in the 360° feedback process!</p>
-            
-            <p>Best regards,<br>
-            Talent Management</p>
-        </div>
-        
-        <div class="footer">
-            <p>This is an automated message from the Tech4Dev Insight 360°.</p>
-        </div>
-    </body>
-    </html>
-    """
+    html_body = _render_email_html(
+        "feedback_submitted_notification",
+        "360° Feedback Received",
+        requester_name=requester_name,
+    )
 
     return send_email(
         requester_email, subject, html_body, None, "feedback_submitted_notification"
@@ -851,58 +1247,18 @@ def send_cycle_deadline_reminder(
     # Use production domain
     app_url = "https://360feedback.projecttech4dev.org"
 
-    html_body = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .header {{ background-color: #1E4796; color: white; padding: 20px; text-align: center; }}
-            .header h1 {{ margin: 0; font-size: 24px; }}
-            .header h2 {{ margin: 5px 0 0 0; font-size: 18px; opacity: 0.9; }}
-            .content {{ padding: 20px; }}
-            .warning-box {{ background-color: #fff8e1; padding: 15px; border-left: 4px solid #ffc107; margin: 20px 0; }}
-            .footer {{ background-color: #f0f0f0; padding: 10px; text-align: center; font-size: 12px; }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>Insight 360°</h1>
-            <h2>⏰ Deadline Reminder</h2>
-        </div>
-        
-        <div class="content">
-            <h2>Hi {user_name},</h2>
-            
-            <p>This is a friendly reminder that you have <strong>{days_remaining} days</strong> 
-            remaining to {action}.</p>
-            
-            <div class="warning-box">
-                <h3>Important Details:</h3>
-                <p><strong>Deadline:</strong> {deadline_date}</p>
-                <p><strong>Days Remaining:</strong> {days_remaining}</p>
-                <p><strong>Action Required:</strong> {action.title()}</p>
-            </div>
-            
-            <p><strong>To complete this task:</strong></p>
-            <ol>
-                <li>Login to the feedback portal: <a href="{app_url}">{app_url}</a></li>
-                <li>Navigate to "{page}"</li>
-                <li>Complete your pending items</li>
-            </ol>
-            
-            <p>Don't miss the deadline! Please complete your tasks promptly.</p>
-            
-            <p>Best regards,<br>
-            Talent Management</p>
-        </div>
-        
-        <div class="footer">
-            <p>This is an automated reminder from the Tech4Dev Insight 360°.</p>
-        </div>
-    </body>
-    </html>
-    """
+    html_body = _render_email_html(
+        "deadline_reminder",
+        "⏰ Deadline Reminder",
+        user_name=user_name,
+        days_remaining=days_remaining,
+        action=action,
+        action_title=action.title(),
+        deadline_date=deadline_date,
+        app_url=app_url,
+        page=page,
+        footer="reminder",
+    )
 
     return send_email(user_email, subject, html_body, None, "deadline_reminder")
 
@@ -922,15 +1278,21 @@ def send_manual_reminder(
     Returns:
         Dict mapping email addresses to success status
     """
-    results = {}
-
-    for email in to_emails:
-        success = send_email(
-            email.strip(), subject, html_body, text_body, "manual_reminder"
-        )
-        results[email.strip()] = success
+    recipients = [email.strip() for email in to_emails]
+    success = send_emails_bulk(
+        [
+            {
+                "to_email": email,
+                "subject": subject,
+                "html_body": html_body,
+                "text_body": text_body,
+                "email_type": "manual_reminder",
+            }
+            for email in recipients
+        ]
+    )
 
-    return results
+    return {email: success for email in recipients}
 
 
 def get_email_log(limit: int = 100) -> List[Dict[str, Any]]:
@@ -1042,62 +1404,10 @@ def send_rejection_notice_email(requester_email, reviewer_name, rejection_reason
 def send_password_reset_email(email, first_name, reset_token):
     """Send password reset email with token."""
     subject = "Password Reset - Insight 360°"
-    html_body = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .header {{ background-color: #1E4796; color: white; padding: 20px; text-align: center; }}
-            .header h1 {{ margin: 0; font-size: 24px; }}
-            .header h2 {{ margin: 5px 0 0 0; font-size: 18px; opacity: 0.9; }}
-            .content {{ padding: 20px; }}
-            .token-box {{ background-color: #f0f0f0; padding: 15px; border-left: 4px solid #1E4796; margin: 20px 0; }}
-            .footer {{ background-color: #f0f0f0; padding: 10px; text-align: center; font-size: 12px; }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>Insight 360°</h1>
-            <h2>Password Reset Request</h2>
-        </div>
-        
-        <div class="content">
-            <h2>Hello {first_name},</h2>
-            <p>You have requested to reset your password for Insight 360°.</p>
-            
-            <div class="token-box">
-                <h3>Your Reset Token:</h3>
-                <p style="font-family: monospace; font-size: 16px; font-weight: bold; color: #333;">
-                    {reset_token}
-                </p>
-            </div>
-            
-            <p><strong>Instructions:</strong></p>
-            <ol>
-                <li>Copy the reset token above</li>
-                <li>Return to the login page</li>
-                <li>Click "Forgot Password?" again</li>
-                <li>Select "I have a reset token"</li>
-                <li>Paste the token and create your new password</li>
-            </ol>
-            
-            <p><strong>Important:</strong></p>
-            <ul>
-                <li>This token expires in 24 hours</li>
-                <li>Use this token only once</li>
-                <li>If you didn't request this reset, please contact your administrator</li>
-            </ul>
-            
-            <p>If you have any issues, please contact your system administrator.</p>
-            
-            <p>Best regards,<br>Insight 360°</p>
-        </div>
-        
-        <div class="footer">
-            <p>This is an automated message from the Tech4Dev Insight 360°.</p>
-        </div>
-    </body>
-    </html>
-    """
+    html_body = _render_email_html(
+        "password_reset",
+        "Password Reset Request",
+        first_name=first_name,
+        reset_token=reset_token,
+    )
     return send_email(email, subject, html_body, None, "password_reset")
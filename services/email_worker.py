@@ -9,6 +9,7 @@ import sys
 import os
 import time
 import fcntl
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 # Add the project root to Python path
@@ -16,7 +17,7 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_root)
 
 from services.db_helper import get_connection
-from services.email_service import _send_email_sync
+from services.email_service import _email_cfg, _send_email_sync, close_smtp_sessions
 import logging
 
 # Configure logging
@@ -29,6 +30,15 @@ logger = logging.getLogger(__name__)
 # Lock file for preventing multiple instances
 LOCK_FILE = "/tmp/email_worker.lock"
 
+# Concurrent SMTP/SendGrid sends per batch (kept small to avoid overwhelming the SMTP server);
+# email.worker_parallelism in secrets overrides it, clamped to MAX_SEND_WORKERS
+SEND_WORKERS = 4
+MAX_SEND_WORKERS = 20
+
+# Send outcomes are recorded in groups this small, so a crash mid-batch
+# leaves at most this many delivered emails still marked pending
+MARK_BATCH_SIZE = 5
+
 class WorkerLock:
     """Context manager for email worker lock to prevent multiple instances."""
     
@@ -76,29 +86,74 @@ def get_pending_emails(batch_size=50):
         logger.error(f"Error fetching pending emails: {e}")
         return []
 
-def mark_email_processed(email_id, success, error_message=None):
-    """Mark email as processed in the queue."""
-    conn = get_connection()
+def mark_emails_processed(results):
+    """
+    Record a group of send outcomes: one UPDATE for all sent, one for all failed, in one
+    atomic batch. Raises if the statuses could not be written.
+    """
+    sent_ids = [email_id for email_id, success, _ in results if success]
+    failed = [(email_id, error_message) for email_id, success, error_message in results if not success]
+    statements = []
+    if sent_ids:
+        placeholders = ",".join(["?"] * len(sent_ids))
+        statements.append((f"""
+            UPDATE email_queue 
+            SET status = 'sent', last_attempt = CURRENT_TIMESTAMP, attempts = attempts + 1
+            WHERE id IN ({placeholders})
+        """, tuple(sent_ids)))
+    if failed:
+        error_cases = " ".join(["WHEN ? THEN ?"] * len(failed))
+        placeholders = ",".join(["?"] * len(failed))
+        params = [value for pair in failed for value in pair] + [email_id for email_id, _ in failed]
+        statements.append((f"""
+            UPDATE email_queue 
+            SET status = CASE WHEN attempts >= 2 THEN 'failed' ELSE 'pending' END,
+                last_attempt = CURRENT_TIMESTAMP, 
+                attempts = attempts + 1,
+                error_message = CASE id {error_cases} END
+            WHERE id IN ({placeholders})
+        """, tuple(params)))
+    if not statements:
+        return
+    try:
+        get_connection().execute_batch(statements)
+    except Exception as e:
+        logger.error(f"Error updating email statuses: {e}")
+        # Not an IOError, so run_worker_once does not mistake it for the lock being held
+        raise RuntimeError(f"Could not record email statuses: {e}") from e
+    logger.info(f"Marked {len(sent_ids)} emails as sent and {len(failed)} as failed/retry")
+
+def _send_queued_email(email_data):
+    """Send one queued email and return (email_id, success, error_message)."""
+    email_id, to_email, subject, html_body, text_body, email_type, attempts = email_data
+    logger.info(f"Processing email {email_id} to {to_email} (attempt {attempts + 1})")
+    try:
+        success, error_msg = _send_email_sync(
+            to_email=to_email,
+            subject=subject,
+            html_body=html_body,
+            text_body=text_body,
+            email_type=email_type
+        )
+    except Exception as e:
+        logger.error(f"Exception processing email {email_id}: {e}")
+        return email_id, False, str(e)
+    
+    if success:
+        logger.info(f"✓ Email {email_id} sent successfully to {to_email}")
+    else:
+        logger.warning(f"✗ Email {email_id} failed: {error_msg}")
+    return email_id, success, error_msg
+
+def get_send_worker_count():
+    """Sender threads per batch: email.worker_parallelism if set, within 1..MAX_SEND_WORKERS."""
     try:
-        if success:
-            conn.execute("""
-                UPDATE email_queue 
-                SET status = 'sent', last_attempt = CURRENT_TIMESTAMP, attempts = attempts + 1
-                WHERE id = ?
-            """, (email_id,))
-        else:
-            conn.execute("""
-                UPDATE email_queue 
-                SET status = CASE WHEN attempts >= 2 THEN 'failed' ELSE 'pending' END,
-                    last_attempt = CURRENT_TIMESTAMP, 
-                    attempts = attempts + 1,
-                    error_message = ?
-                WHERE id = ?
-            """, (error_message, email_id))
-        conn.commit()
-        logger.info(f"Email {email_id} marked as {'sent' if success else 'failed/retry'}")
+        configured = _email_cfg().worker_parallelism
+        workers = int(configured) if configured is not None else SEND_WORKERS
     except Exception as e:
-        logger.error(f"Error updating email status: {e}")
+        logger.warning(f"Invalid email.worker_parallelism, using {SEND_WORKERS}: {e}")
+        workers = SEND_WORKERS
+    return max(1, min(workers, MAX_SEND_WORKERS))
 
 def process_email_queue():
     """Process exactly 50 pending emails from the queue."""
@@ -110,39 +165,29 @@ def process_email_queue():
         logger.info("No pending emails to process")
         return 0
     
-    logger.info(f"Processing {len(pending_emails)} emails")
-    processed_count = 0
+    send_workers = min(get_send_worker_count(), len(pending_emails))
+    logger.info(f"Processing {len(pending_emails)} emails with {send_workers} senders")
     
-    for email_data in pending_emails:
-        email_id, to_email, subject, html_body, text_body, email_type, attempts = email_data
-        
-        logger.info(f"Processing email {email_id} to {to_email} (attempt {attempts + 1})")
-        
-        try:
-            success, error_msg = _send_email_sync(
-                to_email=to_email,
-                subject=subject,
-                html_body=html_body,
-                text_body=text_body,
-                email_type=email_type
-            )
-            
-            mark_email_processed(email_id, success, error_msg)
-            
-            if success:
-                logger.info(f"✓ Email {email_id} sent successfully to {to_email}")
-            else:
-                logger.warning(f"✗ Email {email_id} failed: {error_msg}")
-            
-            processed_count += 1
-            
-            # Small delay between emails to avoid overwhelming the SMTP server
-            time.sleep(0.5)
-            
-        except Exception as e:
-            logger.error(f"Exception processing email {email_id}: {e}")
-            mark_email_processed(email_id, False, str(e))
-            processed_count += 1
+    # Sends are network-bound, so fan them out; outcomes are recorded in small groups
+    # as they complete. Each sender thread reuses one SMTP connection for its share.
+    processed_count = 0
+    pool = ThreadPoolExecutor(max_workers=send_workers)
+    try:
+        futures = [pool.submit(_send_queued_email, email_data) for email_data in pending_emails]
+        results = []
+        for future in as_completed(futures):
+            results.append(future.result())
+            if len(results) >= MARK_BATCH_SIZE:
+                mark_emails_processed(results)
+                processed_count += len(results)
+                results = []
+        if results:
+            mark_emails_processed(results)
+            processed_count += len(results)
+    finally:
+        # If recording failed, do not start sends whose outcome could not be stored
+        pool.shutdown(wait=True, cancel_futures=True)
+        close_smtp_sessions()
             
     logger.info(f"Email queue processing completed: {processed_count} emails processed")
     return processed_count
@@ -4,10 +4,15 @@ Clean implementation using turso-python for ARM compatibility
 """
 
 import streamlit as st
+import requests
 from turso_python import TursoClient
 from typing import Optional, List, Dict, Any, Union
 from datetime import datetime, date
 import logging
+import re
+import threading
+from functools import lru_cache
+from contextlib import contextmanager
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -19,19 +24,22 @@ class TursoResult:
     """
     
     def __init__(self, turso_response: Dict[str, Any]):
-        self._response = turso_response
-        self._process_response()
+        # The raw JSON payload is not kept once parsed, so large results are held only once
+        self._process_response(turso_response)
         self._current_index = 0
     
-    def _process_response(self):
+    def _process_response(self, response: Dict[str, Any]):
         """Process turso-python response format into familiar structure"""
         self._rows = []
         self._columns = []
         self.rowcount = 0
+        self.error = None
         
         try:
-            if 'results' in self._response and self._response['results']:
-                result = self._response['results'][0]
+            if 'results' in response and response['results']:
+                result = response['results'][0]
+                if result['type'] == 'error':
+                    self.error = (result.get('error') or {}).get('message') or 'Unknown Turso error'
                 if result['type'] == 'ok' and 'response' in result:
                     response = result['response']
                     if response['type'] == 'execute' and 'result' in response:
@@ -90,12 +98,24 @@ class TursoResult:
             return row
         return None
     
+    def __iter__(self):
+        """Iterate remaining rows without copying them into a new list"""
+        while self._current_index < len(self._rows):
+            row = self._rows[self._current_index]
+            self._current_index += 1
+            yield row
+    
     def fetchall(self) -> List[tuple]:
         """Fetch all remaining rows as list of tuples"""
         remaining = self._rows[self._current_index:]
         self._current_index = len(self._rows)
         return remaining
     
+    def fetchall_dicts(self) -> List[Dict[str, Any]]:
+        """Fetch all remaining rows as {column_name: value} dicts (like sqlite3.Row mappings)"""
+        columns = self._columns
+        return [dict(zip(columns, row)) for row in self]
+    
     def fetchmany(self, size: int) -> List[tuple]:
         """Fetch up to size rows"""
         end_index = min(self._current_index + size, len(self._rows))
@@ -109,6 +129,19 @@ class TursoResult:
         return [(col, None, None, None, None, None, None) for col in self._columns]
 
 
+class TursoTransaction:
+    """Statements queued by TursoConnection.transaction()"""
+    
+    def __init__(self):
+        self.statements = []
+    
+    def execute(self, query: str, parameters: Optional[Union[tuple, list]] = None):
+        self.statements.append((query, parameters))
+    
+    def executemany(self, query: str, seq_of_parameters):
+        self.statements.extend(_expand_many(query, seq_of_parameters))
+
+
 class TursoConnection:
     """
     Database connection class using turso-python
@@ -119,6 +152,7 @@ class TursoConnection:
         self.database_url = database_url
         self.auth_token = auth_token
         self._client = None
+        self._http = None
         self._connect()
     
     def _connect(self):
@@ -137,6 +171,10 @@ class TursoConnection:
         """
         Execute SQL query with optional parameters
         
+        The connection is long-lived, so an expired stream is handled here: reconnect
+        once and retry the statement instead of probing before every query. Dropped
+        connections are retried only when re-running the statement cannot apply it twice.
+        
         Args:
             query: SQL query string
             parameters: Optional query parameters
@@ -144,6 +182,49 @@ class TursoConnection:
         Returns:
             TursoResult: Compatible result object
         """
+        try:
+            result = self._execute_once(query, parameters)
+        except Exception as e:
+            if not self._is_retryable_error(e, query):
+                raise
+            logger.warning(f"Turso connection lost ({e}); reconnecting and retrying once")
+            self._connect()
+            return self._execute_once(query, parameters)
+        
+        if result.error and self._is_stream_expired(result.error):
+            logger.warning(f"Turso stream expired ({result.error}); reconnecting and retrying once")
+            self._connect()
+            result = self._execute_once(query, parameters)
+        return result
+    
+    @staticmethod
+    def _is_stream_expired(message: str) -> bool:
+        """True when the server rejected the stream itself, so the statement never ran."""
+        message = (message or "").lower()
+        return "stream_expired" in message or "stream expired" in message
+    
+    @classmethod
+    def _is_retryable_error(cls, error: Exception, query: str) -> bool:
+        """
+        True when reconnecting and re-running query is safe: an expired stream or a
+        connection that was never established retries anything; a connection dropped or
+        an HTTP 502/503/504 after the request went out retries read-only statements only.
+        """
+        if cls._is_stream_expired(str(error)):
+            return True
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(error, requests.exceptions.ConnectionError):
+            if "failed to establish a new connection" in str(error).lower():
+                return True
+            return _is_read_only(query)
+        if isinstance(error, requests.exceptions.HTTPError):
+            status = getattr(error.response, "status_code", None)
+            return status in (502, 503, 504) and _is_read_only(query)
+        return False
+    
+    def _execute_once(self, query: str, parameters: Optional[Union[tuple, list]] = None) -> TursoResult:
+        """Send a single statement to Turso without any retry handling"""
         try:
             if self._client is None:
                 self._connect()
@@ -151,10 +232,7 @@ class TursoConnection:
                 # Handle parameterized queries
                 # Convert tuple/list parameters to the format expected by turso-python
                 if isinstance(parameters, (tuple, list)):
-                    formatted_query = query
-                    for param in parameters:
-                        formatted_query = formatted_query.replace('?', self._format_parameter(param), 1)
-                    response = self._client.execute_query(formatted_query)
+                    response = self._client.execute_query(self._bind_parameters(query, parameters))
                 else:
                     response = self._client.execute_query(query)
             else:
@@ -168,6 +246,100 @@ class TursoConnection:
             logger.error(f"Parameters: {parameters}")
             raise
     
+    def executemany(self, query: str, seq_of_parameters) -> TursoResult:
+        """
+        Execute a statement once per parameter set (DB-API style)
+        
+        A plain single-row ``INSERT ... VALUES (...)`` is expanded into multi-row INSERTs
+        (up to MAX_ROWS_PER_INSERT rows each); other statements run in turn. Stops at the
+        first statement that reports an error and returns its result.
+        """
+        result = TursoResult({})
+        for statement, parameters in _expand_many(query, seq_of_parameters):
+            result = self.execute(statement, parameters)
+            if result.error:
+                break
+        return result
+    
+    def execute_batch(self, statements: List[tuple]) -> List[TursoResult]:
+        """
+        Execute several statements atomically in a single round-trip
+        
+        turso-python opens a fresh stream per execute_query, so a BEGIN issued through
+        execute() cannot span statements. This sends one Hrana batch wrapped in
+        BEGIN IMMEDIATE / COMMIT, with each step conditional on the previous one and a
+        ROLLBACK step that runs if the commit is not reached.
+        
+        Args:
+            statements: List of (query, parameters) tuples
+            
+        Returns:
+            List[TursoResult]: One result per statement
+        """
+        steps = [{"stmt": {"sql": "BEGIN IMMEDIATE"}}]
+        for query, parameters in statements:
+            sql = self._bind_parameters(query, parameters) if parameters else query
+            steps.append({"stmt": {"sql": sql}, "condition": {"type": "ok", "step": len(steps) - 1}})
+        commit_step = len(steps)
+        steps.append({"stmt": {"sql": "COMMIT"}, "condition": {"type": "ok", "step": commit_step - 1}})
+        steps.append({
+            "stmt": {"sql": "ROLLBACK"},
+            "condition": {"type": "not", "cond": {"type": "ok", "step": commit_step}},
+        })
+        
+        try:
+            if self._http is None:
+                self._http = requests.Session()
+            response = self._http.post(
+                self._pipeline_url(),
+                json={"requests": [{"type": "batch", "batch": {"steps": steps}}, {"type": "close"}]},
+                headers={"Authorization": f"Bearer {self.auth_token}"},
+                timeout=30,
+            )
+            response.raise_for_status()
+            result = response.json()["results"][0]
+            if result.get("type") != "ok":
+                raise RuntimeError((result.get("error") or {}).get("message") or "Unknown Turso error")
+            
+            batch_result = result["response"]["result"]
+            for error in batch_result["step_errors"][:commit_step + 1]:
+                if error:
+                    raise RuntimeError(f"Batch rolled back: {error.get('message')}")
+            
+            return [
+                TursoResult({"results": [{"type": "ok", "response": {"type": "execute", "result": step_result}}]})
+                for step_result in batch_result["step_results"][1:commit_step]
+            ]
+        except Exception as e:
+            logger.error(f"Batch execution failed: {e}")
+            logger.error(f"Statements: {[query for query, _ in statements]}")
+            raise
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Collect writes and run them as one atomic batch when the block exits cleanly
+        
+        Usage:
+            with conn.transaction() as tx:
+                tx.execute("UPDATE ...", (...))
+                tx.execute("INSERT ...", (...))
+        
+        Nothing is sent if the block raises. Statement results are not available inside
+        the block; use execute_batch directly when a result (e.g. RETURNING) is needed.
+        """
+        pending = TursoTransaction()
+        yield pending
+        if pending.statements:
+            self.execute_batch(pending.statements)
+    
+    def _pipeline_url(self) -> str:
+        """Hrana HTTP pipeline endpoint for the configured database URL"""
+        url = self.database_url
+        if url.startswith("libsql://"):
+            url = "https://" + url[len("libsql://"):]
+        return url.rstrip("/") + "/v2/pipeline"
+    
     def commit(self):
         """Commit transaction (no-op for turso-python as it auto-commits)"""
         pass
@@ -186,7 +358,20 @@ class TursoConnection:
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+        # The connection is shared process-wide (see get_connection); leaving a
+        # `with` block must not tear down the client for every other caller.
+        return False
+
+    def _bind_parameters(self, query: str, parameters: Union[tuple, list]) -> str:
+        """Substitute ? placeholders with SQL literals using the prepared statement template."""
+        fragments = _prepare_statement(query)
+        parts = [fragments[0]]
+        for param, fragment in zip(parameters, fragments[1:]):
+            parts.append(self._format_parameter(param))
+            parts.append(fragment)
+        # Placeholders without a parameter stay as-is (same as the previous behaviour)
+        parts.extend("?" + fragment for fragment in fragments[len(parameters) + 1:])
+        return "".join(parts)
 
     def _format_parameter(self, param: Any) -> str:
         """Convert python types into safe SQL literal strings."""
@@ -204,23 +389,82 @@ class TursoConnection:
         return f"'{text}'"
 
 
+# INSERT whose only VALUES tuple ends the statement (no ON CONFLICT / RETURNING tail)
+_SINGLE_ROW_INSERT = re.compile(r"^\s*INSERT\b.*?\bVALUES\s*(\([^()]*\))\s*;?\s*$", re.IGNORECASE | re.DOTALL)
+
+# Rows folded into one multi-row INSERT; larger batches become several statements
+# so a single statement (and its HTTP payload) stays bounded
+MAX_ROWS_PER_INSERT = 100
+
+
+def _expand_many(query: str, seq_of_parameters) -> List[tuple]:
+    """
+    (query, parameters) statements equivalent to running query once per parameter set.
+    A single-row INSERT collapses into multi-row INSERTs of up to MAX_ROWS_PER_INSERT
+    rows each; anything else is repeated.
+    """
+    rows = [tuple(parameters) for parameters in seq_of_parameters]
+    if not rows:
+        return []
+    
+    match = _SINGLE_ROW_INSERT.match(query)
+    if match:
+        values_row = match.group(1)
+        statements = []
+        for start in range(0, len(rows), MAX_ROWS_PER_INSERT):
+            chunk = rows[start:start + MAX_ROWS_PER_INSERT]
+            multi_row_query = query[:match.start(1)] + ", ".join([values_row] * len(chunk))
+            statements.append((multi_row_query, [value for row in chunk for value in row]))
+        return statements
+    
+    return [(query, parameters) for parameters in rows]
+
+
+def _is_read_only(query: str) -> bool:
+    """True for statements that cannot change data when run twice."""
+    return query.lstrip().upper().startswith(("SELECT", "EXPLAIN", "PRAGMA TABLE_INFO"))
+
+
+@lru_cache(maxsize=256)
+def _prepare_statement(query: str) -> tuple:
+    """
+    Split a statement into the text fragments around its ? placeholders.
+    Cached per SQL text so hot statements are only scanned once per process.
+    """
+    return tuple(query.split('?'))
+
+
+# One client per process: creating a TursoClient (and re-reading secrets) for
+# every helper call was pure overhead on each Streamlit rerun.
+_shared_connection: Optional[TursoConnection] = None
+_shared_connection_lock = threading.Lock()
+
+
 def get_connection() -> TursoConnection:
     """
-    Get a database connection using Turso credentials
+    Get the process-wide database connection using Turso credentials
     Drop-in replacement for the previous get_connection() function
     """
-    try:
-        db_url = st.secrets["DB_URL"]
-        auth_token = st.secrets["AUTH_TOKEN"]
-        
-        if not db_url or not auth_token:
-            raise ValueError("Missing database credentials in Streamlit secrets")
-        
-        return TursoConnection(db_url, auth_token)
-        
-    except Exception as e:
-        logger.error(f"Failed to create database connection: {e}")
-        raise
+    global _shared_connection
+    if _shared_connection is not None:
+        return _shared_connection
+    
+    with _shared_connection_lock:
+        if _shared_connection is not None:
+            return _shared_connection
+        try:
+            db_url = st.secrets["DB_URL"]
+            auth_token = st.secrets["AUTH_TOKEN"]
+            
+            if not db_url or not auth_token:
+                raise ValueError("Missing database credentials in Streamlit secrets")
+            
+            _shared_connection = TursoConnection(db_url, auth_token)
+            return _shared_connection
+            
+        except Exception as e:
+            logger.error(f"Failed to create database connection: {e}")
+            raise
 
 
 def test_connection() -> bool: